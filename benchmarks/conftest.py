@@ -0,0 +1,10 @@
+import pytest
+from pytest_benchmark.utils import get_tag
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # Store the results of every run as JSON in .benchmarks/, to track them over time with
+    # pytest-benchmark compare or --benchmark-compare. --benchmark-json still writes its own file.
+    if not config.getoption("benchmark_disable") and not config.getoption("benchmark_save"):
+        config.option.benchmark_autosave = get_tag()
@@ -0,0 +1,92 @@
+"""Offline Balancer quoting benchmarks.
+
+Run with: pytest benchmarks
+"""
+from dataclasses import replace
+
+from roles_royce.constants import ETHAddr
+from roles_royce.protocols.balancer_math import ONE, PoolGraph, StablePool, WeightedPool, quote_single_asset_exits
+
+POOL_ID = "0x32296969ef14eb0c6d29669c550d4a0449130230000200000000000000000080"
+N_AMOUNTS = 1000
+
+
+def make_pool():
+    return StablePool(pool_id=POOL_ID, tokens=[ETHAddr.wstETH, ETHAddr.WETH],
+                      balances=[30_000 * ONE + 123456789, 34_000 * ONE + 987654321],
+                      scaling_factors=[1_130_000_000_000_000_000, ONE], amp=50_000,
+                      swap_fee=400_000_000_000_000, total_supply=68_000 * ONE)
+
+
+BPT_AMOUNTS = [ONE * (k + 1) for k in range(N_AMOUNTS)]
+
+
+def test_single_asset_exit_quotes(benchmark):
+    """One query per amount, as a loop of StablePool.query_single_asset_exit calls."""
+    benchmark.group = "quote 1k single asset exits"
+    pool = make_pool()
+
+    def quote():
+        return [pool.query_single_asset_exit(bpt, 1)[1][1] for bpt in BPT_AMOUNTS]
+
+    assert len(benchmark(quote)) == N_AMOUNTS
+
+
+def test_single_asset_exit_batch_quote(benchmark):
+    benchmark.group = "quote 1k single asset exits"
+
+    def quote():
+        # A new pool each round, to include the invariant and the marginal price
+        return quote_single_asset_exits(make_pool(), BPT_AMOUNTS, exit_token_index=1)
+
+    assert len(benchmark(quote)) == N_AMOUNTS
+
+
+N_POOLS = 400
+N_TOKENS = 60
+
+
+def make_pools(seed=0):
+    """N_POOLS pools over N_TOKENS tokens: weighted 50/50 and 80/20 pairs and 2 and 3 token stable pools."""
+    import random
+
+    rng = random.Random(seed)
+    tokens = [f"0x{k + 1:040x}" for k in range(N_TOKENS)]
+    pools = []
+    for k in range(N_POOLS):
+        pool_id = f"0x{k + 1:040x}{k:024x}"
+        state = dict(pool_id=pool_id, scaling_factors=[ONE] * 3, swap_fee=3 * 10 ** 15, total_supply=10 ** 6 * ONE)
+        if k % 4 == 3:
+            pool_tokens = rng.sample(tokens, 3 if k % 8 == 3 else 2)
+            pools.append(StablePool(tokens=pool_tokens, amp=100_000,
+                                    balances=[rng.randint(10 ** 5, 10 ** 6) * ONE for _ in pool_tokens],
+                                    **{**state, "scaling_factors": [ONE] * len(pool_tokens)}))
+        else:
+            weights = [5 * 10 ** 17] * 2 if k % 2 else [8 * 10 ** 17, 2 * 10 ** 17]
+            pools.append(WeightedPool(tokens=rng.sample(tokens, 2), normalized_weights=weights,
+                                      balances=[rng.randint(10 ** 5, 10 ** 6) * ONE for _ in range(2)],
+                                      **{**state, "scaling_factors": [ONE] * 2}))
+    return tokens, pools
+
+
+def test_route_search(benchmark):
+    """3 hops route search in a graph of 400 pools built once, as done for every search of a block."""
+    benchmark.group = "route search in 400 pools"
+    tokens, pools = make_pools()
+    graph = PoolGraph(pools)
+
+    route = benchmark(graph.find_route, tokens[0], tokens[1], 1000 * ONE, max_hops=3)
+    assert route is not None and route.amount_out > 0
+
+
+def test_route_search_of_a_new_block(benchmark):
+    """The same search including building the graph from new pool states (their stable invariants)."""
+    benchmark.group = "route search in 400 pools"
+    tokens, pools = make_pools()
+
+    def search():
+        # The dataclasses.replace copies do not have the cached properties of the previous block
+        graph = PoolGraph([replace(pool) for pool in pools])
+        return graph.find_route(tokens[0], tokens[1], 1000 * ONE, max_hops=3)
+
+    assert benchmark(search) is not None
@@ -0,0 +1,32 @@
+"""Decoding benchmarks.
+
+Run with: pytest benchmarks
+"""
+from roles_royce.constants import ETHAddr
+from roles_royce.protocols.decoder import get_decoder
+from roles_royce.protocols.eth import aave_v2, balancer
+
+AVATAR = "0x0EFcCBb9E2C09Ea29551879bd9Da32362b32fc89"
+POOL_ID = "0x32296969ef14eb0c6d29669c550d4a0449130230000200000000000000000080"
+N_CALLS = 10_000
+
+
+def test_decode_block_of_calls(benchmark):
+    """Decode calldata of a mix of methods, as when scanning the transactions of many blocks."""
+    benchmark.group = "decode 10k calls"
+    methods = [
+        aave_v2.DepositToken(asset=ETHAddr.DAI, amount=1, avatar=AVATAR),
+        aave_v2.ApproveForAaveLendingPoolV2(token=ETHAddr.DAI, amount=1),
+        balancer.SingleAssetExit(pool_id=POOL_ID, avatar=AVATAR, assets=[ETHAddr.wstETH, ETHAddr.WETH],
+                                 min_amounts_out=[0, 0], bpt_amount_in=10 ** 18, exit_token_index=0),
+        aave_v2.ApproveForStkAAVE(amount=1),
+    ]
+    calls = [(m.target_address, m.data_bytes) for m in methods] * (N_CALLS // len(methods))
+    calls += [(ETHAddr.USDC, bytes(68))] * (N_CALLS - len(calls))  # unknown selector
+    decoder = get_decoder()
+
+    def decode():
+        return [decoder.decode(data, to=to) for to, data in calls]
+
+    result = benchmark.pedantic(decode, rounds=3)
+    assert len(result) == N_CALLS
@@ -0,0 +1,78 @@
+"""Encoding benchmarks.
+
+Run with: pytest benchmarks
+"""
+import json
+
+import pytest
+
+from roles_royce.constants import ETHAddr
+from roles_royce.generic_method import GenericMethodTransaction
+from roles_royce.protocols.eth import aave_v2, aura, balancer, compound_v3, lido, makerdao
+from roles_royce.utils import to_data_input
+
+AVATAR = "0x0EFcCBb9E2C09Ea29551879bd9Da32362b32fc89"
+POOL_ID = "0x32296969ef14eb0c6d29669c550d4a0449130230000200000000000000000080"
+WSTETH_JOIN = "0x10CD5fbe1b404B7E19Ef964B63939907bdaf42E2"
+ERC20_APPROVE_ABI = json.dumps([{"name": "approve", "type": "function", "stateMutability": "nonpayable",
+                                 "inputs": [{"name": "spender", "type": "address"}, {"name": "amount", "type": "uint256"}],
+                                 "outputs": [{"name": "", "type": "bool"}]}])
+N_CALLS = 10_000
+
+
+def test_deposit_data_per_instance(benchmark):
+    benchmark.group = "encode 10k aave_v2.DepositToken"
+
+    def encode():
+        return [aave_v2.DepositToken(asset=ETHAddr.DAI, amount=i, avatar=AVATAR).data for i in range(N_CALLS)]
+
+    result = benchmark.pedantic(encode, rounds=3)
+    assert len(result) == N_CALLS
+
+
+def test_deposit_encode_many(benchmark):
+    benchmark.group = "encode 10k aave_v2.DepositToken"
+
+    def encode():
+        return aave_v2.DepositToken.encode_many([{"asset": ETHAddr.DAI, "amount": i} for i in range(N_CALLS)],
+                                                avatar=AVATAR)
+
+    result = benchmark.pedantic(encode, rounds=3)
+    assert len(result) == N_CALLS
+
+
+# One method per protocol module, built from scratch in each round as the callers do
+PROTOCOL_METHODS = {
+    "aave_v2": lambda: aave_v2.DepositToken(asset=ETHAddr.DAI, amount=10 ** 18, avatar=AVATAR),
+    "aura": lambda: aura.DepositBPT(pool_id=1, amount=10 ** 18),
+    "balancer": lambda: balancer.SingleAssetExit(pool_id=POOL_ID, avatar=AVATAR, assets=[ETHAddr.wstETH, ETHAddr.WETH],
+                                                 min_amounts_out=[0, 0], bpt_amount_in=10 ** 18, exit_token_index=0),
+    "compound_v3": lambda: compound_v3.Supply(comet=compound_v3.Comet.cUSDCv3, token=ETHAddr.USDC, amount=10 ** 6),
+    "lido": lambda: lido.RequestWithdrawalsStETH(amounts=[10 ** 18, 2 * 10 ** 18], avatar=AVATAR),
+    "makerdao": lambda: makerdao.DepositCollateral(adapter=WSTETH_JOIN, cdp_vault=1, amount=10 ** 18),
+}
+
+
+@pytest.mark.parametrize("module", PROTOCOL_METHODS)
+def test_method_data(benchmark, module):
+    benchmark.group = "Method.data"
+    make_method = PROTOCOL_METHODS[module]
+    make_method().data  # compile the encoder outside the measure
+
+    benchmark(lambda: make_method().data)
+
+
+def test_generic_method_transaction(benchmark):
+    benchmark.group = "GenericMethodTransaction"
+
+    def build():
+        return GenericMethodTransaction(function_name="approve", function_args=[ETHAddr.AAVE_V2_LendingPool, 10 ** 18],
+                                        contract_abi=ERC20_APPROVE_ABI, contract_address=ETHAddr.DAI)
+
+    assert build().data.startswith("0x095ea7b3")
+    benchmark(build)
+
+
+def test_to_data_input(benchmark):
+    benchmark.group = "utils.to_data_input"
+    benchmark(to_data_input, "approve", "(address,uint256)", [ETHAddr.AAVE_V2_LendingPool, 10 ** 18])
@@ -0,0 +1,32 @@
+"""Import time of the modules, measured by removing them from sys.modules and importing them again."""
+import importlib
+import sys
+
+
+def fresh_import(module_name: str):
+    sys.modules.pop(module_name, None)
+    return importlib.import_module(module_name)
+
+
+def test_import_evm_utils(benchmark):
+    benchmark.group = "import"
+    benchmark(fresh_import, "roles_royce.evm_utils")
+
+
+def test_import_evm_utils_and_load_abi(benchmark):
+    benchmark.group = "import"
+
+    def import_and_load():
+        return fresh_import("roles_royce.evm_utils").load_abi("erc20_abi")
+
+    benchmark(import_and_load)
+
+
+def test_import_protocol_module_cold(benchmark):
+    """A new interpreter importing a protocol module, as a short lived encoding worker does."""
+    from tests.test_import_time import import_time
+
+    benchmark.group = "import"
+    seconds, modules = benchmark.pedantic(import_time, args=("roles_royce.protocols.eth.aave_v2",), rounds=5)
+    benchmark.extra_info["importtime_seconds"] = seconds
+    benchmark.extra_info["modules"] = len(modules)
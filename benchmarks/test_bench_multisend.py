@@ -0,0 +1,35 @@
+import pytest
+from gnosis.safe.multi_send import MultiSendOperation, MultiSendTx
+
+from roles_royce.constants import Chain, ETHAddr
+from roles_royce.generic_method import TxData
+from roles_royce.protocols.eth import aave_v2
+from roles_royce.utils import MULTISENDS, MultiSendOffline, multi_or_one, pack_multisend
+
+AVATAR = "0x0EFcCBb9E2C09Ea29551879bd9Da32362b32fc89"
+METHODS = [aave_v2.DepositToken(asset=ETHAddr.DAI, amount=i, avatar=AVATAR) for i in range(250)]
+
+
+def test_multisend_gnosis(benchmark):
+    benchmark.group = "multisend 250 txs"
+    multisend = MultiSendOffline(address=MULTISENDS[Chain.ETHEREUM], chain_id=Chain.ETHEREUM.chain_id)
+    txs = [(m.contract_address, m.value, m.data) for m in METHODS]
+
+    def pack():
+        return multisend.build_tx_data([MultiSendTx(MultiSendOperation.CALL, *tx) for tx in txs])
+
+    benchmark(pack)
+
+
+def test_multisend_pack(benchmark):
+    benchmark.group = "multisend 250 txs"
+    txs = [TxData(contract_address=m.contract_address, value=m.value, data=m.data_bytes) for m in METHODS]
+    benchmark(pack_multisend, txs)
+
+
+@pytest.mark.parametrize("n_txs", [1, 10, 100, 1000])
+def test_multi_or_one(benchmark, n_txs):
+    benchmark.group = "multi_or_one"
+    txs = [TxData(contract_address=m.contract_address, value=m.value, data=m.data)
+           for m in (aave_v2.DepositToken(asset=ETHAddr.DAI, amount=i, avatar=AVATAR) for i in range(n_txs))]
+    benchmark(multi_or_one, txs, Chain.ETHEREUM)
@@ -0,0 +1,50 @@
+"""RolesMod.execute against a local stub JSON-RPC node.
+
+The time includes the HTTP round-trips to the stub, the number of round-trips of one execute
+is stored in the extra_info of the results.
+"""
+import pytest
+from web3 import Web3
+
+from roles_royce.roles_modifier import RolesMod
+from tests.utils import FakeRPCNode
+
+ROLES_MOD_ADDRESS = "0x1cFB0CD7B1111bf2054615C7C491a15C4A3303cc"
+USDT = "0x4ECaBa5870353805a9F068101A40E0f32ed605C6"
+PRIVATE_KEY = "0xa60429f7d6b751ca19d52302826b4a611893fbb138f0059f354b79846f2ab125"
+USDT_APPROVE = ("0x095ea7b30000000000000000000000007f90122bf0700f9e7e1f688fe926940e8839f353"
+                "00000000000000000000000000000000000000000000000000000000000003e8")
+RESULTS = {
+    "eth_call": "0x" + "00" * 31 + "01",
+    "eth_feeHistory": {"oldestBlock": hex(100), "baseFeePerGas": [hex(90), hex(100), hex(105)],
+                       "gasUsedRatio": [0.4, 0.7], "reward": [[hex(8)], [hex(12)]]},
+    "eth_estimateGas": hex(100_000),
+    "eth_chainId": hex(0x64),
+    "eth_getTransactionCount": hex(42),
+    "eth_sendRawTransaction": "0x" + "ab" * 32,
+}
+
+
+@pytest.fixture
+def node():
+    node = FakeRPCNode(RESULTS)
+    yield node
+    node.stop()
+
+
+@pytest.mark.parametrize("batch_preflight", [False, True])
+def test_execute(benchmark, node, batch_preflight):
+    benchmark.group = "RolesMod.execute"
+    roles = RolesMod(role=1, contract_address=ROLES_MOD_ADDRESS, web3=Web3(Web3.HTTPProvider(node.url)),
+                     private_key=PRIVATE_KEY, batch_preflight=batch_preflight)
+
+    def execute():
+        roles.fee_oracle.invalidate()  # every execute pays the fee request, as with a new block
+        return roles.execute(contract_address=USDT, data=USDT_APPROVE)
+
+    execute()
+    node.posts.clear()
+    execute()
+    benchmark.extra_info["round_trips"] = len(node.posts)
+    benchmark.extra_info["requests"] = sum(len(post) for post in node.posts)
+    benchmark(execute)
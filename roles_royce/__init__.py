@@ -1,11 +1,34 @@
+import importlib
 import logging
-from .operations import send, check
-from .generic_method import GenericMethodTransaction
-from .roles_modifier import Operation
-from .constants import Chain
+
+from .constants import Chain, Operation
+
+# The names below are imported on first access: their modules import web3, eth_account and
+# safe-eth-py, that take a couple of seconds to import and are not needed to build calldata
+# with roles_royce.protocols.
+_LAZY_ATTRIBUTES = {
+    "send": ".operations",
+    "check": ".operations",
+    "send_async": ".operations",
+    "check_async": ".operations",
+    "GenericMethodTransaction": ".generic_method",
+}
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 def add_stderr_logger(level: int = logging.DEBUG) -> logging.StreamHandler:
     """
     Helper for quickly adding a StreamHandler to the logger. Useful for
@@ -0,0 +1,167 @@
+import asyncio
+from dataclasses import dataclass, field
+import logging
+import time
+
+from web3 import AsyncWeb3, exceptions
+
+from .nonces import AsyncNonceManager, is_nonce_too_low
+from .roles_modifier import RolesMod, TransactionWouldBeReverted
+
+logger = logging.getLogger(__name__)
+
+
+_default_nonce_manager = AsyncNonceManager()
+
+
+@dataclass
+class AsyncRolesMod(RolesMod):
+    """RolesMod counterpart for an AsyncWeb3 instance, its public methods are coroutines.
+
+    The pre-flight requests of ``execute`` are made concurrently and, when no explicit nonce is given,
+    the nonces come from an AsyncNonceManager shared by all the instances so concurrent executions from
+    the same account can be submitted without waiting for each other.
+
+    ``permissions``, ``confirm_check`` and ``gas_model`` work as in RolesMod. ``batch_preflight`` and
+    ``fee_oracle`` are sync only and raise ValueError when set, as does a sync NonceManager.
+    """
+
+    web3: AsyncWeb3
+    nonce_manager: AsyncNonceManager = field(default_factory=lambda: _default_nonce_manager)
+    receipt_poll_interval: float = 1.0
+
+    def __post_init__(self):
+        if self.batch_preflight:
+            raise ValueError("batch_preflight is not supported by AsyncRolesMod, its pre-flight requests are "
+                             "already concurrent")
+        if self.fee_oracle is not None:
+            raise ValueError("fee_oracle is not supported by AsyncRolesMod")
+        if not isinstance(self.nonce_manager, AsyncNonceManager):
+            raise ValueError("The nonce_manager of AsyncRolesMod must be an AsyncNonceManager")
+        super().__post_init__()
+
+    def _default_fee_oracle(self) -> None:
+        return None
+
+    async def get_base_fee_per_gas(self) -> int:
+        # The base fee of the latest block, without fetching the block
+        fee_history = await self.web3.eth.fee_history(1, "latest", [])
+        return fee_history["baseFeePerGas"][0]
+
+    async def check(self, contract_address: str, data: str | bytes, block='latest') -> bool:
+        """make a static call to validate a transaction.
+
+        With the permissions of the roles loaded the check is done in memory, see RolesMod.check."""
+        allowed = self._check_permissions(contract_address, data)
+        if allowed is not None:
+            return allowed
+        try:
+            await self._build_exec_transaction(contract_address, data).call({"from": self.account},
+                                                                            block_identifier=block)
+            return True
+        except exceptions.ContractLogicError:
+            return False
+
+    async def estimate_gas(self, contract_address: str, data: str | bytes, block='latest') -> int:
+        gas = await self._build_exec_transaction(contract_address, data).estimate_gas({"from": self.account},
+                                                                                     block_identifier=block)
+        if self.gas_model is not None:
+            self.gas_model.observe_calldata(contract_address, data, self.operation, gas)
+        return gas
+
+    async def _max_priority_fee(self) -> int:
+        return await self.web3.eth.max_priority_fee
+
+    async def _chain_id(self) -> int:
+        if self._cached_chain_id is None:
+            self._cached_chain_id = await self.web3.eth.chain_id
+        return self._cached_chain_id
+
+    async def _nothing(self):
+        return None
+
+    async def execute(self,
+                      contract_address: str,
+                      data: str | bytes,
+                      max_priority_fee: int = None,
+                      max_fee_per_gas: int = None,
+                      check: bool = True,
+                      fee_multiplier: float = 1.2,
+                      gas_limit_multiplier: float = 1.4
+                      ) -> str:
+        """Execute a role-based transaction. Returns the transaction hash as a str."""
+        checked, priority_fee, base_fee, gas, chain_id = await asyncio.gather(
+            self.check(contract_address, data) if check else self._nothing(),
+            self._max_priority_fee() if not max_priority_fee else self._nothing(),
+            self.get_base_fee_per_gas() if not max_fee_per_gas else self._nothing(),
+            self.estimate_gas(contract_address, data),
+            self._chain_id(),
+            return_exceptions=True,
+        )
+        if check and checked is not True:
+            if isinstance(checked, Exception):
+                raise checked
+            raise TransactionWouldBeReverted()
+        for result in (priority_fee, base_fee, gas, chain_id):
+            if isinstance(result, Exception):
+                raise result
+
+        max_priority_fee = max_priority_fee or priority_fee
+        if not max_fee_per_gas:
+            max_fee_per_gas = max_priority_fee + int(base_fee * fee_multiplier)
+        gas_limit = int(gas * gas_limit_multiplier)
+
+        if not self.nonce:
+            return await self._send_with_managed_nonce(contract_address, data, gas_limit, max_priority_fee,
+                                                       max_fee_per_gas, chain_id)
+        tx = await self._build_transaction(contract_address, data, gas_limit, max_priority_fee, max_fee_per_gas,
+                                           self.nonce, chain_id)
+        logger.debug(f"Executing tx: {tx}")
+        executed_txn = await self._send_raw_transaction(self._sign_transaction(tx).rawTransaction)
+        return executed_txn.hex()
+
+    async def _send_with_managed_nonce(self, contract_address, data, gas_limit, max_priority_fee, max_fee_per_gas,
+                                       chain_id) -> str:
+        """Send the transaction with a nonce from the nonce manager, retrying once on 'nonce too low'."""
+        for attempt in range(2):
+            nonce = await self.nonce_manager.reserve(self.web3, chain_id, self.account)
+            try:
+                tx = await self._build_transaction(contract_address, data, gas_limit, max_priority_fee,
+                                                   max_fee_per_gas, nonce, chain_id)
+                logger.debug(f"Executing tx: {tx}")
+                executed_txn = await self._send_raw_transaction(self._sign_transaction(tx).rawTransaction)
+            except Exception as e:
+                self.nonce_manager.release(chain_id, self.account, nonce)
+                if attempt == 0 and is_nonce_too_low(e):
+                    logger.info(f"Nonce {nonce} too low for {self.account}, resyncing with the node")
+                    await self.nonce_manager.resync(self.web3, chain_id, self.account)
+                    continue
+                raise
+            self.nonce_manager.mark_sent(chain_id, self.account, nonce, executed_txn.hex())
+            return executed_txn.hex()
+
+    async def _build_transaction(self, contract_address, data, gas_limit, max_priority_fee, max_gas, nonce,
+                                 chain_id):
+        return await self._build_exec_transaction(contract_address, data).build_transaction(
+            {
+                "chainId": chain_id,
+                "gas": gas_limit,
+                "maxFeePerGas": max_gas,
+                "maxPriorityFeePerGas": max_priority_fee,
+                "nonce": nonce,
+            }
+        )
+
+    async def _send_raw_transaction(self, raw_transaction):
+        return await self.web3.eth.send_raw_transaction(raw_transaction)
+
+    async def get_tx_receipt(self, tx_hash: str, timeout: float = 120):
+        """Poll for the receipt without blocking the event loop."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return await self.web3.eth.get_transaction_receipt(tx_hash)
+            except exceptions.TransactionNotFound:
+                if time.monotonic() >= deadline:
+                    raise exceptions.TimeExhausted(f"Transaction {tx_hash} is not in the chain after {timeout} seconds")
+                await asyncio.sleep(self.receipt_poll_interval)
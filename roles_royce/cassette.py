@@ -0,0 +1,116 @@
+"""A web3 provider that records the JSON-RPC traffic in a cassette file and replays it offline.
+
+In ``record`` mode the requests go to the wrapped provider and their responses are stored; in
+``replay`` mode they are answered from the cassette without any network; ``auto`` replays what is
+in the cassette and records the rest. The responses are keyed by method and params, and the
+params of state reads include their block (number or tag). A request made several times (e.g. an
+``eth_getBalance`` at ``latest`` before and after a transaction) replays its responses in the
+recorded order; in replay mode the last one is repeated, in auto mode the extra ones are recorded.
+
+Example::
+
+    provider = CassetteProvider("tests/cassettes/lido.json.gz", HTTPProvider(url), mode="auto")
+    w3 = Web3(provider)
+    ...
+    provider.save()
+
+Cassettes ending in ``.gz`` are gzip compressed.
+"""
+import gzip
+import itertools
+import json
+import os
+import threading
+from typing import Any, Optional
+
+from web3._utils.encoding import Web3JsonEncoder
+from web3.providers.base import BaseProvider
+
+RECORD, REPLAY, AUTO = "record", "replay", "auto"
+
+
+class CassetteMiss(Exception):
+    """The request is not in the cassette and the provider can not record it."""
+
+
+def _params_key(params: Any) -> str:
+    return json.dumps(params, cls=Web3JsonEncoder, sort_keys=True, separators=(",", ":"))
+
+
+class CassetteProvider(BaseProvider):
+    def __init__(self, path: str, provider: Optional[BaseProvider] = None, mode: str = AUTO):
+        """
+        :param path: the cassette file, it is read if it exists
+        :param provider: the provider the requests are recorded from, not needed to replay
+        :param mode: ``record``, ``replay`` or ``auto``
+        """
+        if mode not in (RECORD, REPLAY, AUTO):
+            raise ValueError(f"Unknown cassette mode {mode!r}")
+        if mode != REPLAY and provider is None:
+            raise ValueError(f"A provider is needed to record in {mode!r} mode")
+        self.path = path
+        self.provider = provider
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._replayed: dict[tuple[str, str], int] = {}
+        # method -> params key -> the responses ({"result": ...} or {"error": ...}) in order
+        self.interactions: dict[str, dict[str, list[dict]]] = {}
+        self._recorded: dict[str, dict[str, list[dict]]] = {}
+        if mode != RECORD and os.path.exists(path):
+            self.interactions = self.load(path)
+
+    @staticmethod
+    def load(path: str) -> dict:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt") as f:
+            return json.load(f)["interactions"]
+
+    @property
+    def recorded(self) -> bool:
+        """Whether responses were recorded since the cassette was read, i.e. it has to be saved."""
+        with self._lock:
+            return bool(self._recorded)
+
+    def save(self):
+        """Write the cassette, with the responses recorded now after those it already had."""
+        with self._lock:
+            interactions = {method: dict(by_params) for method, by_params in self.interactions.items()}
+            for method, by_params in self._recorded.items():
+                for key, responses in by_params.items():
+                    interactions.setdefault(method, {})[key] = interactions.get(method, {}).get(key, []) + responses
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        opener = gzip.open if self.path.endswith(".gz") else open
+        with opener(self.path, "wt") as f:
+            json.dump({"version": 1, "interactions": interactions}, f, separators=(",", ":"), sort_keys=True)
+
+    def make_request(self, method, params):
+        key = _params_key(params)
+        if self.mode != RECORD:
+            response = self._replay(method, key)
+            if response is not None:
+                return {"jsonrpc": "2.0", "id": next(self._ids), **response}
+            if self.mode == REPLAY:
+                raise CassetteMiss(f"{method} {key} is not in the cassette {self.path}")
+
+        response = self.provider.make_request(method, params)
+        stored = {"error": response["error"]} if "error" in response else {"result": response.get("result")}
+        with self._lock:
+            self._recorded.setdefault(method, {}).setdefault(key, []).append(stored)
+        return response
+
+    def _replay(self, method: str, key: str) -> Optional[dict]:
+        responses = self.interactions.get(method, {}).get(key)
+        if not responses:
+            return None
+        with self._lock:
+            count = self._replayed.get((method, key), 0)
+            self._replayed[(method, key)] = count + 1
+        if count >= len(responses) and self.mode == AUTO:
+            return None  # recorded less times than requested now, record the new ones
+        return responses[min(count, len(responses) - 1)]
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        if self.mode == REPLAY:
+            return True
+        return self.provider.is_connected(show_traceback)
@@ -0,0 +1,128 @@
+"""Split big batches of transactions in several multisends using a gas cost model."""
+import logging
+from typing import List
+
+from .constants import Blockchain
+from .generic_method import TxData
+from .roles_modifier import Operation
+from .utils import MULTISEND_SELECTOR, _tx_data_bytes, multi_or_one, unpack_multisend
+
+logger = logging.getLogger(__name__)
+
+# Size of the multiSend(bytes) calldata besides the packed records: selector, offset and length
+MULTISEND_HEAD_SIZE = 4 + 32 + 32
+# Size of the operation|to|value|data length header of each packed record
+MULTISEND_RECORD_HEAD_SIZE = 1 + 20 + 32 + 32
+
+DEFAULT_MAX_GAS = 15_000_000
+# Most nodes do not relay transactions bigger than 128 KB, leave room for the Roles and tx envelope
+DEFAULT_MAX_CALLDATA_SIZE = 120_000
+
+
+def calldata_gas(data: bytes) -> int:
+    """Intrinsic gas paid for the calldata (4 per zero byte, 16 per non zero byte)."""
+    zeros = data.count(0)
+    return 4 * zeros + 16 * (len(data) - zeros)
+
+
+class GasCostModel:
+    """Per selector gas cost model.
+
+    The execution gas of each function selector is learned from the gas estimations of past
+    transactions (see observe), using an exponential moving average. Unknown selectors are
+    assumed to cost default_cost.
+
+    Args:
+        base_cost: gas of an execTransactionWithRole call besides the calls themselves.
+        default_cost: execution gas assumed for a selector never observed.
+        smoothing: weight of a new observation in the moving average.
+    """
+
+    def __init__(self, base_cost: int = 60_000, default_cost: int = 250_000, smoothing: float = 0.3):
+        self.base_cost = base_cost
+        self.default_cost = default_cost
+        self.smoothing = smoothing
+        self.costs: dict[bytes, int] = {}
+
+    @staticmethod
+    def selector_of(data: bytes) -> bytes:
+        return bytes(data[:4])
+
+    def cost_of(self, data: bytes) -> int:
+        """Estimated gas of one call with the data, including its calldata gas."""
+        return self.costs.get(self.selector_of(data), self.default_cost) + calldata_gas(data)
+
+    def estimate(self, txs: List[TxData]) -> int:
+        """Estimated gas to execute the txs in one transaction."""
+        return self.base_cost + sum(self.cost_of(_tx_data_bytes(tx)) for tx in txs)
+
+    def observe(self, txs: List[TxData], gas: int):
+        """Update the costs with the gas estimated (or used) to execute the txs in one transaction.
+
+        The gas not explained by the base cost and the calldata is split between the calls
+        proportionally to their current estimated costs.
+        """
+        datas = [_tx_data_bytes(tx) for tx in txs]
+        if not datas:
+            return
+        execution_gas = gas - self.base_cost - sum(calldata_gas(data) for data in datas)
+        selectors = [self.selector_of(data) for data in datas]
+        current = [self.costs.get(selector, self.default_cost) for selector in selectors]
+        total = sum(current)
+        # Calls to the same selector share the cost, so each selector is updated once
+        observed = {selector: max(int(execution_gas * cost / total), 0) if total else 0
+                    for selector, cost in zip(selectors, current)}
+        for selector, gas_observed in observed.items():
+            if selector in self.costs:
+                cost = self.costs[selector]
+                self.costs[selector] = int(cost + self.smoothing * (gas_observed - cost))
+            else:
+                self.costs[selector] = gas_observed
+
+    def observe_calldata(self, contract_address: str, data: str | bytes, operation: Operation, gas: int):
+        """Same as observe for the calldata sent to the Roles modifier, unpacking multisends."""
+        data = _tx_data_bytes(TxData(contract_address=contract_address, data=data))
+        if operation == Operation.DELEGATE_CALL and data[:4] == MULTISEND_SELECTOR:
+            txs = unpack_multisend(data)
+        else:
+            txs = [TxData(contract_address=contract_address, data=data, operation=operation)]
+        self.observe(txs, gas)
+
+
+def plan_chunks(txs: List[TxData],
+                gas_model: GasCostModel,
+                max_gas: int = DEFAULT_MAX_GAS,
+                max_calldata_size: int = DEFAULT_MAX_CALLDATA_SIZE,
+                gas_margin: float = 1.4) -> List[List[TxData]]:
+    """Split the txs, keeping their order, in the minimum number of consecutive chunks such that
+    each chunk fits in max_gas (estimated gas times gas_margin) and in max_calldata_size bytes."""
+    chunks = []
+    chunk, chunk_gas, chunk_size = [], gas_model.base_cost, MULTISEND_HEAD_SIZE
+    for tx in txs:
+        data = _tx_data_bytes(tx)
+        tx_gas = gas_model.cost_of(data)
+        tx_size = MULTISEND_RECORD_HEAD_SIZE + len(data)
+        if chunk and ((chunk_gas + tx_gas) * gas_margin > max_gas or chunk_size + tx_size > max_calldata_size):
+            chunks.append(chunk)
+            chunk, chunk_gas, chunk_size = [], gas_model.base_cost, MULTISEND_HEAD_SIZE
+        if (gas_model.base_cost + tx_gas) * gas_margin > max_gas:
+            logger.warning(f"Transaction to {tx.contract_address} alone may exceed the gas limit of {max_gas}")
+        chunk.append(tx)
+        chunk_gas += tx_gas
+        chunk_size += tx_size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def multi_or_many(txs: List[TxData],
+                  blockchain: Blockchain,
+                  gas_model: GasCostModel,
+                  max_gas: int = DEFAULT_MAX_GAS,
+                  max_calldata_size: int = DEFAULT_MAX_CALLDATA_SIZE,
+                  as_bytes: bool = False) -> List[TxData]:
+    """Like multi_or_one but returns as many transactions as needed to respect the gas and size budgets."""
+    if not txs:
+        raise ValueError("No transactions found")
+    chunks = plan_chunks(txs, gas_model, max_gas=max_gas, max_calldata_size=max_calldata_size)
+    return [multi_or_one(chunk, blockchain, as_bytes=as_bytes) for chunk in chunks]
@@ -1,7 +1,15 @@
 from dataclasses import dataclass
+from enum import IntEnum
+
+
+class Operation(IntEnum):
+    CALL = 0
+    DELEGATE_CALL = 1
+
 
 class CrossChainAddr:
     BalancerVault = "0xBA12222222228d8Ba445958a75a0704d566BF2C8"
+    BalancerProtocolFeesCollector = "0xce88686553686DA562CE7Cea497CE749DA109f9F"
 
 class ETHAddr:
     ZERO = "0x0000000000000000000000000000000000000000"
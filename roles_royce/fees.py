@@ -0,0 +1,138 @@
+"""EIP-1559 fee estimation with a small per-block cache.
+
+A single ``eth_feeHistory`` request gives the base fee of the latest blocks, the priority fees paid
+in them and the base fee of the next block, that is all ``RolesMod.execute`` needs. The result is
+cached with the block it was computed at, so sending many transactions within a block costs no
+extra requests: it is served until a newer block is reported with ``FeeOracle.new_block`` (e.g. by
+a ReceiptTracker given the oracle) or, when no block is reported, for ``max_age`` seconds.
+
+Example::
+
+    from roles_royce.fees import FeeOracle
+
+    fees = FeeOracle.for_web3(w3).fees()
+    max_fee_per_gas = fees.priority_fee + 2 * fees.next_base_fee
+"""
+import statistics
+import time
+import weakref
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Optional
+
+from web3 import Web3
+
+from .rpc import RPCCall, to_int
+
+BASE_FEE_MAX_CHANGE_DENOMINATOR = 8
+ELASTICITY_MULTIPLIER = 2
+FALLBACK_PRIORITY_FEE = 1_000_000_000  # 1 gwei, when the blocks in the history paid no priority fees
+
+
+def predict_base_fee(base_fee: int, gas_used: int, gas_limit: int) -> int:
+    """Base fee of the next block following the EIP-1559 update rule, with the integer math of the clients."""
+    gas_target = gas_limit // ELASTICITY_MULTIPLIER
+    if gas_used == gas_target:
+        return base_fee
+    if gas_used > gas_target:
+        return base_fee + max(1, base_fee * (gas_used - gas_target) // gas_target // BASE_FEE_MAX_CHANGE_DENOMINATOR)
+    return base_fee - base_fee * (gas_target - gas_used) // gas_target // BASE_FEE_MAX_CHANGE_DENOMINATOR
+
+
+def _gas_used_and_limit(gas_used_ratio: float) -> tuple[int, int]:
+    """The gas used and limit of a block from its eth_feeHistory gasUsedRatio.
+
+    The ratio is gas_used / gas_limit as a float, the fraction with the smallest denominator close
+    to it gives the pair back, scaled so that the gas target is an exact integer.
+    """
+    ratio = Fraction(gas_used_ratio).limit_denominator(2 ** 32)
+    return ratio.numerator * ELASTICITY_MULTIPLIER, ratio.denominator * ELASTICITY_MULTIPLIER
+
+
+@dataclass(frozen=True)
+class Fees:
+    block_number: int
+    base_fee: int  # base fee of block_number
+    next_base_fee: int  # base fee the next block will have
+    priority_fee: int  # the reward percentile of the recent blocks
+
+
+class FeeOracle:
+    """Caches the fees of the latest block.
+
+    The fees are served from the cache without any request while they are for the chain head
+    reported with ``new_block``, or younger than ``max_age`` seconds if no head has been reported.
+    A caller that knows the chain head keeps the cache exact, the others get fees at most max_age
+    old. The fees at a given block number are only served for that block.
+    """
+
+    _instances: "weakref.WeakKeyDictionary[Web3, FeeOracle]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, web3: Web3, history_blocks: int = 10, reward_percentile: float = 50.0, max_age: float = 3.0):
+        self.web3 = web3
+        self.history_blocks = history_blocks
+        self.reward_percentile = reward_percentile
+        self.max_age = max_age
+        self._fees: Optional[Fees] = None
+        self._fetched_at = 0.0
+        self._head: Optional[int] = None  # the latest block reported with new_block
+
+    @classmethod
+    def for_web3(cls, web3: Web3) -> "FeeOracle":
+        """The oracle shared by everyone using this web3 instance."""
+        if web3 not in cls._instances:
+            cls._instances[web3] = cls(web3)
+        return cls._instances[web3]
+
+    def fee_history_request(self) -> RPCCall:
+        return "eth_feeHistory", [hex(self.history_blocks), "latest", [self.reward_percentile]]
+
+    def cached(self, block_number: Optional[int] = None) -> Optional[Fees]:
+        """The cached fees if they are still valid, without making any request.
+
+        With block_number they are only valid if they were computed at that block.
+        """
+        fees = self._fees
+        if fees is None:
+            return None
+        if block_number is not None:
+            return fees if fees.block_number == block_number else None
+        if self._head is not None:
+            return fees if fees.block_number >= self._head else None
+        return fees if time.monotonic() - self._fetched_at < self.max_age else None
+
+    def fees(self, block_number: Optional[int] = None) -> Fees:
+        """The fees at block_number, the latest block if not given."""
+        fees = self.cached(block_number)
+        if fees is None:
+            block_identifier = "latest" if block_number is None else block_number
+            fees = self.update(self.web3.eth.fee_history(self.history_blocks, block_identifier,
+                                                         [self.reward_percentile]))
+        return fees
+
+    def update(self, fee_history: dict) -> Fees:
+        """Compute and cache the fees from an eth_feeHistory result (raw or formatted by web3)."""
+        base_fees = [to_int(fee) for fee in fee_history["baseFeePerGas"]]
+        block_number = to_int(fee_history["oldestBlock"]) + len(fee_history["gasUsedRatio"]) - 1
+        base_fee = base_fees[len(fee_history["gasUsedRatio"]) - 1]
+        if len(base_fees) > len(fee_history["gasUsedRatio"]):
+            next_base_fee = base_fees[-1]
+        else:
+            next_base_fee = predict_base_fee(base_fee, *_gas_used_and_limit(fee_history["gasUsedRatio"][-1]))
+        rewards = [to_int(reward[0]) for reward in fee_history.get("reward") or [] if reward and to_int(reward[0])]
+        priority_fee = int(statistics.median(rewards)) if rewards else FALLBACK_PRIORITY_FEE
+
+        self._fees = Fees(block_number=block_number, base_fee=base_fee, next_base_fee=next_base_fee,
+                          priority_fee=priority_fee)
+        self._fetched_at = time.monotonic()
+        return self._fees
+
+    def new_block(self, block_number: int):
+        """Report that the chain is at block_number, the cache is not used if it is older."""
+        if self._head is None or block_number > self._head:
+            self._head = block_number
+        if self._fees is not None and block_number > self._fees.block_number:
+            self.invalidate()
+
+    def invalidate(self):
+        self._fees = None
@@ -1,14 +1,30 @@
+import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 
+from eth_utils.abi import collapse_if_tuple
 from web3 import Web3
 from web3.types import HexStr
+from roles_royce.protocols.base import MethodEncoder
 from roles_royce.roles_modifier import Operation
 
 
+@lru_cache
+def _function_encoder(contract_abi: str, function_name: str, num_args: int) -> MethodEncoder:
+    """The encoder of the function of the ABI with that name and number of arguments."""
+    candidates = [entry for entry in json.loads(contract_abi)
+                  if entry.get("type", "function") == "function" and entry.get("name") == function_name
+                  and len(entry.get("inputs", [])) == num_args]
+    if len(candidates) != 1:
+        raise ValueError(f"Could not identify the function {function_name} with {num_args} arguments "
+                         f"in the contract ABI, {len(candidates)} candidates found")
+    return MethodEncoder(function_name, [collapse_if_tuple(i) for i in candidates[0]["inputs"]])
+
+
 @dataclass(kw_only=True)
 class TxData:
     contract_address: str
-    data: str
+    data: str | bytes  # hex str, or bytes when built with as_bytes=True
     operation: Operation = Operation.CALL
     value: int = 0
 
@@ -18,13 +34,19 @@ class GenericMethodTransaction(TxData):
     function_name: str
     function_args: list
     contract_abi: str
-    data: str = field(init=False)
+    as_bytes: bool = False
+    data: str | bytes = field(init=False)
 
     def __post_init__(self):
-        self.data = self._calc_data()
+        self.data = self._calc_data_bytes() if self.as_bytes else self._calc_data()
 
     def _calc_data(self) -> HexStr:
         """Create the data input for the contract function."""
         contract = Web3().eth.contract(address=None, abi=self.contract_abi)
         result = contract.encodeABI(fn_name=self.function_name, args=self.function_args)
         return result
+
+    def _calc_data_bytes(self) -> bytes:
+        """Create the data input for the contract function as bytes, without going through hex."""
+        return _function_encoder(self.contract_abi, self.function_name, len(self.function_args)).encode(
+            self.function_args)
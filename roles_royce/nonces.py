@@ -0,0 +1,188 @@
+"""Local nonce management for the accounts that send role transactions.
+
+The node is asked for the nonce only the first time an account is used (and when it has to be
+resynchronized), after that the nonces are handed out locally, so many transactions of the same
+account can be sent without waiting for the previous ones to be mined.
+
+Example::
+
+    from roles_royce.nonces import default_nonce_manager
+
+    roles = RolesMod(..., nonce_manager=default_nonce_manager)
+    tx_hashes = [roles.execute(contract_address, data) for data in calls]
+
+AsyncNonceManager is the same manager for AsyncWeb3, with the methods that ask the node as coroutines.
+"""
+import asyncio
+import threading
+
+from web3 import Web3
+
+from .rpc import batch_results, to_int
+
+
+def is_nonce_too_low(error: Exception) -> bool:
+    return "nonce too low" in str(error).lower()
+
+
+class _AccountNonces:
+    def __init__(self, next_nonce: int):
+        self.next = next_nonce
+        self.free = set()  # nonces handed out but never sent, reused before new ones
+        self.reserved = set()  # handed out, not sent yet
+        self.pending = {}  # nonce -> tx hash, sent and not known to be mined
+
+
+class NonceManager:
+    """Hands out nonces locally, keyed by (chain_id, account). It is thread safe.
+
+    The workflow for each transaction is ``reserve`` and then ``mark_sent`` or ``release``
+    depending on whether the transaction reached the node.
+    """
+
+    def __init__(self):
+        self._accounts: dict[tuple[int, str], _AccountNonces] = {}
+        self._lock = threading.RLock()
+
+    def _get(self, web3: Web3, chain_id: int, account: str) -> _AccountNonces:
+        key = (chain_id, account)
+        if key not in self._accounts:
+            self._accounts[key] = _AccountNonces(web3.eth.get_transaction_count(account, "pending"))
+        return self._accounts[key]
+
+    def reserve(self, web3: Web3, chain_id: int, account: str) -> int:
+        """Return the nonce to use for the next transaction of the account."""
+        with self._lock:
+            return self._take(self._get(web3, chain_id, account))
+
+    @staticmethod
+    def _take(nonces: _AccountNonces) -> int:
+        if nonces.free:
+            nonce = min(nonces.free)
+            nonces.free.remove(nonce)
+        else:
+            nonce = nonces.next
+            nonces.next += 1
+        nonces.reserved.add(nonce)
+        return nonce
+
+    def mark_sent(self, chain_id: int, account: str, nonce: int, tx_hash: str):
+        with self._lock:
+            nonces = self._accounts[(chain_id, account)]
+            nonces.reserved.discard(nonce)
+            nonces.pending[nonce] = tx_hash
+
+    def release(self, chain_id: int, account: str, nonce: int):
+        """Give back a reserved nonce whose transaction was not sent, it is the next one to be handed out."""
+        with self._lock:
+            nonces = self._accounts.get((chain_id, account))
+            if nonces is not None and nonce in nonces.reserved:
+                nonces.reserved.remove(nonce)
+                nonces.free.add(nonce)
+
+    def pending(self, chain_id: int, account: str) -> dict[int, str]:
+        """The transactions sent and not yet known to be mined, as a dict of nonce -> tx hash."""
+        with self._lock:
+            nonces = self._accounts.get((chain_id, account))
+            return dict(nonces.pending) if nonces else {}
+
+    def resync(self, web3: Web3, chain_id: int, account: str):
+        """Move forward to the node's pending nonce, to be used after a 'nonce too low' error.
+
+        The nonces below it have been used by transactions the manager did not send.
+        """
+        node_nonce = web3.eth.get_transaction_count(account, "pending")
+        with self._lock:
+            self._move_to(self._accounts.setdefault((chain_id, account), _AccountNonces(node_nonce)), node_nonce)
+
+    @staticmethod
+    def _move_to(nonces: _AccountNonces, node_nonce: int):
+        nonces.next = max(nonces.next, node_nonce)
+        nonces.free = {nonce for nonce in nonces.free if nonce >= node_nonce}
+
+    def find_gaps(self, web3: Web3, chain_id: int, account: str) -> list[int]:
+        """Return the nonces that block the pending transactions of the account.
+
+        These are the nonces after the last mined one that were handed out and never sent, plus the
+        node's pending nonce when the manager has gone past it (the transaction sent with it was
+        dropped by the node). They are queued to be handed out first, so the next transactions
+        fill the gaps. The pending transactions already mined are forgotten.
+        Call it when the pending transactions seem stuck.
+        """
+        mined_nonce, node_nonce = map(to_int, batch_results(web3, [
+            ("eth_getTransactionCount", [account, "latest"]),
+            ("eth_getTransactionCount", [account, "pending"]),
+        ]))
+        with self._lock:
+            return self._fill_gaps(self._get(web3, chain_id, account), mined_nonce, node_nonce)
+
+    @staticmethod
+    def _fill_gaps(nonces: _AccountNonces, mined_nonce: int, node_nonce: int) -> list[int]:
+        nonces.pending = {nonce: tx_hash for nonce, tx_hash in nonces.pending.items() if nonce >= mined_nonce}
+        nonces.free = {nonce for nonce in nonces.free if nonce >= mined_nonce}
+        if mined_nonce <= node_nonce < nonces.next and node_nonce not in nonces.reserved:
+            nonces.pending.pop(node_nonce, None)
+        gaps = [nonce for nonce in range(mined_nonce, nonces.next)
+                if nonce not in nonces.pending and nonce not in nonces.reserved]
+        nonces.free.update(gaps)
+        return gaps
+
+    def reset(self, chain_id: int, account: str):
+        """Forget the account, the next nonce will be read from the node again."""
+        with self._lock:
+            self._accounts.pop((chain_id, account), None)
+
+
+default_nonce_manager = NonceManager()
+"""Process wide nonce manager, share it between the RolesMod instances that use the same accounts."""
+
+
+class AsyncNonceManager(NonceManager):
+    """NonceManager for AsyncWeb3: reserve, resync and find_gaps are coroutines.
+
+    The nonces are handed out from the same state as NonceManager, mark_sent, release, pending and
+    reset are the same (they make no requests). The node is awaited under an asyncio lock per
+    (chain_id, account), so the concurrent first reservations of an account read it only once.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._async_locks = {}
+
+    def _async_lock(self, key) -> asyncio.Lock:
+        # asyncio locks are bound to the event loop that uses them
+        lock_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            if lock_key not in self._async_locks:
+                self._async_locks[lock_key] = asyncio.Lock()
+            return self._async_locks[lock_key]
+
+    async def reserve(self, web3, chain_id: int, account: str) -> int:
+        """Return the nonce to use for the next transaction of the account."""
+        key = (chain_id, account)
+        while True:
+            with self._lock:
+                nonces = self._accounts.get(key)
+                if nonces is not None:
+                    return self._take(nonces)
+            async with self._async_lock(key):
+                if key not in self._accounts:
+                    node_nonce = await web3.eth.get_transaction_count(account, "pending")
+                    with self._lock:
+                        self._accounts.setdefault(key, _AccountNonces(node_nonce))
+
+    async def resync(self, web3, chain_id: int, account: str):
+        """Move forward to the node's pending nonce, see NonceManager.resync."""
+        async with self._async_lock((chain_id, account)):
+            node_nonce = await web3.eth.get_transaction_count(account, "pending")
+            with self._lock:
+                self._move_to(self._accounts.setdefault((chain_id, account), _AccountNonces(node_nonce)), node_nonce)
+
+    async def find_gaps(self, web3, chain_id: int, account: str) -> list[int]:
+        """Return the nonces that block the pending transactions of the account, see NonceManager.find_gaps."""
+        async with self._async_lock((chain_id, account)):
+            mined_nonce, node_nonce = await asyncio.gather(web3.eth.get_transaction_count(account, "latest"),
+                                                           web3.eth.get_transaction_count(account, "pending"))
+            with self._lock:
+                nonces = self._accounts.setdefault((chain_id, account), _AccountNonces(node_nonce))
+                return self._fill_gaps(nonces, mined_nonce, node_nonce)
@@ -1,10 +1,12 @@
 import logging
 from typing import Dict, List
 
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
 from .roles_modifier import RolesMod
+from .async_roles_modifier import AsyncRolesMod
 from .constants import Blockchain
 from .generic_method import TxData
+from .permissions import RolesPermissions
 from .utils import multi_or_one
 
 logger = logging.getLogger(__name__)
@@ -16,7 +18,8 @@ def check(txs: List[TxData],
           roles_mod_address: str,
           blockchain: Blockchain,
           web3: Web3,
-          block='latest'
+          block='latest',
+          permissions: RolesPermissions = None
           ) -> bool:
     """Test the transaction with static call
 
@@ -27,18 +30,20 @@ def check(txs: List[TxData],
         roles_mod_address (str): address to call execTransactionWithRole
         blockchain (Blockchain)
         web3 (Web3)
+        permissions (RolesPermissions): when given the check is done in memory, without the static call
 
     Returns:
         bool: status
     """
-    tx_data = multi_or_one(txs, blockchain)
+    tx_data = multi_or_one(txs, blockchain, as_bytes=True)
     roles_mod = RolesMod(
         role=role,
         contract_address=roles_mod_address,
         account=account,
         operation=tx_data.operation,
         web3=web3,
-        value=tx_data.value
+        value=tx_data.value,
+        permissions=permissions
     )
     return roles_mod.check(tx_data.contract_address, tx_data.data, block=block)
 
@@ -63,7 +68,7 @@ def send(txs: List[TxData],
     Returns:
         (bool) status
     """
-    tx_data = multi_or_one(txs, blockchain)
+    tx_data = multi_or_one(txs, blockchain, as_bytes=True)
     roles_mod = RolesMod(
         role=role,
         contract_address=roles_mod_address,
@@ -77,3 +82,52 @@ def send(txs: List[TxData],
     roles_mod_tx1 = roles_mod.get_tx_receipt(roles_mod_execute)
     logger.info(roles_mod_tx1)
     return roles_mod_tx1.status == 1
+
+
+async def check_async(txs: List[TxData],
+                      role: int,
+                      account: str,
+                      roles_mod_address: str,
+                      blockchain: Blockchain,
+                      web3: AsyncWeb3,
+                      block='latest'
+                      ) -> bool:
+    """Like check() but using an AsyncWeb3, so many checks can run concurrently in the event loop."""
+    tx_data = multi_or_one(txs, blockchain, as_bytes=True)
+    roles_mod = AsyncRolesMod(
+        role=role,
+        contract_address=roles_mod_address,
+        account=account,
+        operation=tx_data.operation,
+        web3=web3,
+        value=tx_data.value
+    )
+    return await roles_mod.check(tx_data.contract_address, tx_data.data, block=block)
+
+
+async def send_async(txs: List[TxData],
+                     role: int,
+                     private_key: str,
+                     roles_mod_address: str,
+                     blockchain: Blockchain,
+                     web3: AsyncWeb3,
+                     ) -> bool:
+    """Like send() but using an AsyncWeb3.
+
+    Concurrent sends from the same account get consecutive nonces and the receipt is polled
+    without blocking the event loop.
+    """
+    tx_data = multi_or_one(txs, blockchain, as_bytes=True)
+    roles_mod = AsyncRolesMod(
+        role=role,
+        contract_address=roles_mod_address,
+        private_key=private_key,
+        operation=tx_data.operation,
+        web3=web3,
+        value=tx_data.value
+    )
+    roles_mod_execute = await roles_mod.execute(tx_data.contract_address, tx_data.data)
+    logger.info('building receipt....')
+    roles_mod_tx1 = await roles_mod.get_tx_receipt(roles_mod_execute)
+    logger.info(roles_mod_tx1)
+    return roles_mod_tx1.status == 1
@@ -0,0 +1,397 @@
+"""Offline evaluation of the permissions of a Roles modifier (v1).
+
+The permissions of the roles are built by applying the same admin calls the Roles contract
+receives (scopeTarget, scopeFunction, scopeParameter, ...), taken from a presets JSON or from
+any list of calldata, and the transactions are then checked in memory following the rules of
+the contract's Permissions library, including the transactions packed in a multisend.
+
+Example::
+
+    permissions = RolesPermissions.from_presets(presets_json, multisend=MULTISENDS[Chain.ETHEREUM])
+    permissions.is_allowed(role=1, to=ETHAddr.WETH, data=approve.data)
+"""
+import json
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Optional
+
+from eth_abi import decode
+from eth_utils import keccak, to_checksum_address
+
+from .roles_modifier import Operation
+from .utils import MULTISEND_SELECTOR, to_bytes_data, unpack_multisend
+
+
+class Clearance(IntEnum):
+    NONE = 0
+    TARGET = 1
+    FUNCTION = 2
+
+
+class ExecutionOptions(IntEnum):
+    NONE = 0
+    SEND = 1
+    DELEGATE_CALL = 2
+    BOTH = 3
+
+
+class ParameterType(IntEnum):
+    STATIC = 0
+    DYNAMIC = 1
+    DYNAMIC32 = 2
+
+
+class Comparison(IntEnum):
+    EQUAL_TO = 0
+    GREATER_THAN = 1
+    LESS_THAN = 2
+    ONE_OF = 3
+
+
+class PermissionDenied(Exception):
+    """The transaction would be reverted by the Roles modifier, the message is the contract's error name."""
+
+
+@dataclass
+class ParameterScope:
+    type: ParameterType
+    comparison: Comparison
+    comp_values: list[bytes]  # compressed as the contract does: the value for static types, its hash otherwise
+
+
+@dataclass
+class FunctionScope:
+    options: ExecutionOptions = ExecutionOptions.NONE
+    wildcarded: bool = False
+    parameters: dict[int, ParameterScope] = field(default_factory=dict)
+    length: int = 0  # number of parameters of the scope config, scoped or not
+
+    @property
+    def is_allowed(self) -> bool:
+        # The contract stores the function as a packed scope config, and 0 means not allowed
+        return bool(self.options or self.wildcarded or self.length)
+
+
+@dataclass
+class TargetScope:
+    clearance: Clearance = Clearance.NONE
+    options: ExecutionOptions = ExecutionOptions.NONE
+    functions: dict[bytes, FunctionScope] = field(default_factory=dict)
+
+
+@dataclass
+class Role:
+    members: set[str] = field(default_factory=set)
+    targets: dict[str, TargetScope] = field(default_factory=dict)
+
+
+def pack_scope_config(function: FunctionScope) -> int:
+    """The scope config the contract stores for the function: options, isWildcarded and length on the left,
+    then isScoped, paramType and paramComp of each parameter."""
+    scope_config = int(function.options) << 254 | int(function.wildcarded) << 253 | function.length << 240
+    for index, parameter in function.parameters.items():
+        scope_config |= 1 << (index + 192)
+        scope_config |= int(parameter.type) << (index * 2 + 96) | int(parameter.comparison) << (index * 2)
+    return scope_config
+
+
+def compress_comp_value(param_type: ParameterType, comp_value: bytes) -> bytes:
+    if param_type == ParameterType.STATIC:
+        return comp_value[:32].ljust(32, b"\0")
+    return keccak(comp_value)
+
+
+_ADMIN_FUNCTIONS = {
+    keccak(text=f"{name}({','.join(types)})")[:4]: (name, types) for name, types in [
+        ("allowTarget", ("uint16", "address", "uint8")),
+        ("revokeTarget", ("uint16", "address")),
+        ("scopeTarget", ("uint16", "address")),
+        ("scopeAllowFunction", ("uint16", "address", "bytes4", "uint8")),
+        ("scopeRevokeFunction", ("uint16", "address", "bytes4")),
+        ("scopeFunction", ("uint16", "address", "bytes4", "bool[]", "uint8[]", "uint8[]", "bytes[]", "uint8")),
+        ("scopeFunctionExecutionOptions", ("uint16", "address", "bytes4", "uint8")),
+        ("scopeParameter", ("uint16", "address", "bytes4", "uint256", "uint8", "uint8", "bytes")),
+        ("scopeParameterAsOneOf", ("uint16", "address", "bytes4", "uint256", "uint8", "bytes[]")),
+        ("unscopeParameter", ("uint16", "address", "bytes4", "uint8")),
+        ("assignRoles", ("address", "uint16[]", "bool[]")),
+        ("setMultisend", ("address",)),
+    ]
+}
+
+
+class RolesPermissions:
+    """The permissions of all the roles of a Roles modifier."""
+
+    def __init__(self, multisend: Optional[str] = None):
+        self.roles: dict[int, Role] = {}
+        self.multisend = to_checksum_address(multisend) if multisend else None
+
+    @classmethod
+    def from_presets(cls, presets: str | dict, multisend: Optional[str] = None,
+                     replaces: list[tuple[str, str]] = None) -> "RolesPermissions":
+        """Build the permissions from a presets JSON (Safe transaction builder format).
+
+        replaces is a list of (old, new) hex substrings to replace in the calldata, like the
+        avatar address placeholder of the presets.
+        """
+        presets_data = json.loads(presets) if isinstance(presets, str) else presets
+        permissions = cls(multisend)
+        for tx in presets_data["transactions"]:
+            data = tx["data"]
+            for old, new in replaces or []:
+                data = data.replace(old, new)
+            permissions.apply(data)
+        return permissions
+
+    def role(self, role: int) -> Role:
+        if role not in self.roles:
+            self.roles[role] = Role()
+        return self.roles[role]
+
+    def _target(self, role: int, address: str) -> TargetScope:
+        targets = self.role(role).targets
+        address = to_checksum_address(address)
+        if address not in targets:
+            targets[address] = TargetScope()
+        return targets[address]
+
+    def _function(self, role: int, address: str, selector: bytes) -> FunctionScope:
+        functions = self._target(role, address).functions
+        if selector not in functions:
+            functions[selector] = FunctionScope()
+        return functions[selector]
+
+    def set_scope_config(self, role: int, address: str, selector: bytes, scope_config: int):
+        """Set the function as in the scope config the contract stores (e.g. the resultingScopeConfig of the
+        Scope* events), keeping the comparison values already set for the parameters that stay scoped."""
+        if scope_config == 0:
+            self._target(role, address).functions.pop(selector, None)
+            return
+        function = self._function(role, address, selector)
+        function.options = ExecutionOptions(scope_config >> 254)
+        function.wildcarded = bool(scope_config >> 253 & 1)
+        function.length = scope_config >> 240 & 0xFF
+        parameters = {}
+        for index in range(48):
+            if not scope_config >> (index + 192) & 1:
+                continue
+            comparison = Comparison(scope_config >> (index * 2) & 3)
+            previous = function.parameters.get(index)
+            # The contract compares with the default value of its storage when no value was set
+            comp_values = previous.comp_values if previous else ([] if comparison == Comparison.ONE_OF else [bytes(32)])
+            parameters[index] = ParameterScope(ParameterType(scope_config >> (index * 2 + 96) & 3), comparison,
+                                               comp_values)
+        function.parameters = parameters
+
+    def apply(self, data: str | bytes):
+        """Apply an admin call of the Roles contract given its calldata."""
+        data = to_bytes_data(data)
+        if data[:4] not in _ADMIN_FUNCTIONS:
+            raise ValueError(f"Unknown Roles admin function {data[:4].hex()}")
+        name, types = _ADMIN_FUNCTIONS[data[:4]]
+        self.apply_call(name, *decode(types, data[4:]))
+
+    def apply_call(self, name: str, *args):
+        """Apply an admin call of the Roles contract given its function name and arguments.
+
+        The scopes the contract rejects raise ValueError with the contract's error name.
+        """
+        if name == "assignRoles":
+            module, roles, member_of = args
+            for role, is_member in zip(roles, member_of):
+                members = self.role(role).members
+                if is_member:
+                    members.add(to_checksum_address(module))
+                else:
+                    members.discard(to_checksum_address(module))
+            return
+        if name == "setMultisend":
+            self.multisend = to_checksum_address(args[0])
+            return
+
+        role, address = args[:2]
+        if name == "allowTarget":
+            target = self._target(role, address)
+            target.clearance, target.options = Clearance.TARGET, ExecutionOptions(args[2])
+        elif name == "revokeTarget":
+            target = self._target(role, address)
+            target.clearance, target.options = Clearance.NONE, ExecutionOptions.NONE
+        elif name == "scopeTarget":
+            target = self._target(role, address)
+            target.clearance, target.options = Clearance.FUNCTION, ExecutionOptions.NONE
+        elif name == "scopeAllowFunction":
+            self._target(role, address).functions[args[2]] = FunctionScope(ExecutionOptions(args[3]), wildcarded=True)
+        elif name == "scopeRevokeFunction":
+            self._target(role, address).functions.pop(args[2], None)
+        elif name == "scopeFunction":
+            selector, is_scoped, param_types, param_comps, comp_values, options = args[2:]
+            for scoped, param_type, comparison in zip(is_scoped, param_types, param_comps):
+                if scoped:
+                    _enforce_comparison(ParameterType(param_type), Comparison(comparison))
+            self._target(role, address).functions[selector] = FunctionScope(ExecutionOptions(options), parameters={
+                index: ParameterScope(ParameterType(param_types[index]), Comparison(param_comps[index]),
+                                      [compress_comp_value(ParameterType(param_types[index]), comp_values[index])])
+                for index, scoped in enumerate(is_scoped) if scoped
+            }, length=len(is_scoped))
+        elif name == "scopeFunctionExecutionOptions":
+            self._function(role, address, args[2]).options = ExecutionOptions(args[3])
+        elif name == "scopeParameter":
+            selector, index, param_type, comparison, comp_value = args[2:]
+            _enforce_comparison(ParameterType(param_type), Comparison(comparison))
+            _pack_parameter(self._function(role, address, selector), index, ParameterScope(
+                ParameterType(param_type), Comparison(comparison),
+                [compress_comp_value(ParameterType(param_type), comp_value)]))
+        elif name == "scopeParameterAsOneOf":
+            selector, index, param_type, comp_values = args[2:]
+            _pack_parameter(self._function(role, address, selector), index, ParameterScope(
+                ParameterType(param_type), Comparison.ONE_OF,
+                [compress_comp_value(ParameterType(param_type), value) for value in comp_values]))
+        elif name == "unscopeParameter":
+            _pack_parameter(self._function(role, address, args[2]), args[3], None)
+        else:
+            raise ValueError(f"Unknown Roles admin function {name}")
+
+    def check(self, role: int, to: str, data: str | bytes, value: int = 0, operation: Operation = Operation.CALL,
+              account: Optional[str] = None):
+        """Raise PermissionDenied if the Roles modifier would reject the transaction.
+
+        The membership of the account is only checked when the role has members assigned
+        through assignRoles in the loaded permissions. The calls to the multisend are checked
+        as the transactions they pack, their data must be a multiSend payload.
+        """
+        role_scope = self.roles.get(role, Role())
+        if account is not None and role_scope.members and to_checksum_address(account) not in role_scope.members:
+            raise PermissionDenied("NoMembership")
+        data = to_bytes_data(data)
+        if self.multisend and to_checksum_address(to) == self.multisend:
+            # As the contract, any call to the multisend is unpacked as a multiSend, whatever its selector
+            for tx in unpack_multisend(MULTISEND_SELECTOR + data[4:]):
+                _check_transaction(role_scope, tx.contract_address, tx.value, tx.data, tx.operation)
+        else:
+            _check_transaction(role_scope, to, value, data, operation)
+
+    def to_dict(self) -> dict:
+        """A JSON serializable representation, keyed by role, target, selector and parameter index."""
+        return {
+            "multisend": self.multisend,
+            "roles": {str(role_number): {
+                "members": sorted(role.members),
+                "targets": {address: {
+                    "clearance": int(target.clearance),
+                    "options": int(target.options),
+                    "functions": {"0x" + selector.hex(): {
+                        "options": int(function.options),
+                        "wildcarded": function.wildcarded,
+                        "length": function.length,
+                        "parameters": {str(index): {
+                            "type": int(parameter.type),
+                            "comparison": int(parameter.comparison),
+                            "comp_values": ["0x" + value.hex() for value in parameter.comp_values],
+                        } for index, parameter in sorted(function.parameters.items())},
+                    } for selector, function in target.functions.items()},
+                } for address, target in role.targets.items()},
+            } for role_number, role in sorted(self.roles.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RolesPermissions":
+        permissions = cls(data.get("multisend"))
+        for role_number, role_data in data["roles"].items():
+            role = permissions.role(int(role_number))
+            role.members = set(role_data["members"])
+            for address, target_data in role_data["targets"].items():
+                role.targets[address] = TargetScope(
+                    Clearance(target_data["clearance"]), ExecutionOptions(target_data["options"]),
+                    functions={bytes.fromhex(selector[2:]): FunctionScope(
+                        ExecutionOptions(function_data["options"]), function_data["wildcarded"],
+                        parameters={int(index): ParameterScope(
+                            ParameterType(parameter["type"]), Comparison(parameter["comparison"]),
+                            [bytes.fromhex(value[2:]) for value in parameter["comp_values"]])
+                            for index, parameter in function_data["parameters"].items()},
+                        length=function_data["length"])
+                        for selector, function_data in target_data["functions"].items()})
+        return permissions
+
+    def is_allowed(self, role: int, to: str, data: str | bytes, value: int = 0,
+                   operation: Operation = Operation.CALL, account: Optional[str] = None) -> bool:
+        try:
+            self.check(role, to, data, value, operation, account)
+            return True
+        except PermissionDenied:
+            return False
+
+
+def _enforce_comparison(param_type: ParameterType, comparison: Comparison):
+    # The checks of scopeFunction and scopeParameter, OneOf is only set with scopeParameterAsOneOf
+    if comparison == Comparison.ONE_OF:
+        raise ValueError("UnsuitableOneOfComparison")
+    if param_type != ParameterType.STATIC and comparison != Comparison.EQUAL_TO:
+        raise ValueError("UnsuitableRelativeComparison")
+
+
+def _pack_parameter(function: FunctionScope, index: int, parameter: Optional[ParameterScope]):
+    # packParameter: scoping or unscoping a parameter also clears isWildcarded and extends the length
+    function.wildcarded, function.length = False, max(function.length, index + 1)
+    if parameter is None:
+        function.parameters.pop(index, None)
+    else:
+        function.parameters[index] = parameter
+
+
+def _check_transaction(role: Role, to: str, value: int, data: bytes, operation: Operation):
+    if 0 < len(data) < 4:
+        raise PermissionDenied("FunctionSignatureTooShort")
+    target = role.targets.get(to_checksum_address(to))
+    if target is None or target.clearance == Clearance.NONE:
+        raise PermissionDenied("TargetAddressNotAllowed")
+    if target.clearance == Clearance.TARGET:
+        _check_execution_options(value, operation, target.options)
+        return
+    function = target.functions.get(data[:4])
+    if function is None or not function.is_allowed:
+        raise PermissionDenied("FunctionNotAllowed")
+    _check_execution_options(value, operation, function.options)
+    if not function.wildcarded:
+        _check_parameters(function, data)
+
+
+def _check_execution_options(value: int, operation: Operation, options: ExecutionOptions):
+    if value > 0 and options not in (ExecutionOptions.SEND, ExecutionOptions.BOTH):
+        raise PermissionDenied("SendNotAllowed")
+    if operation == Operation.DELEGATE_CALL and options not in (ExecutionOptions.DELEGATE_CALL, ExecutionOptions.BOTH):
+        raise PermissionDenied("DelegateCallNotAllowed")
+
+
+def _word(data: bytes, offset: int) -> bytes:
+    if len(data) < offset + 32:
+        raise PermissionDenied("CalldataOutOfBounds")
+    return data[offset:offset + 32]
+
+
+def _pluck(data: bytes, param_type: ParameterType, index: int) -> bytes:
+    if param_type == ParameterType.STATIC:
+        return _word(data, 4 + index * 32)
+    offset = 4 + int.from_bytes(_word(data, 4 + index * 32), "big")
+    length = int.from_bytes(_word(data, offset), "big")
+    if param_type == ParameterType.DYNAMIC32:
+        length *= 32
+    if len(data) < offset + 32 + length:
+        raise PermissionDenied("CalldataOutOfBounds")
+    return keccak(data[offset + 32:offset + 32 + length])
+
+
+def _check_parameters(function: FunctionScope, data: bytes):
+    for index, parameter in sorted(function.parameters.items()):
+        value = _pluck(data, parameter.type, index)
+        comparison = parameter.comparison
+        if comparison == Comparison.ONE_OF:
+            if value not in parameter.comp_values:
+                raise PermissionDenied("ParameterNotOneOfAllowed")
+        elif comparison == Comparison.EQUAL_TO:
+            if value != parameter.comp_values[0]:
+                raise PermissionDenied("ParameterNotAllowed")
+        elif comparison == Comparison.GREATER_THAN:
+            if int.from_bytes(value, "big") <= int.from_bytes(parameter.comp_values[0], "big"):
+                raise PermissionDenied("ParameterLessThanAllowed")
+        elif int.from_bytes(value, "big") >= int.from_bytes(parameter.comp_values[0], "big"):
+            raise PermissionDenied("ParameterGreaterThanAllowed")
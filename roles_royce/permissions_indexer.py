@@ -0,0 +1,128 @@
+"""Build the permissions of a Roles modifier (v1) from its event logs.
+
+The Roles contract emits an event for every admin call (ScopeTarget, ScopeFunction,
+ScopeParameter, AssignRoles, ...) with the same arguments as the call, so replaying them
+in order into a RolesPermissions gives the on-chain configuration. The events of the function
+scopes also carry the resulting scope config the contract stored, which is set on the function
+after the call, so the options, wildcard and parameter scopes are those of the contract. The logs are fetched
+with ranged eth_getLogs requests and the indexer remembers the last indexed block, so a
+refresh only asks for the new logs.
+
+Example::
+
+    indexer = PermissionsIndexer(w3, roles_mod_address, from_block=17_000_000)
+    permissions = indexer.update()
+    snapshot = indexer.snapshot()  # JSON serializable
+    ...
+    indexer = PermissionsIndexer.from_snapshot(w3, snapshot)
+    permissions = indexer.update()  # one small eth_getLogs request
+"""
+import logging
+from typing import Optional
+
+from eth_abi import decode
+from eth_utils import keccak, to_checksum_address
+
+from .permissions import RolesPermissions
+
+logger = logging.getLogger(__name__)
+
+# (event name, admin call it records, non indexed argument types, whether the last one is the resulting scope config)
+_EVENT_DEFINITIONS = [
+    ("AllowTarget", "allowTarget", ("uint16", "address", "uint8"), False),
+    ("RevokeTarget", "revokeTarget", ("uint16", "address"), False),
+    ("ScopeTarget", "scopeTarget", ("uint16", "address"), False),
+    ("ScopeAllowFunction", "scopeAllowFunction", ("uint16", "address", "bytes4", "uint8", "uint256"), True),
+    ("ScopeRevokeFunction", "scopeRevokeFunction", ("uint16", "address", "bytes4", "uint256"), True),
+    ("ScopeFunction", "scopeFunction",
+     ("uint16", "address", "bytes4", "bool[]", "uint8[]", "uint8[]", "bytes[]", "uint8", "uint256"), True),
+    ("ScopeFunctionExecutionOptions", "scopeFunctionExecutionOptions",
+     ("uint16", "address", "bytes4", "uint8", "uint256"), True),
+    ("ScopeParameter", "scopeParameter",
+     ("uint16", "address", "bytes4", "uint256", "uint8", "uint8", "bytes", "uint256"), True),
+    ("ScopeParameterAsOneOf", "scopeParameterAsOneOf",
+     ("uint16", "address", "bytes4", "uint256", "uint8", "bytes[]", "uint256"), True),
+    ("UnscopeParameter", "unscopeParameter", ("uint16", "address", "bytes4", "uint256", "uint256"), True),
+    ("AssignRoles", "assignRoles", ("address", "uint16[]", "bool[]"), False),
+    ("SetMultisendAddress", "setMultisend", ("address",), False),
+]
+
+EVENTS = {
+    keccak(text=f"{name}({','.join(types)})"): (call_name, types, has_config)
+    for name, call_name, types, has_config in _EVENT_DEFINITIONS
+}
+"""Event topic -> (admin call name, argument types, whether the last argument is the resulting scope config)."""
+
+
+class PermissionsIndexer:
+    def __init__(self, web3, roles_mod_address: str, from_block: int = 0, block_range: int = 10_000,
+                 confirmations: int = 0, permissions: Optional[RolesPermissions] = None):
+        """
+        :param from_block: the first block to index, e.g. the deployment block of the Roles modifier
+        :param block_range: the number of blocks per eth_getLogs request, it is halved when the node
+            rejects a request (e.g. for returning too many logs)
+        :param confirmations: number of blocks to stay behind the head, to avoid indexing reorganized logs
+        """
+        self.web3 = web3
+        self.roles_mod_address = to_checksum_address(roles_mod_address)
+        self.next_block = from_block
+        self.block_range = block_range
+        self.confirmations = confirmations
+        self.permissions = permissions or RolesPermissions()
+
+    @property
+    def last_block(self) -> int:
+        """The last indexed block."""
+        return self.next_block - 1
+
+    def update(self, to_block: Optional[int] = None) -> RolesPermissions:
+        """Index the logs from the last indexed block up to to_block (the head by default)."""
+        if to_block is None:
+            to_block = self.web3.eth.block_number - self.confirmations
+        while self.next_block <= to_block:
+            end = min(self.next_block + self.block_range - 1, to_block)
+            try:
+                logs = self._get_logs(self.next_block, end)
+            except ValueError as e:
+                if self.block_range == 1:
+                    raise
+                self.block_range = max(1, self.block_range // 2)
+                logger.info(f"eth_getLogs failed ({e}), retrying with a range of {self.block_range} blocks")
+                continue
+            for log in logs:
+                self.apply_log(log)
+            self.next_block = end + 1
+        return self.permissions
+
+    def _get_logs(self, from_block: int, to_block: int) -> list:
+        return self.web3.eth.get_logs({
+            "address": self.roles_mod_address,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [["0x" + topic.hex() for topic in EVENTS]],
+        })
+
+    def apply_log(self, log):
+        topic = bytes(log["topics"][0])
+        if topic not in EVENTS:
+            return
+        call_name, types, has_config = EVENTS[topic]
+        args = decode(types, bytes(log["data"]))
+        if not has_config:
+            self.permissions.apply_call(call_name, *args)
+            return
+        # The call sets the comparison values, the resulting scope config everything else
+        self.permissions.apply_call(call_name, *args[:-1])
+        role, address, selector = args[:3]
+        self.permissions.set_scope_config(role, address, selector, args[-1])
+
+    def snapshot(self) -> dict:
+        """A JSON serializable snapshot of the indexed permissions, to resume indexing later."""
+        return {"roles_mod_address": self.roles_mod_address,
+                "last_block": self.last_block,
+                "permissions": self.permissions.to_dict()}
+
+    @classmethod
+    def from_snapshot(cls, web3, snapshot: dict, **kwargs) -> "PermissionsIndexer":
+        return cls(web3, snapshot["roles_mod_address"], from_block=snapshot["last_block"] + 1,
+                   permissions=RolesPermissions.from_dict(snapshot["permissions"]), **kwargs)
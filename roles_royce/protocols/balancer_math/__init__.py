@@ -0,0 +1,8 @@
+"""Offline Balancer v2 pool math, bit-exact with the pool contracts."""
+from .fixed_point import ONE, BalancerMathError
+from .base_pool import BasePool, max_limit, min_limit
+from .stable_pool import StablePool
+from .weighted_pool import WeightedPool
+from .pool_state import PoolStateCache
+from .batch import BatchQuote, quote_exact_tokens_joins, quote_single_asset_exits, quote_single_token_joins
+from .routing import PoolGraph, Route
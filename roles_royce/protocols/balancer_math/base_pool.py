@@ -0,0 +1,269 @@
+"""The quoting and encoding pipeline shared by the Balancer pool types.
+
+A pool holds its state at a block, the same values the pool reads on chain. The ``query_*``
+methods return what the BALANCER_Queries contract would return for the same join or exit, and
+the builders return the balancer Join / Exit instances (of the classes of the pool type) with
+their limits set. The pool types implement the math on the upscaled (18 decimals) balances:
+
+- _upscaled_balances: the balances after paying the due protocol fees
+- _bpt_out_given_exact_tokens_in / _token_in_given_exact_bpt_out
+- _bpt_in_given_exact_tokens_out / _token_out_given_exact_bpt_in
+- _swap_given_in: the amount out of a swap, on the upscaled amount in after the swap fee
+- _exit_quoter / _join_quoter: the functions batch.py quotes grids of amounts with, a pool type
+  can override them to compute once the terms that do not depend on the amount
+- marginal_bpt_per_token: the marginal price of the pool, for the price impacts
+"""
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Mapping, Optional, Sequence
+
+from roles_royce.constants import ETHAddr
+from roles_royce.protocols.base import Address
+from roles_royce.protocols.eth import balancer
+
+from .fixed_point import ONE, div_down, div_up, mul_down, mul_up, sub
+
+
+def _fixed(max_slippage: float) -> int:
+    if not 0 <= max_slippage < 1:
+        raise ValueError(f"max_slippage must be in [0, 1), got {max_slippage}")
+    return round(max_slippage * ONE)
+
+
+def min_limit(amount: int, max_slippage: float) -> int:
+    """The lowest amount accepted with max_slippage (a fraction, 0.01 is 1%)."""
+    return mul_down(amount, ONE - _fixed(max_slippage))
+
+
+def max_limit(amount: int, max_slippage: float) -> int:
+    """The highest amount accepted with max_slippage (a fraction, 0.01 is 1%)."""
+    return mul_up(amount, ONE + _fixed(max_slippage))
+
+
+def holds_own_bpt(pool_id: str, tokens: Sequence[Address]) -> bool:
+    """Whether the BPT of the pool is one of its tokens, as in the ComposableStable pools the math does not model."""
+    bpt = balancer.pool_address(pool_id).lower()
+    return any(token.lower() == bpt for token in tokens)
+
+
+@dataclass(frozen=True, kw_only=True)
+class BasePool:
+    pool_id: str
+    tokens: tuple[Address, ...]  # as returned by Vault.getPoolTokens, sorted by address
+    balances: tuple[int, ...]  # in token units, as returned by Vault.getPoolTokens
+    scaling_factors: tuple[int, ...]  # getScalingFactors, they include the price rates of MetaStablePools
+    swap_fee: int  # getSwapFeePercentage, 18 decimals
+    total_supply: int
+    block_number: Optional[int] = None
+    last_invariant: int = 0  # getLastInvariant, 0 to not account the due protocol fees
+    protocol_swap_fee: int = 0  # ProtocolFeesCollector.getSwapFeePercentage
+
+    # The Join and Exit classes of the pool type
+    exact_tokens_join_class = balancer.ExactTokensJoin
+    single_asset_join_class = balancer.SingleAssetJoin
+    proportional_join_class = balancer.ProportionalJoin
+    single_asset_exit_class = balancer.SingleAssetExit
+    proportional_exit_class = balancer.ProportionalExit
+    custom_exit_class = balancer.CustomExit
+
+    def __post_init__(self):
+        if not len(self.tokens) == len(self.balances) == len(self.scaling_factors):
+            raise ValueError("tokens, balances and scaling_factors must have the same length")
+        for name in ("tokens", "balances", "scaling_factors"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+
+    @cached_property
+    def upscaled_balances(self) -> list[int]:
+        """The 18 decimals balances the pool math uses, after paying the due protocol fees."""
+        return self._upscaled_balances(self._upscale(self.balances))
+
+    @cached_property
+    def swap_balances(self) -> list[int]:
+        """The 18 decimals balances of the swaps, which do not pay the due protocol fees."""
+        return self._upscale(self.balances)
+
+    # Implemented by the pool types
+
+    def _upscaled_balances(self, balances: list[int]) -> list[int]:
+        return balances
+
+    def _bpt_out_given_exact_tokens_in(self, amounts_in: list[int]) -> int:
+        raise NotImplementedError
+
+    def _token_in_given_exact_bpt_out(self, token_index: int, bpt_amount_out: int) -> int:
+        raise NotImplementedError
+
+    def _bpt_in_given_exact_tokens_out(self, amounts_out: list[int]) -> int:
+        raise NotImplementedError
+
+    def _token_out_given_exact_bpt_in(self, token_index: int, bpt_amount_in: int) -> int:
+        raise NotImplementedError
+
+    def _swap_given_in(self, token_in_index: int, token_out_index: int, amount_in: int) -> int:
+        raise NotImplementedError
+
+    def _exit_quoter(self, exit_token_index: int) -> Callable[[int], int]:
+        """A function of the bpt_amount_in returning the upscaled amount out of a single asset exit."""
+        return lambda bpt_amount_in: self._token_out_given_exact_bpt_in(exit_token_index, bpt_amount_in)
+
+    def _join_quoter(self) -> Callable[[list[int]], int]:
+        """A function of the upscaled amounts_in returning the BPT out of an exact tokens join."""
+        return self._bpt_out_given_exact_tokens_in
+
+    def marginal_bpt_per_token(self) -> list[float]:
+        """The BPT minted per (upscaled) unit of each token for an infinitesimal join, without fees."""
+        raise NotImplementedError
+
+    # Tokens and amounts
+
+    def token_index(self, token: Address | int, wrapped_native: Address = ETHAddr.WETH) -> int:
+        """The index of the token in the pool tokens, the zero address stands for wrapped_native."""
+        if isinstance(token, int):
+            self._check_index(token)
+            return token
+        if int(token, 16) == 0:
+            token = wrapped_native
+        for i, pool_token in enumerate(self.tokens):
+            if pool_token.lower() == token.lower():
+                return i
+        raise ValueError(f"{token} is not a token of the pool {self.pool_id}")
+
+    def align(self, amounts: Mapping[Address, int],
+              wrapped_native: Address = ETHAddr.WETH) -> tuple[list[Address], list[int]]:
+        """The assets and the amounts of a join or exit, sorted as the pool tokens.
+
+        The tokens not in amounts get 0. A zero address key (the native token) is used as the
+        asset in place of wrapped_native.
+        """
+        assets, aligned = list(self.tokens), [0] * len(self.tokens)
+        for token, amount in amounts.items():
+            index = self.token_index(token, wrapped_native)
+            assets[index] = token
+            aligned[index] = amount
+        return assets, aligned
+
+    def _assets_and_amounts(self, amounts, assets) -> tuple[list[Address], list[int]]:
+        if isinstance(amounts, Mapping):
+            return self.align(amounts)
+        return list(assets or self.tokens), list(amounts)
+
+    def _check_index(self, token_index: int):
+        if not 0 <= token_index < len(self.tokens):
+            raise IndexError(f"Token index {token_index} out of range for a pool of {len(self.tokens)} tokens")
+
+    def _check_amounts(self, amounts: Sequence[int]):
+        if len(amounts) != len(self.tokens):
+            raise ValueError(f"Expected {len(self.tokens)} amounts, got {len(amounts)}")
+
+    def _upscale(self, amounts: Sequence[int]) -> list[int]:
+        return [mul_down(a, f) for a, f in zip(amounts, self.scaling_factors)]
+
+    def _downscale_down(self, amounts: Sequence[int]) -> list[int]:
+        return [div_down(a, f) for a, f in zip(amounts, self.scaling_factors)]
+
+    def _downscale_up(self, amounts: Sequence[int]) -> list[int]:
+        return [div_up(a, f) for a, f in zip(amounts, self.scaling_factors)]
+
+    # Swaps
+
+    def query_swap_given_in(self, token_in_index: int, token_out_index: int, amount_in: int) -> int:
+        """The amount out of a GIVEN_IN swap, as queryBatchSwap returns it for a single swap."""
+        self._check_index(token_in_index)
+        self._check_index(token_out_index)
+        # The fee is charged on the amount in before upscaling it, as in onSwap
+        amount_in = sub(amount_in, mul_up(amount_in, self.swap_fee))
+        amount_out = self._swap_given_in(token_in_index, token_out_index,
+                                         mul_down(amount_in, self.scaling_factors[token_in_index]))
+        return div_down(amount_out, self.scaling_factors[token_out_index])
+
+    # Joins, they return (bpt_out, amounts_in) as queryJoin
+
+    def query_exact_tokens_join(self, amounts_in: Sequence[int]) -> tuple[int, list[int]]:
+        self._check_amounts(amounts_in)
+        upscaled = self._upscale(amounts_in)
+        return self._bpt_out_given_exact_tokens_in(upscaled), self._downscale_up(upscaled)
+
+    def query_single_asset_join(self, bpt_amount_out: int, join_token_index: int) -> tuple[int, list[int]]:
+        self._check_index(join_token_index)
+        amounts_in = [0] * len(self.tokens)
+        amounts_in[join_token_index] = self._token_in_given_exact_bpt_out(join_token_index, bpt_amount_out)
+        return bpt_amount_out, self._downscale_up(amounts_in)
+
+    def query_proportional_join(self, bpt_amount_out: int) -> tuple[int, list[int]]:
+        # BasePoolMath.computeProportionalAmountsIn, no fees
+        bpt_ratio = div_up(bpt_amount_out, self.total_supply)
+        return bpt_amount_out, self._downscale_up([mul_up(b, bpt_ratio) for b in self.upscaled_balances])
+
+    # Exits, they return (bpt_in, amounts_out) as queryExit
+
+    def query_single_asset_exit(self, bpt_amount_in: int, exit_token_index: int) -> tuple[int, list[int]]:
+        self._check_index(exit_token_index)
+        amounts_out = [0] * len(self.tokens)
+        amounts_out[exit_token_index] = self._token_out_given_exact_bpt_in(exit_token_index, bpt_amount_in)
+        return bpt_amount_in, self._downscale_down(amounts_out)
+
+    def query_proportional_exit(self, bpt_amount_in: int) -> tuple[int, list[int]]:
+        # BasePoolMath.computeProportionalAmountsOut, no fees
+        bpt_ratio = div_down(bpt_amount_in, self.total_supply)
+        return bpt_amount_in, self._downscale_down([mul_down(b, bpt_ratio) for b in self.upscaled_balances])
+
+    def query_custom_exit(self, amounts_out: Sequence[int]) -> tuple[int, list[int]]:
+        self._check_amounts(amounts_out)
+        upscaled = self._upscale(amounts_out)
+        return self._bpt_in_given_exact_tokens_out(upscaled), self._downscale_down(upscaled)
+
+    # Builders of the Join and Exit methods with their limits. The assets default to the pool
+    # tokens, they can be given to use the zero address for ETH instead of WETH. The amounts
+    # can also be given as a mapping of token to amount, aligned with the pool tokens by align().
+    # The token indexes can be given as the token addresses.
+
+    def exact_tokens_join(self, avatar: Address, amounts_in: Sequence[int] | Mapping[Address, int],
+                          max_slippage: float, assets: Optional[Sequence[Address]] = None) -> balancer.Join:
+        assets, amounts_in = self._assets_and_amounts(amounts_in, assets)
+        bpt_out, _ = self.query_exact_tokens_join(amounts_in)
+        return self.exact_tokens_join_class(pool_id=self.pool_id, avatar=avatar, assets=assets, amounts_in=amounts_in,
+                                            min_bpt_out=min_limit(bpt_out, max_slippage))
+
+    def single_asset_join(self, avatar: Address, bpt_amount_out: int, join_token_index: int | Address,
+                          max_slippage: float, assets: Optional[Sequence[Address]] = None) -> balancer.Join:
+        assets = self._single_asset_assets(join_token_index, assets)
+        join_token_index = self.token_index(join_token_index)
+        _, amounts_in = self.query_single_asset_join(bpt_amount_out, join_token_index)
+        return self.single_asset_join_class(pool_id=self.pool_id, avatar=avatar, assets=assets,
+                                            max_amounts_in=[max_limit(a, max_slippage) for a in amounts_in],
+                                            bpt_amount_out=bpt_amount_out, join_token_index=join_token_index)
+
+    def proportional_join(self, avatar: Address, bpt_amount_out: int, max_slippage: float,
+                          assets: Optional[Sequence[Address]] = None) -> balancer.Join:
+        _, amounts_in = self.query_proportional_join(bpt_amount_out)
+        return self.proportional_join_class(pool_id=self.pool_id, avatar=avatar, assets=list(assets or self.tokens),
+                                            max_amounts_in=[max_limit(a, max_slippage) for a in amounts_in],
+                                            bpt_amount_out=bpt_amount_out)
+
+    def single_asset_exit(self, avatar: Address, bpt_amount_in: int, exit_token_index: int | Address,
+                          max_slippage: float, assets: Optional[Sequence[Address]] = None) -> balancer.Exit:
+        assets = self._single_asset_assets(exit_token_index, assets)
+        exit_token_index = self.token_index(exit_token_index)
+        _, amounts_out = self.query_single_asset_exit(bpt_amount_in, exit_token_index)
+        return self.single_asset_exit_class(pool_id=self.pool_id, avatar=avatar, assets=assets,
+                                            min_amounts_out=[min_limit(a, max_slippage) for a in amounts_out],
+                                            bpt_amount_in=bpt_amount_in, exit_token_index=exit_token_index)
+
+    def proportional_exit(self, avatar: Address, bpt_amount_in: int, max_slippage: float,
+                          assets: Optional[Sequence[Address]] = None) -> balancer.Exit:
+        _, amounts_out = self.query_proportional_exit(bpt_amount_in)
+        return self.proportional_exit_class(pool_id=self.pool_id, avatar=avatar, assets=list(assets or self.tokens),
+                                            min_amounts_out=[min_limit(a, max_slippage) for a in amounts_out],
+                                            bpt_amount_in=bpt_amount_in)
+
+    def custom_exit(self, avatar: Address, amounts_out: Sequence[int] | Mapping[Address, int], max_slippage: float,
+                    assets: Optional[Sequence[Address]] = None) -> balancer.Exit:
+        assets, amounts_out = self._assets_and_amounts(amounts_out, assets)
+        bpt_in, _ = self.query_custom_exit(amounts_out)
+        return self.custom_exit_class(pool_id=self.pool_id, avatar=avatar, assets=assets, amounts_out=amounts_out,
+                                      max_bpt_amount_in=max_limit(bpt_in, max_slippage))
+
+    def _single_asset_assets(self, token: int | Address, assets: Optional[Sequence[Address]]) -> list[Address]:
+        if assets is None and not isinstance(token, int):
+            return self.align({token: 0})[0]
+        return list(assets or self.tokens)
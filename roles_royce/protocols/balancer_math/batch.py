@@ -0,0 +1,109 @@
+"""Quote the joins and exits of a pool (StablePool or WeightedPool) for a whole grid of amounts at once.
+
+The results are bit-exact with the single quotes of the pool (and so with the pool contracts):
+the amounts are uint256 and the arithmetic has to be done on Python ints, numpy int64 arrays
+would overflow. The pool invariant and every term that does not depend on the amount are computed
+once for the grid, and the price impacts are computed with floats against the marginal price of
+the pool.
+
+Example::
+
+    quote = quote_single_asset_exits(pool, range(10 ** 18, 100 * 10 ** 18, 10 ** 18), exit_token_index=1)
+    best = max(range(len(quote)), key=lambda i: quote.outputs[i] if quote.price_impacts[i] < 0.005 else -1)
+
+numpy arrays are accepted as input; the outputs are then returned as numpy arrays too (an object
+array of Python ints for the amounts, a float64 array for the price impacts). The amounts for
+which the pool would revert (e.g. an exit of a few wei, or of more than the pool balance) have
+None as output and nan as price impact, instead of failing the whole grid.
+"""
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from .base_pool import BasePool
+from .fixed_point import BalancerMathError, div_down, mul_down
+
+NAN = float("nan")
+
+
+@dataclass
+class BatchQuote:
+    amounts: Any  # the quoted amounts, as given
+    outputs: Any  # the token amounts out of the exits or the BPT out of the joins, None where it reverts
+    price_impacts: Any  # one per amount, 0.01 is 1% less than at the marginal price (fees included)
+
+    def __len__(self):
+        return len(self.outputs)
+
+
+def _to_list(amounts) -> list:
+    return amounts.tolist() if hasattr(amounts, "tolist") else list(amounts)
+
+
+def _result(amounts, outputs: list[int], price_impacts: list[float]) -> BatchQuote:
+    if hasattr(amounts, "tolist"):
+        import numpy  # the amounts are a numpy array, so numpy is installed
+
+        return BatchQuote(amounts, numpy.array(outputs, dtype=object), numpy.array(price_impacts, dtype=float))
+    return BatchQuote(amounts, outputs, price_impacts)
+
+
+def quote_single_asset_exits(pool: BasePool, bpt_amounts_in, exit_token_index: int) -> BatchQuote:
+    """The amounts out of SingleAssetExits burning each of bpt_amounts_in.
+
+    outputs[k] is ``pool.query_single_asset_exit(bpt_amounts_in[k], exit_token_index)[1][exit_token_index]``.
+    """
+    pool._check_index(exit_token_index)
+    amounts = _to_list(bpt_amounts_in)
+    quote = pool._exit_quoter(exit_token_index)
+    scaling_factor = pool.scaling_factors[exit_token_index]
+    bpt_per_token = pool.marginal_bpt_per_token()[exit_token_index]
+
+    outputs, price_impacts = [], []
+    for bpt_amount_in in amounts:
+        try:
+            amount_out = quote(bpt_amount_in)
+        except BalancerMathError:
+            outputs.append(None)
+            price_impacts.append(NAN)
+            continue
+        outputs.append(div_down(amount_out, scaling_factor))
+        price_impacts.append(1 - amount_out * bpt_per_token / bpt_amount_in if bpt_amount_in else 0.0)
+    return _result(bpt_amounts_in, outputs, price_impacts)
+
+
+def quote_exact_tokens_joins(pool: BasePool, amounts_in) -> BatchQuote:
+    """The BPT out of ExactTokensJoins depositing each row of amounts_in (one amount per pool token).
+
+    outputs[k] is ``pool.query_exact_tokens_join(amounts_in[k])[0]``.
+    """
+    rows = _to_list(amounts_in)
+    quote = pool._join_quoter()
+    scaling_factors = pool.scaling_factors
+    bpt_per_token = pool.marginal_bpt_per_token()
+
+    outputs, price_impacts = [], []
+    for row in rows:
+        pool._check_amounts(row)
+        upscaled = [mul_down(a, f) for a, f in zip(row, scaling_factors)]
+        try:
+            bpt_out = quote(upscaled)
+        except BalancerMathError:
+            outputs.append(None)
+            price_impacts.append(NAN)
+            continue
+        outputs.append(bpt_out)
+        ideal_bpt_out = sum(amount * marginal for amount, marginal in zip(upscaled, bpt_per_token))
+        price_impacts.append(1 - bpt_out / ideal_bpt_out if ideal_bpt_out else 0.0)
+    return _result(amounts_in, outputs, price_impacts)
+
+
+def quote_single_token_joins(pool: BasePool, amounts_in, join_token_index: int) -> BatchQuote:
+    """quote_exact_tokens_joins depositing only the token at join_token_index, amounts_in is 1-D."""
+    pool._check_index(join_token_index)
+    rows = []
+    for amount in _to_list(amounts_in):
+        row = [0] * len(pool.tokens)
+        row[join_token_index] = amount
+        rows.append(row)
+    quote = quote_exact_tokens_joins(pool, rows)
+    return _result(amounts_in, quote.outputs, quote.price_impacts)
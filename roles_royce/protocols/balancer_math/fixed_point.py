@@ -0,0 +1,56 @@
+"""18 decimals fixed point arithmetic of the Balancer v2 contracts (FixedPoint.sol and Math.sol).
+
+The values are Python ints holding the fixed point numbers scaled by ONE, the rounding of every
+operation is the same as in the contracts so the results are bit-exact. Subtractions and
+divisions by zero raise BalancerMathError where the contracts revert; uint256 overflows are not
+checked, they are out of reach for real pool balances.
+"""
+ONE = 10 ** 18
+
+
+class BalancerMathError(ArithmeticError):
+    """The contracts would revert with this error (e.g. SUB_OVERFLOW)."""
+
+
+def sub(a: int, b: int) -> int:
+    if b > a:
+        raise BalancerMathError("SUB_OVERFLOW")
+    return a - b
+
+
+def mul_down(a: int, b: int) -> int:
+    return a * b // ONE
+
+
+def mul_up(a: int, b: int) -> int:
+    product = a * b
+    if product == 0:
+        return 0
+    return (product - 1) // ONE + 1
+
+
+def div_down(a: int, b: int) -> int:
+    if b == 0:
+        raise BalancerMathError("ZERO_DIVISION")
+    return a * ONE // b
+
+
+def div_up(a: int, b: int) -> int:
+    if b == 0:
+        raise BalancerMathError("ZERO_DIVISION")
+    if a == 0:
+        return 0
+    return (a * ONE - 1) // b + 1
+
+
+def complement(x: int) -> int:
+    return ONE - x if x < ONE else 0
+
+
+def int_div_up(a: int, b: int) -> int:
+    """Math.divUp: division of plain integers rounding up."""
+    if b == 0:
+        raise BalancerMathError("ZERO_DIVISION")
+    if a == 0:
+        return 0
+    return 1 + (a - 1) // b
@@ -0,0 +1,261 @@
+"""Port of LogExpMath.sol, the exponentiation of 18 decimals fixed point numbers of Balancer v2.
+
+Ref: https://github.com/balancer/balancer-v2-monorepo/blob/master/pkg/solidity-utils/contracts/math/LogExpMath.sol
+
+The contract works with int256 values, whose division truncates towards zero and whose modulo
+takes the sign of the dividend; _sdiv and _smod do the same with Python ints, so the results are
+bit-exact also for the negative logarithms of the numbers below one.
+"""
+from .fixed_point import BalancerMathError
+
+ONE_18 = 10 ** 18
+ONE_20 = 10 ** 20
+ONE_36 = 10 ** 36
+
+MAX_NATURAL_EXPONENT = 130 * ONE_18
+MIN_NATURAL_EXPONENT = -41 * ONE_18
+
+# Bounds for ln_36's argument. Both ln(0.9) and ln(1.1) can be represented with 36 decimal places in a fixed point
+# 256 bit integer.
+LN_36_LOWER_BOUND = ONE_18 - 10 ** 17
+LN_36_UPPER_BOUND = ONE_18 + 10 ** 17
+
+MILD_EXPONENT_BOUND = 2 ** 254 // ONE_20
+
+# 18 decimal constants
+x0 = 128000000000000000000  # 2ˆ7
+a0 = 38877084059945950922200000000000000000000000000000000000  # eˆ(x0) (no decimals)
+x1 = 64000000000000000000  # 2ˆ6
+a1 = 6235149080811616882910000000  # eˆ(x1) (no decimals)
+
+# 20 decimal constants
+x2 = 3200000000000000000000  # 2ˆ5
+a2 = 7896296018268069516100000000000000  # eˆ(x2)
+x3 = 1600000000000000000000  # 2ˆ4
+a3 = 888611052050787263676000000  # eˆ(x3)
+x4 = 800000000000000000000  # 2ˆ3
+a4 = 298095798704172827474000  # eˆ(x4)
+x5 = 400000000000000000000  # 2ˆ2
+a5 = 5459815003314423907810  # eˆ(x5)
+x6 = 200000000000000000000  # 2ˆ1
+a6 = 738905609893065022723  # eˆ(x6)
+x7 = 100000000000000000000  # 2ˆ0
+a7 = 271828182845904523536  # eˆ(x7)
+x8 = 50000000000000000000  # 2ˆ-1
+a8 = 164872127070012814685  # eˆ(x8)
+x9 = 25000000000000000000  # 2ˆ-2
+a9 = 128402541668774148407  # eˆ(x9)
+x10 = 12500000000000000000  # 2ˆ-3
+a10 = 113314845306682631683  # eˆ(x10)
+x11 = 6250000000000000000  # 2ˆ-4
+a11 = 106449445891785942956  # eˆ(x11)
+
+_EXP_STEPS = ((x2, a2), (x3, a3), (x4, a4), (x5, a5), (x6, a6), (x7, a7), (x8, a8), (x9, a9))
+_LN_STEPS = _EXP_STEPS + ((x10, a10), (x11, a11))
+
+
+def _sdiv(a: int, b: int) -> int:
+    """int256 division, truncating towards zero."""
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b > 0) else -q
+
+
+def _smod(a: int, b: int) -> int:
+    """int256 modulo, with the sign of the dividend."""
+    return a - _sdiv(a, b) * b
+
+
+def pow(x: int, y: int) -> int:
+    """x^y, both 18 decimals fixed point, computed as exp(y * ln(x))."""
+    if y == 0:
+        # We solve the 0^0 indetermination by making it equal one.
+        return ONE_18
+    if x == 0:
+        return 0
+    if x >> 255 != 0:
+        raise BalancerMathError("X_OUT_OF_BOUNDS")
+    if y >= MILD_EXPONENT_BOUND:
+        raise BalancerMathError("Y_OUT_OF_BOUNDS")
+
+    if LN_36_LOWER_BOUND < x < LN_36_UPPER_BOUND:
+        ln_36_x = _ln_36(x)
+        # ln_36_x has 36 decimal places, so multiplying by y_int256 isn't as straightforward, since we can't just
+        # bring y_int256 to 36 decimal places, as it might overflow. Instead, we perform two 18 decimal
+        # multiplications and add the results: one with the first 18 decimals of ln_36_x, and one with the
+        # (downscaled) last 18 decimals.
+        logx_times_y = _sdiv(ln_36_x, ONE_18) * y + _sdiv(_smod(ln_36_x, ONE_18) * y, ONE_18)
+    else:
+        logx_times_y = _ln(x) * y
+    logx_times_y = _sdiv(logx_times_y, ONE_18)
+
+    # Finally, we compute exp(y * ln(x)) to arrive at x^y
+    if not MIN_NATURAL_EXPONENT <= logx_times_y <= MAX_NATURAL_EXPONENT:
+        raise BalancerMathError("PRODUCT_OUT_OF_BOUNDS")
+    return exp(logx_times_y)
+
+
+def exp(x: int) -> int:
+    """e^x, x is 18 decimals fixed point."""
+    if not MIN_NATURAL_EXPONENT <= x <= MAX_NATURAL_EXPONENT:
+        raise BalancerMathError("INVALID_EXPONENT")
+
+    if x < 0:
+        # We only handle positive exponents: e^(-x) is computed as 1 / e^x. We can safely make x positive since it
+        # fits in the signed 256 bit range (as it is larger than MIN_NATURAL_EXPONENT).
+        # Fixed point division requires multiplying by ONE_18.
+        return _sdiv(ONE_18 * ONE_18, exp(-x))
+
+    # First, we use the fact that e^(x+y) = e^x * e^y to decompose x into a sum of powers of two, which we call x_n,
+    # where x_n == 2^(7 - n), and e^x_n = a_n has been precomputed. We choose the first x_n, x0, to equal 2^7
+    # because all larger powers are larger than MAX_NATURAL_EXPONENT, and therefore not present in the
+    # decomposition.
+    if x >= x0:
+        x -= x0
+        first_an = a0
+    elif x >= x1:
+        x -= x1
+        first_an = a1
+    else:
+        first_an = 1  # One with no decimal places
+
+    # We now transform x into a 20 decimal fixed point number, to have enhanced precision when computing the
+    # smaller terms.
+    x *= 100
+
+    # `product` is the accumulated product of all a_n (except a0 and a1), which starts at 20 decimal fixed point
+    # one. Recall that fixed point multiplication requires dividing by ONE_20.
+    product = ONE_20
+    for x_n, a_n in _EXP_STEPS:
+        if x >= x_n:
+            x -= x_n
+            product = product * a_n // ONE_20
+
+    # x10 and x11 are unnecessary here since we have high enough precision already.
+
+    # Now we need to compute e^x, where x is small (in particular, it is smaller than x9). We use the Taylor series
+    # expansion for e^x: 1 + x + (x^2 / 2!) + (x^3 / 3!) + ... + (x^n / n!).
+    series_sum = ONE_20  # The initial one in the sum, with 20 decimal places.
+    term = x  # Each term in the sum, where the nth term is (x^n / n!).
+    series_sum += term
+    # Each term (x^n / n!) equals the previous one times x, divided by n. Since x is a fixed point number,
+    # multiplying by it requires dividing by ONE_20, but dividing by the non-fixed point n values does not.
+    for n in range(2, 13):
+        term = term * x // ONE_20 // n
+        series_sum += term
+
+    # 12 Taylor terms are sufficient for 18 decimal precision.
+
+    # We now have the first a_n (with no decimals), and the product of all other a_n present, and the Taylor
+    # approximation of the exponentiation of the remainder (both with 20 decimals). All that remains is to multiply
+    # all three (one 20 decimal fixed point multiplication, dividing by ONE_20, and one integer multiplication),
+    # and then drop two digits to return an 18 decimal value.
+    return (product * series_sum // ONE_20) * first_an // 100
+
+
+def ln(a: int) -> int:
+    """Natural logarithm of a, 18 decimals fixed point."""
+    if a <= 0:
+        raise BalancerMathError("OUT_OF_BOUNDS")
+    if LN_36_LOWER_BOUND < a < LN_36_UPPER_BOUND:
+        return _sdiv(_ln_36(a), ONE_18)
+    return _ln(a)
+
+
+def _ln(a: int) -> int:
+    if a < ONE_18:
+        # Since ln(a^k) = k * ln(a), we can compute ln(a) as ln(a) = ln((1/a)^(-1)) = - ln((1/a)). If a is less
+        # than one, 1/a will be greater than one, and this if statement will not be entered in the recursive call.
+        # Fixed point division requires multiplying by ONE_18.
+        return -_ln(ONE_18 * ONE_18 // a)
+
+    # First, we use the fact that ln^(a * b) = ln(a) + ln(b) to decompose ln(a) into a sum of powers of two, which
+    # we call x_n, where x_n == 2^(7 - n), which are the natural logarithm of precomputed quantities a_n (that is,
+    # ln(a_n) = x_n). We choose the first x_n, x0, to equal 2^7 because the exponential of all larger powers cannot
+    # be represented as 18 fixed point decimal numbers in 256 bits, and are therefore larger than a.
+    # At the end of this process we will have the sum of all x_n = ln(a_n) that apply, and the remainder of this
+    # decomposition, which will be lower than the smallest a_n.
+    # ln(a) = k_0 * x_0 + k_1 * x_1 + ... + k_n * x_n + ln(remainder), where each k_n equals either 0 or 1.
+    # We mutate a by subtracting a_n, making it the remainder of the decomposition.
+
+    # For reasons related to how `exp` works, the first two a_n (e^(2^7) and e^(2^6)) are not stored as fixed point
+    # numbers with 18 decimals, but instead as plain integers with 0 decimals, so we need to multiply them by
+    # ONE_18 to convert them to fixed point.
+    # For each a_n, we test if that term is present in the decomposition (if a is larger than it), and if so divide
+    # by it and compute the accumulated sum.
+    total = 0
+    if a >= a0 * ONE_18:
+        a //= a0  # Integer, not fixed point division
+        total += x0
+    if a >= a1 * ONE_18:
+        a //= a1  # Integer, not fixed point division
+        total += x1
+
+    # All other a_n and x_n are stored as 20 digit fixed point numbers, so we convert the sum and a to this format.
+    total *= 100
+    a *= 100
+
+    # Because further a_n are  20 digit fixed point numbers, we multiply by ONE_20 when dividing by them.
+    for x_n, a_n in _LN_STEPS:
+        if a >= a_n:
+            a = a * ONE_20 // a_n
+            total += x_n
+
+    # a is now a small number (smaller than a_11, which roughly equals 1.06). This means we can use a Taylor series
+    # that converges rapidly for values of `a` close to one - the same one used in ln_36.
+    # Let z = (a - 1) / (a + 1).
+    # ln(a) = 2 * (z + z^3 / 3 + z^5 / 5 + z^7 / 7 + ... + z^(2 * n + 1) / (2 * n + 1))
+
+    # Recall that 20 digit fixed point division requires multiplying by ONE_20, and multiplication requires
+    # division by ONE_20.
+    z = (a - ONE_20) * ONE_20 // (a + ONE_20)
+    z_squared = z * z // ONE_20
+
+    # num is the numerator of the series: the z^(2 * n + 1) term
+    num = z
+    # series_sum holds the accumulated sum of each term in the series, starting with the initial z
+    series_sum = num
+    # In each step, the numerator is multiplied by z^2
+    for n in (3, 5, 7, 9, 11):
+        num = num * z_squared // ONE_20
+        series_sum += num // n
+
+    # 6 Taylor terms are sufficient for 36 decimal precision.
+
+    # Finally, we multiply by 2 (non fixed point) to compute ln(remainder)
+    series_sum *= 2
+
+    # We now have the sum of all x_n present, and the Taylor approximation of the logarithm of the remainder (both
+    # with 20 decimals). All that remains is to sum these two, and then drop two digits to return a 18 decimal
+    # value.
+    return (total + series_sum) // 100
+
+
+def _ln_36(x: int) -> int:
+    """ln(x) with 36 decimals of precision, for x close to one (between LN_36_LOWER_BOUND and LN_36_UPPER_BOUND)."""
+    # Since ln(1) = 0, a value of x close to one will yield a very small result, which makes using 36 digits
+    # worthwhile.
+
+    # First, we transform x to a 36 digit fixed point value.
+    x *= ONE_18
+
+    # We will use the following Taylor expansion, which converges very rapidly. Let z = (x - 1) / (x + 1).
+    # ln(x) = 2 * (z + z^3 / 3 + z^5 / 5 + z^7 / 7 + ... + z^(2 * n + 1) / (2 * n + 1))
+
+    # Recall that 36 digit fixed point division requires multiplying by ONE_36, and multiplication requires
+    # division by ONE_36.
+    z = _sdiv((x - ONE_36) * ONE_36, x + ONE_36)
+    z_squared = _sdiv(z * z, ONE_36)
+
+    # num is the numerator of the series: the z^(2 * n + 1) term
+    num = z
+    # series_sum holds the accumulated sum of each term in the series, starting with the initial z
+    series_sum = num
+    # In each step, the numerator is multiplied by z^2
+    for n in (3, 5, 7, 9, 11, 13, 15):
+        num = _sdiv(num * z_squared, ONE_36)
+        series_sum += _sdiv(num, n)
+
+    # 8 Taylor terms are sufficient for 36 decimal precision.
+
+    # All that remains is multiplying by 2 (non fixed point).
+    return series_sum * 2
@@ -0,0 +1,176 @@
+"""Cache of the state of Balancer pools per block, read with a single multicall for many pools.
+
+The stable pools are read as StablePools and the weighted pools as WeightedPools. The
+ComposableStable pools (those holding their own BPT as one of their tokens) have other join, exit
+and fee rules than the legacy StablePool math, reading one raises BalancerMathError.
+
+Example::
+
+    cache = PoolStateCache(w3, max_block_age=5)
+    pools = cache.get_many([pool_id_1, pool_id_2])  # one eth_call at the latest block
+    exit = pools[0].single_asset_exit(avatar, bpt_amount_in, exit_token_index=ETHAddr.WETH, max_slippage=0.01)
+
+The states are keyed by (pool_id, block_number); when a newer block is requested the states of
+the blocks more than ``max_block_age`` blocks older are evicted. The pools the math cannot model
+are cached as such too, ``get_many(..., skip_unsupported=True)`` leaves them out instead of raising.
+"""
+import threading
+from typing import Sequence
+
+from roles_royce.protocols.base import Method
+from roles_royce.protocols.eth import balancer
+from roles_royce.protocols.multicall import MULTICALL3_ADDRESS, call_many
+
+from .base_pool import BasePool, holds_own_bpt
+from .fixed_point import ONE, BalancerMathError
+from .stable_pool import StablePool
+from .weighted_pool import WeightedPool
+
+
+class _Decimals(Method):
+    name = "decimals"
+    out_signature = [("decimals", "uint8")]
+
+    def __init__(self, token: str):
+        super().__init__()
+        self.target_address = token
+
+
+def _pool_calls(pool_id: str) -> list:
+    # The type of the pool is told by which of getAmplificationParameter and getNormalizedWeights succeeds
+    return [balancer.GetPoolTokens(pool_id),
+            balancer.GetAmplificationParameter(pool_id),
+            balancer.GetNormalizedWeights(pool_id),
+            balancer.GetScalingFactors(pool_id),
+            balancer.GetSwapFeePercentage(pool_id),
+            balancer.TotalSupply(pool_id),
+            balancer.GetActualSupply(pool_id),
+            balancer.GetLastInvariant(pool_id),
+            balancer.GetWeightedLastInvariant(pool_id)]
+
+
+def _pool(pool_id: str, block_number: int, results: list, protocol_swap_fee: int) -> BasePool:
+    (pool_tokens, amp, normalized_weights, scaling_factors, swap_fee, total_supply, actual_supply,
+     stable_last_invariant, weighted_last_invariant) = results
+    if None in (pool_tokens, scaling_factors, swap_fee, total_supply):
+        raise ValueError(f"Could not read the state of the pool {pool_id} at block {block_number}")
+    if (amp, normalized_weights) == (None, None):
+        raise BalancerMathError(f"The pool {pool_id} is neither a stable nor a weighted pool, "
+                                f"its math is not supported")
+    tokens, balances, _ = pool_tokens
+    if holds_own_bpt(pool_id, tokens):
+        raise BalancerMathError(f"The pool {pool_id} holds its own BPT (a ComposableStable pool), "
+                                f"its math is not supported")
+    state = dict(pool_id=pool_id, tokens=tokens, balances=balances, scaling_factors=scaling_factors,
+                 swap_fee=swap_fee, block_number=block_number, protocol_swap_fee=protocol_swap_fee)
+    if amp is not None:
+        last_invariant, last_invariant_amp = stable_last_invariant or (0, 0)
+        return StablePool(amp=amp[0], total_supply=total_supply, last_invariant=last_invariant,
+                          last_invariant_amp=last_invariant_amp, **state)
+    # The pools with getActualSupply pay the protocol fees minting BPT, the first ones (legacy) in tokens
+    legacy = actual_supply is None
+    return WeightedPool(normalized_weights=normalized_weights, total_supply=total_supply if legacy else actual_supply,
+                        last_invariant=(weighted_last_invariant or 0) if legacy else 0, legacy=legacy, **state)
+
+
+class PoolStateCache:
+    def __init__(self, web3, max_block_age: int = 10, multicall_address: str = MULTICALL3_ADDRESS):
+        """
+        :param max_block_age: the states of blocks older than the last requested block by more than this are evicted
+        """
+        self.web3 = web3
+        self.max_block_age = max_block_age
+        self.multicall_address = multicall_address
+        # The pools the math cannot model have their BalancerMathError as state
+        self._states: dict[tuple[str, int], BasePool | BalancerMathError] = {}
+        self._last_block = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._states)
+
+    def get(self, pool_id: str, block_identifier: int | str = "latest") -> BasePool:
+        return self.get_many([pool_id], block_identifier)[0]
+
+    def get_many(self, pool_ids: Sequence[str], block_identifier: int | str = "latest",
+                 skip_unsupported: bool = False) -> list[BasePool]:
+        """The states of the pools at the block, reading those not cached in one multicall.
+
+        The pools the math cannot model (e.g. ComposableStable pools) raise BalancerMathError, or
+        are left out of the list with skip_unsupported.
+        """
+        block_number = self._block_number(block_identifier)
+        pool_ids = [pool_id.lower() for pool_id in pool_ids]
+        with self._lock:
+            missing = list(dict.fromkeys(p for p in pool_ids if (p, block_number) not in self._states))
+        if missing:
+            self._fetch(missing, block_number)
+        with self._lock:
+            self._evict(block_number)
+            states = [self._states[(pool_id, block_number)] for pool_id in pool_ids]
+        pools = []
+        for state in states:
+            if isinstance(state, BalancerMathError):
+                if skip_unsupported:
+                    continue
+                raise state
+            pools.append(state)
+        return pools
+
+    def evict(self, current_block: int):
+        """Drop the states of the blocks older than current_block - max_block_age."""
+        with self._lock:
+            self._evict(current_block)
+
+    def clear(self):
+        with self._lock:
+            self._states.clear()
+
+    def _block_number(self, block_identifier: int | str) -> int:
+        if isinstance(block_identifier, int):
+            return block_identifier
+        if block_identifier == "latest":
+            return self.web3.eth.block_number
+        return self.web3.eth.get_block(block_identifier)["number"]
+
+    def _fetch(self, pool_ids: list[str], block_number: int):
+        pool_calls = [_pool_calls(pool_id) for pool_id in pool_ids]
+        calls = [balancer.GetProtocolSwapFeePercentage()] + [call for calls in pool_calls for call in calls]
+        # The reads that some pools do not have (e.g. getLastInvariant) return None instead of reverting
+        results = call_many(self.web3, calls, block=block_number, allow_failure=True,
+                            multicall_address=self.multicall_address)
+        protocol_swap_fee = results[0] or 0
+        pool_results, start = [], 1
+        for reads in pool_calls:
+            pool_results.append(results[start:start + len(reads)])
+            start += len(reads)
+        self._read_missing_scaling_factors(pool_results, block_number)
+        states = {}
+        for pool_id, results in zip(pool_ids, pool_results):
+            try:
+                states[(pool_id, block_number)] = _pool(pool_id, block_number, results, protocol_swap_fee)
+            except BalancerMathError as e:
+                states[(pool_id, block_number)] = e
+        with self._lock:
+            self._states.update(states)
+
+    def _read_missing_scaling_factors(self, pool_results: list[list], block_number: int):
+        # The first weighted pools have no getScalingFactors, they only scale the decimals of the tokens
+        missing = [results for results in pool_results if results[0] is not None and results[3] is None]
+        if not missing:
+            return
+        tokens = list(dict.fromkeys(token for results in missing for token in results[0][0]))
+        decimals = call_many(self.web3, [_Decimals(token) for token in tokens], block=block_number,
+                             allow_failure=True, multicall_address=self.multicall_address)
+        decimals = dict(zip(tokens, decimals))
+        for results in missing:
+            if all(decimals[token] is not None for token in results[0][0]):
+                results[3] = [ONE * 10 ** (18 - decimals[token]) for token in results[0][0]]
+
+    def _evict(self, block_number: int):
+        if block_number <= self._last_block:
+            return
+        self._last_block = block_number
+        oldest = block_number - self.max_block_age
+        for key in [key for key in self._states if key[1] < oldest]:
+            del self._states[key]
@@ -0,0 +1,112 @@
+"""Search of multi-hop swap routes through Balancer pools, quoted offline with the pool math.
+
+The graph is built once per block from the pool states (e.g. from a PoolStateCache) and the
+route is encoded as a Vault batchSwap with its limits.
+
+Example::
+
+    graph = PoolGraph.from_cache(cache, pool_ids)
+    route = graph.find_route(ETHAddr.wstETH, ETHAddr.USDC, 10 ** 18, max_hops=3)
+    swap = route.batch_swap(avatar, max_slippage=0.005, deadline=deadline)
+
+The search keeps, after each hop, the best amount of each token reached and tries the pools out
+of it, so it is linear in the number of pools per hop. The last hop only tries the pools of the
+token out. A path does not use a pool twice nor goes back to a token it went through, as the
+quotes of the later hops would not see the balances changed by the earlier ones. The pools the
+math cannot model (the ComposableStable pools, holding their own BPT) are left out of the graph.
+"""
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from roles_royce.protocols.base import Address
+from roles_royce.protocols.eth import balancer
+
+from .base_pool import BasePool, holds_own_bpt, min_limit
+from .fixed_point import BalancerMathError
+from .pool_state import PoolStateCache
+
+
+@dataclass(frozen=True)
+class Route:
+    amount_in: int
+    amount_out: int
+    hops: tuple[tuple[BasePool, int, int], ...]  # (pool, token_in_index, token_out_index) of each swap
+
+    @property
+    def assets(self) -> list[Address]:
+        """The tokens the route goes through, from the token in to the token out."""
+        pool, token_in_index, _ = self.hops[0]
+        return [pool.tokens[token_in_index]] + [pool.tokens[token_out_index] for pool, _, token_out_index in self.hops]
+
+    @property
+    def pool_ids(self) -> list[str]:
+        return [pool.pool_id for pool, _, _ in self.hops]
+
+    def batch_swap(self, avatar: Address, max_slippage: float, deadline: int) -> balancer.BatchSwap:
+        """The GIVEN_IN batchSwap of the route, receiving at least amount_out less max_slippage."""
+        assets = self.assets
+        swaps = [(pool.pool_id, i, i + 1, self.amount_in if i == 0 else 0, b"")
+                 for i, (pool, _, _) in enumerate(self.hops)]
+        limits = [0] * len(assets)
+        limits[0] = self.amount_in
+        limits[-1] = -min_limit(self.amount_out, max_slippage)
+        return balancer.BatchSwap(avatar=avatar, kind=balancer.SwapKind.GIVEN_IN, swaps=swaps, assets=assets,
+                                  limits=limits, deadline=deadline)
+
+
+class PoolGraph:
+    def __init__(self, pools: Sequence[BasePool]):
+        self.pools = [pool for pool in pools if not holds_own_bpt(pool.pool_id, pool.tokens)]
+        # token -> [(pool, token_in_index, token_out_index, token_out)], tokens in lower case
+        self._edges: dict[str, list] = {}
+        # (token_in, token_out) -> the same edges, for the last hop
+        self._pairs: dict[tuple[str, str], list] = {}
+        for pool in self.pools:
+            tokens = [token.lower() for token in pool.tokens]
+            for i, token_in in enumerate(tokens):
+                for j, token_out in enumerate(tokens):
+                    if i == j:
+                        continue
+                    edge = (pool, i, j, token_out)
+                    self._edges.setdefault(token_in, []).append(edge)
+                    self._pairs.setdefault((token_in, token_out), []).append(edge)
+
+    @classmethod
+    def from_cache(cls, cache: PoolStateCache, pool_ids: Sequence[str],
+                   block_identifier: int | str = "latest") -> "PoolGraph":
+        """The graph of the pools at the block, reading from the PoolStateCache the pools it has not cached.
+
+        The pools the math cannot model are left out.
+        """
+        return cls(cache.get_many(pool_ids, block_identifier, skip_unsupported=True))
+
+    def find_route(self, token_in: Address, token_out: Address, amount_in: int, max_hops: int = 3) -> Optional[Route]:
+        """The route of at most max_hops swaps with the highest amount out, None if there is none."""
+        token_in, token_out = token_in.lower(), token_out.lower()
+        best: Optional[tuple[int, tuple]] = None
+        # token -> (amount, hops, tokens of the path) of the best path reaching it
+        layer = {token_in: (amount_in, (), {token_in})}
+        for hop in range(max_hops):
+            last_hop = hop == max_hops - 1
+            next_layer = {}
+            for token, (amount, hops, visited) in layer.items():
+                used_pools = {pool.pool_id for pool, _, _ in hops}
+                edges = self._pairs.get((token, token_out), ()) if last_hop else self._edges.get(token, ())
+                for pool, i, j, next_token in edges:
+                    if next_token in visited or pool.pool_id in used_pools:
+                        continue
+                    try:
+                        amount_out = pool.query_swap_given_in(i, j, amount)
+                    except BalancerMathError:
+                        continue  # the swap would revert, e.g. more than the pool's MAX_IN_RATIO
+                    if next_token == token_out:
+                        if best is None or amount_out > best[0]:
+                            best = (amount_out, hops + ((pool, i, j),))
+                    elif next_token not in next_layer or amount_out > next_layer[next_token][0]:
+                        next_layer[next_token] = (amount_out, hops + ((pool, i, j),), visited | {next_token})
+            if not next_layer:
+                break
+            layer = next_layer
+        if best is None:
+            return None
+        return Route(amount_in=amount_in, amount_out=best[0], hops=best[1])
@@ -0,0 +1,222 @@
+"""Port of the StableMath.sol of the legacy Balancer v2 StablePool and MetaStablePool contracts.
+
+Ref: pkg/pool-stable/contracts/StableMath.sol of https://github.com/balancer/balancer-v2-monorepo, as
+deployed with the StablePool and MetaStablePool factories (e.g. the wstETH/WETH pool 0x32296969...).
+These pools compute the invariant with ``_calculateInvariant(amp, balances, roundUp)``: the current
+invariant is rounded up and the new invariant of a join or exit is rounded down. The
+ComposableStablePools use a later version of the math, with other rounding, that is not ported.
+
+All the balances and amounts are upscaled to 18 decimals (see StablePool), ``amp`` is the
+amplification parameter times AMP_PRECISION as returned by ``getAmplificationParameter``.
+The functions do not modify the balances they are given. The ``invariant`` and
+``current_invariant`` arguments are ``calculate_invariant(amp, balances, round_up=True)``, which
+the contracts compute in the functions, given to compute it once for many quotes.
+"""
+from .fixed_point import ONE, BalancerMathError, complement, div_down, div_up, int_div_up, mul_down, mul_up, sub
+
+AMP_PRECISION = 1000
+MIN_AMP = 1
+MAX_AMP = 5000
+
+
+def _div(a: int, b: int, round_up: bool) -> int:
+    # Math.div
+    return int_div_up(a, b) if round_up else a // b
+
+
+def calculate_invariant(amp: int, balances: list[int], round_up: bool) -> int:
+    """The invariant D, computed with Newton's method rounding up or down."""
+    total = sum(balances)
+    if total == 0:
+        return 0
+    num_tokens = len(balances)
+    amp_times_total = amp * num_tokens
+    invariant = total
+    for _ in range(255):
+        p_d = balances[0] * num_tokens
+        for balance in balances[1:]:
+            p_d = _div(p_d * balance * num_tokens, invariant, round_up)
+        prev_invariant = invariant
+        invariant = _div(
+            num_tokens * invariant * invariant + _div(amp_times_total * total * p_d, AMP_PRECISION, round_up),
+            (num_tokens + 1) * invariant + _div((amp_times_total - AMP_PRECISION) * p_d, AMP_PRECISION, not round_up),
+            round_up)
+        if abs(invariant - prev_invariant) <= 1:
+            return invariant
+    raise BalancerMathError("STABLE_INVARIANT_DIDNT_CONVERGE")
+
+
+def get_token_balance_given_invariant_and_all_other_balances(amp: int, balances: list[int], invariant: int,
+                                                             token_index: int) -> int:
+    """The balance of the token that, with the other balances, gives the invariant (rounding up)."""
+    num_tokens = len(balances)
+    amp_times_total = amp * num_tokens
+    total = balances[0]
+    p_d = balances[0] * num_tokens
+    for balance in balances[1:]:
+        p_d = p_d * balance * num_tokens // invariant
+        total += balance
+    total -= balances[token_index]
+
+    inv2 = invariant * invariant
+    # We remove the balance from c by multiplying it
+    c = int_div_up(inv2, amp_times_total * p_d) * AMP_PRECISION * balances[token_index]
+    b = total + invariant // amp_times_total * AMP_PRECISION
+
+    token_balance = int_div_up(inv2 + c, invariant + b)
+    for _ in range(255):
+        prev_token_balance = token_balance
+        token_balance = int_div_up(token_balance * token_balance + c, sub(token_balance * 2 + b, invariant))
+        if abs(token_balance - prev_token_balance) <= 1:
+            return token_balance
+    raise BalancerMathError("STABLE_GET_BALANCE_DIDNT_CONVERGE")
+
+
+def calc_out_given_in(amp: int, balances: list[int], token_index_in: int, token_index_out: int,
+                      token_amount_in: int, invariant: int) -> int:
+    """Amount out of a swap given the amount in, before fees."""
+    balances = list(balances)
+    balances[token_index_in] += token_amount_in
+    final_balance_out = get_token_balance_given_invariant_and_all_other_balances(amp, balances, invariant,
+                                                                                 token_index_out)
+    return sub(sub(balances[token_index_out], final_balance_out), 1)
+
+
+def calc_in_given_out(amp: int, balances: list[int], token_index_in: int, token_index_out: int,
+                      token_amount_out: int, invariant: int) -> int:
+    """Amount in of a swap given the amount out, before fees."""
+    balances = list(balances)
+    balances[token_index_out] = sub(balances[token_index_out], token_amount_out)
+    final_balance_in = get_token_balance_given_invariant_and_all_other_balances(amp, balances, invariant,
+                                                                                token_index_in)
+    return sub(final_balance_in, balances[token_index_in]) + 1
+
+
+def calc_bpt_out_given_exact_tokens_in(amp: int, balances: list[int], amounts_in: list[int], bpt_total_supply: int,
+                                       current_invariant: int, swap_fee_percentage: int) -> int:
+    # BPT out, so we round down overall.
+    sum_balances = sum(balances)
+    # Calculate the weighted balance ratio without considering fees
+    balance_ratios_with_fee = []
+    invariant_ratio_with_fees = 0
+    for balance, amount_in in zip(balances, amounts_in):
+        current_weight = div_down(balance, sum_balances)
+        ratio = div_down(balance + amount_in, balance)
+        balance_ratios_with_fee.append(ratio)
+        invariant_ratio_with_fees += mul_down(ratio, current_weight)
+
+    # Second loop calculates new amounts in, taking into account the fee on the percentage excess
+    new_balances = []
+    for balance, amount_in, ratio in zip(balances, amounts_in, balance_ratios_with_fee):
+        # Check if the balance ratio is greater than the ideal ratio to charge fees or not
+        if ratio > invariant_ratio_with_fees:
+            non_taxable_amount = mul_down(balance, sub(invariant_ratio_with_fees, ONE))
+            taxable_amount = sub(amount_in, non_taxable_amount)
+            amount_in_without_fee = non_taxable_amount + mul_down(taxable_amount, sub(ONE, swap_fee_percentage))
+        else:
+            amount_in_without_fee = amount_in
+        new_balances.append(balance + amount_in_without_fee)
+
+    new_invariant = calculate_invariant(amp, new_balances, round_up=False)
+    invariant_ratio = div_down(new_invariant, current_invariant)
+    # If the invariant didn't increase for any reason, we simply don't mint BPT
+    if invariant_ratio > ONE:
+        return mul_down(bpt_total_supply, invariant_ratio - ONE)
+    return 0
+
+
+def calc_token_in_given_exact_bpt_out(amp: int, balances: list[int], token_index: int, bpt_amount_out: int,
+                                      bpt_total_supply: int, current_invariant: int, swap_fee_percentage: int) -> int:
+    # Token in, so we round up overall.
+    new_invariant = mul_up(div_up(bpt_total_supply + bpt_amount_out, bpt_total_supply), current_invariant)
+    # Calculate amount in without fee.
+    new_balance_token_index = get_token_balance_given_invariant_and_all_other_balances(amp, balances, new_invariant,
+                                                                                       token_index)
+    amount_in_without_fee = sub(new_balance_token_index, balances[token_index])
+
+    # First calculate the sum of all token balances, which will be used to calculate
+    # the current weight of each token
+    current_weight = div_down(balances[token_index], sum(balances))
+    taxable_percentage = complement(current_weight)
+    taxable_amount = mul_up(amount_in_without_fee, taxable_percentage)
+    non_taxable_amount = sub(amount_in_without_fee, taxable_amount)
+    return non_taxable_amount + div_up(taxable_amount, sub(ONE, swap_fee_percentage))
+
+
+def calc_bpt_in_given_exact_tokens_out(amp: int, balances: list[int], amounts_out: list[int], bpt_total_supply: int,
+                                       current_invariant: int, swap_fee_percentage: int) -> int:
+    # BPT in, so we round up overall.
+    sum_balances = sum(balances)
+    # Calculate the weighted balance ratio without considering fees
+    balance_ratios_without_fee = []
+    invariant_ratio_without_fees = 0
+    for balance, amount_out in zip(balances, amounts_out):
+        current_weight = div_up(balance, sum_balances)
+        ratio = div_up(sub(balance, amount_out), balance)
+        balance_ratios_without_fee.append(ratio)
+        invariant_ratio_without_fees += mul_up(ratio, current_weight)
+
+    # Second loop calculates new amounts in, taking into account the fee on the percentage excess
+    new_balances = []
+    for balance, amount_out, ratio in zip(balances, amounts_out, balance_ratios_without_fee):
+        # Swap fees are typically charged on 'token in', but there is no 'token in' here, so we apply it to
+        # 'token out'. This results in slightly larger price impact.
+        if invariant_ratio_without_fees > ratio:
+            non_taxable_amount = mul_down(balance, complement(invariant_ratio_without_fees))
+            taxable_amount = sub(amount_out, non_taxable_amount)
+            amount_out_with_fee = non_taxable_amount + div_up(taxable_amount, sub(ONE, swap_fee_percentage))
+        else:
+            amount_out_with_fee = amount_out
+        new_balances.append(sub(balance, amount_out_with_fee))
+
+    new_invariant = calculate_invariant(amp, new_balances, round_up=False)
+    invariant_ratio = div_down(new_invariant, current_invariant)
+    # return amountBPTIn
+    return mul_up(bpt_total_supply, complement(invariant_ratio))
+
+
+def calc_token_out_given_exact_bpt_in(amp: int, balances: list[int], token_index: int, bpt_amount_in: int,
+                                      bpt_total_supply: int, current_invariant: int, swap_fee_percentage: int) -> int:
+    # Token out, so we round down overall.
+    new_invariant = mul_up(div_up(sub(bpt_total_supply, bpt_amount_in), bpt_total_supply), current_invariant)
+    # Calculate amount out without fee
+    new_balance_token_index = get_token_balance_given_invariant_and_all_other_balances(amp, balances, new_invariant,
+                                                                                       token_index)
+    amount_out_without_fee = sub(balances[token_index], new_balance_token_index)
+
+    # First calculate the sum of all token balances, which will be used to calculate
+    # the current weight of each token
+    current_weight = div_down(balances[token_index], sum(balances))
+    taxable_percentage = complement(current_weight)
+    # Swap fees are typically charged on 'token in', but there is no 'token in' here, so we apply it
+    # to 'token out'. This results in slightly larger price impact. Fees are rounded up.
+    taxable_amount = mul_up(amount_out_without_fee, taxable_percentage)
+    non_taxable_amount = sub(amount_out_without_fee, taxable_amount)
+    return non_taxable_amount + mul_down(taxable_amount, sub(ONE, swap_fee_percentage))
+
+
+def calc_tokens_out_given_exact_bpt_in(balances: list[int], bpt_amount_in: int, bpt_total_supply: int) -> list[int]:
+    """Proportional exit (BasePoolMath.computeProportionalAmountsOut), no fees."""
+    bpt_ratio = div_down(bpt_amount_in, bpt_total_supply)
+    return [mul_down(balance, bpt_ratio) for balance in balances]
+
+
+def calc_tokens_in_given_exact_bpt_out(balances: list[int], bpt_amount_out: int, bpt_total_supply: int) -> list[int]:
+    """Proportional join (BasePoolMath.computeProportionalAmountsIn), no fees."""
+    bpt_ratio = div_up(bpt_amount_out, bpt_total_supply)
+    return [mul_up(balance, bpt_ratio) for balance in balances]
+
+
+def calc_due_token_protocol_swap_fee_amount(amp: int, balances: list[int], last_invariant: int, token_index: int,
+                                            protocol_swap_fee_percentage: int) -> int:
+    """The protocol fee, in the token, on the swap fees accrued since the invariant was last_invariant."""
+    # We calculate the balance of the token that gives the last invariant with the current balances,
+    # the difference are the swap fees accrued since then.
+    final_balance_fee_token = get_token_balance_given_invariant_and_all_other_balances(amp, balances, last_invariant,
+                                                                                       token_index)
+    if balances[token_index] <= final_balance_fee_token:
+        # This shouldn't happen outside of rounding errors, but have this safeguard nonetheless to prevent the Pool
+        # from entering a locked state in which joins and exits revert while computing accumulated swap fees.
+        return 0
+    accumulated_token_swap_fees = balances[token_index] - final_balance_fee_token
+    return mul_down(accumulated_token_swap_fees, protocol_swap_fee_percentage)
@@ -0,0 +1,116 @@
+"""Offline quotes of the joins and exits of Balancer v2 (Meta)StablePools.
+
+A StablePool holds the state of a pool at a block (``Vault.getPoolTokens``,
+``getAmplificationParameter``, ``getScalingFactors``, ``getSwapFeePercentage``, ``totalSupply``
+and, for the protocol fees, ``getLastInvariant``), see BasePool for the queries and builders.
+
+Example::
+
+    pool = StablePool(pool_id=pool_id, tokens=tokens, balances=balances, scaling_factors=scaling_factors,
+                      amp=amp, swap_fee=swap_fee, total_supply=total_supply)
+    bpt_in, amounts_out = pool.query_single_asset_exit(bpt_amount_in, exit_token_index=1)
+    exit = pool.single_asset_exit(avatar, bpt_amount_in, exit_token_index=1, max_slippage=0.01)
+
+The flow follows the legacy StablePool and MetaStablePool contracts; ComposableStablePools (with
+their BPT in the pool tokens) are not supported.
+"""
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable
+
+from . import stable_math
+from .base_pool import BasePool, max_limit, min_limit  # noqa: F401 (min_limit and max_limit were defined here)
+from .fixed_point import ONE, div_down, div_up, mul_down, mul_up, sub
+
+
+@dataclass(frozen=True, kw_only=True)
+class StablePool(BasePool):
+    amp: int  # getAmplificationParameter value, already multiplied by its precision
+    last_invariant_amp: int = 0
+
+    def _upscaled_balances(self, balances: list[int]) -> list[int]:
+        if self.last_invariant and self.protocol_swap_fee:
+            # The fees are paid in the token with the highest balance
+            index = balances.index(max(balances))
+            due_fee = stable_math.calc_due_token_protocol_swap_fee_amount(
+                self.last_invariant_amp or self.amp, balances, self.last_invariant, index, self.protocol_swap_fee)
+            balances[index] = sub(balances[index], due_fee)
+        return balances
+
+    @cached_property
+    def invariant(self) -> int:
+        return stable_math.calculate_invariant(self.amp, self.upscaled_balances, round_up=True)
+
+    @cached_property
+    def swap_invariant(self) -> int:
+        return stable_math.calculate_invariant(self.amp, self.swap_balances, round_up=True)
+
+    def _swap_given_in(self, token_in_index: int, token_out_index: int, amount_in: int) -> int:
+        return stable_math.calc_out_given_in(self.amp, self.swap_balances, token_in_index, token_out_index, amount_in,
+                                             self.swap_invariant)
+
+    def _bpt_out_given_exact_tokens_in(self, amounts_in: list[int]) -> int:
+        return stable_math.calc_bpt_out_given_exact_tokens_in(self.amp, self.upscaled_balances, amounts_in,
+                                                              self.total_supply, self.invariant, self.swap_fee)
+
+    def _token_in_given_exact_bpt_out(self, token_index: int, bpt_amount_out: int) -> int:
+        return stable_math.calc_token_in_given_exact_bpt_out(self.amp, self.upscaled_balances, token_index,
+                                                             bpt_amount_out, self.total_supply, self.invariant,
+                                                             self.swap_fee)
+
+    def _bpt_in_given_exact_tokens_out(self, amounts_out: list[int]) -> int:
+        return stable_math.calc_bpt_in_given_exact_tokens_out(self.amp, self.upscaled_balances, amounts_out,
+                                                              self.total_supply, self.invariant, self.swap_fee)
+
+    def _token_out_given_exact_bpt_in(self, token_index: int, bpt_amount_in: int) -> int:
+        return stable_math.calc_token_out_given_exact_bpt_in(self.amp, self.upscaled_balances, token_index,
+                                                             bpt_amount_in, self.total_supply, self.invariant,
+                                                             self.swap_fee)
+
+    def _exit_quoter(self, exit_token_index: int) -> Callable[[int], int]:
+        # stable_math.calc_token_out_given_exact_bpt_in with the terms of the pool state computed once
+        amp, balances, invariant, total_supply = self.amp, self.upscaled_balances, self.invariant, self.total_supply
+        balance = balances[exit_token_index]
+        taxable_percentage = ONE - div_down(balance, sum(balances))
+        fee_complement = sub(ONE, self.swap_fee)
+        get_balance = stable_math.get_token_balance_given_invariant_and_all_other_balances
+
+        def quote(bpt_amount_in: int) -> int:
+            new_invariant = mul_up(div_up(sub(total_supply, bpt_amount_in), total_supply), invariant)
+            amount_out_without_fee = sub(balance, get_balance(amp, balances, new_invariant, exit_token_index))
+            taxable_amount = mul_up(amount_out_without_fee, taxable_percentage)
+            return amount_out_without_fee - taxable_amount + mul_down(taxable_amount, fee_complement)
+        return quote
+
+    def _join_quoter(self) -> Callable[[list[int]], int]:
+        # stable_math.calc_bpt_out_given_exact_tokens_in with the terms of the pool state computed once
+        amp, balances, invariant, total_supply = self.amp, self.upscaled_balances, self.invariant, self.total_supply
+        sum_balances = sum(balances)
+        weights = [div_down(balance, sum_balances) for balance in balances]
+        fee_complement = sub(ONE, self.swap_fee)
+
+        def quote(amounts_in: list[int]) -> int:
+            ratios = [div_down(balance + amount, balance) for balance, amount in zip(balances, amounts_in)]
+            invariant_ratio_with_fees = sum(mul_down(ratio, weight) for ratio, weight in zip(ratios, weights))
+            new_balances = []
+            for balance, amount, ratio in zip(balances, amounts_in, ratios):
+                if ratio > invariant_ratio_with_fees:
+                    non_taxable_amount = mul_down(balance, sub(invariant_ratio_with_fees, ONE))
+                    amount = non_taxable_amount + mul_down(sub(amount, non_taxable_amount), fee_complement)
+                new_balances.append(balance + amount)
+            invariant_ratio = div_down(stable_math.calculate_invariant(amp, new_balances, round_up=False), invariant)
+            return mul_down(total_supply, invariant_ratio - ONE) if invariant_ratio > ONE else 0
+        return quote
+
+    def marginal_bpt_per_token(self) -> list[float]:
+        # The derivative of the invariant, by finite differences of the invariant rounded down
+        balances = self.upscaled_balances
+        step = max(sum(balances) // 10 ** 9, 1)
+        invariant = stable_math.calculate_invariant(self.amp, balances, round_up=False)
+        marginals = []
+        for i in range(len(balances)):
+            bumped = list(balances)
+            bumped[i] += step
+            d_invariant = stable_math.calculate_invariant(self.amp, bumped, round_up=False) - invariant
+            marginals.append(self.total_supply * d_invariant / (invariant * step))
+        return marginals
@@ -0,0 +1,236 @@
+"""Port of WeightedMath.sol of the Balancer v2 weighted pools.
+
+Ref: https://github.com/balancer/balancer-v2-monorepo/blob/master/pkg/pool-weighted/contracts/WeightedMath.sol
+
+All the balances and amounts are upscaled to 18 decimals (see WeightedPool) and the weights are
+the normalized weights, 18 decimals fixed point adding up to ONE. The functions do not modify the
+balances they are given.
+
+The newer pools compute the powers of exponent 1, 2 and 4 with multiplications, the first
+weighted pools (e.g. WeightedPool2Tokens) always go through LogExpMath.pow and its error bound:
+their math is the one with ``legacy=True``.
+"""
+from . import log_exp_math
+from .fixed_point import ONE, BalancerMathError, complement, div_down, div_up, mul_down, mul_up, sub
+
+# Swap limits: amounts swapped may not be larger than this percentage of total balance.
+MAX_IN_RATIO = 3 * 10 ** 17
+MAX_OUT_RATIO = 3 * 10 ** 17
+
+# Invariant growth limit: non-proportional joins cannot cause the invariant to increase by more than this ratio.
+MAX_INVARIANT_RATIO = 3 * ONE
+# Invariant shrink limit: non-proportional exits cannot cause the invariant to decrease by less than this ratio.
+MIN_INVARIANT_RATIO = 7 * 10 ** 17
+
+# FixedPoint.powDown / powUp: the relative error of LogExpMath.pow is bounded by 10^(-14)
+MAX_POW_RELATIVE_ERROR = 10000
+MIN_POW_BASE_FREE_EXPONENT = 7 * 10 ** 17
+TWO = 2 * ONE
+FOUR = 4 * ONE
+
+
+def pow_down(x: int, y: int, legacy: bool = False) -> int:
+    """x^y rounding down, the exponents 1, 2 and 4 are computed with multiplications unless legacy."""
+    if not legacy:
+        if y == ONE:
+            return x
+        if y == TWO:
+            return mul_down(x, x)
+        if y == FOUR:
+            square = mul_down(x, x)
+            return mul_down(square, square)
+    raw = log_exp_math.pow(x, y)
+    max_error = mul_up(raw, MAX_POW_RELATIVE_ERROR) + 1
+    return 0 if raw < max_error else raw - max_error
+
+
+def pow_up(x: int, y: int, legacy: bool = False) -> int:
+    """x^y rounding up, the exponents 1, 2 and 4 are computed with multiplications unless legacy."""
+    if not legacy:
+        if y == ONE:
+            return x
+        if y == TWO:
+            return mul_up(x, x)
+        if y == FOUR:
+            square = mul_up(x, x)
+            return mul_up(square, square)
+    raw = log_exp_math.pow(x, y)
+    return raw + mul_up(raw, MAX_POW_RELATIVE_ERROR) + 1
+
+
+def calculate_invariant(normalized_weights: list[int], balances: list[int], legacy: bool = False) -> int:
+    """invariant = prod(balance_i ^ weight_i), rounding down."""
+    invariant = ONE
+    for weight, balance in zip(normalized_weights, balances):
+        invariant = mul_down(invariant, pow_down(balance, weight, legacy))
+    if invariant == 0:
+        raise BalancerMathError("ZERO_INVARIANT")
+    return invariant
+
+
+def calc_out_given_in(balance_in: int, weight_in: int, balance_out: int, weight_out: int, amount_in: int,
+                      legacy: bool = False) -> int:
+    """Amount out of a swap given the amount in, before fees."""
+    if amount_in > mul_down(balance_in, MAX_IN_RATIO):
+        raise BalancerMathError("MAX_IN_RATIO")
+    denominator = balance_in + amount_in
+    base = div_up(balance_in, denominator)
+    exponent = div_down(weight_in, weight_out)
+    power = pow_up(base, exponent, legacy)
+    return mul_down(balance_out, complement(power))
+
+
+def calc_in_given_out(balance_in: int, weight_in: int, balance_out: int, weight_out: int, amount_out: int,
+                      legacy: bool = False) -> int:
+    """Amount in of a swap given the amount out, before fees."""
+    if amount_out > mul_down(balance_out, MAX_OUT_RATIO):
+        raise BalancerMathError("MAX_OUT_RATIO")
+    base = div_up(balance_out, sub(balance_out, amount_out))
+    exponent = div_up(weight_out, weight_in)
+    power = pow_up(base, exponent, legacy)
+    # Because the base is larger than one (and the power rounds up), the power should always be larger than one, so
+    # the following subtraction should never revert.
+    ratio = sub(power, ONE)
+    return mul_up(balance_in, ratio)
+
+
+def calc_bpt_out_given_exact_tokens_in(balances: list[int], normalized_weights: list[int], amounts_in: list[int],
+                                       bpt_total_supply: int, swap_fee_percentage: int, legacy: bool = False) -> int:
+    # BPT out, so we round down overall.
+    balance_ratios_with_fee = []
+    invariant_ratio_with_fees = 0
+    for balance, weight, amount_in in zip(balances, normalized_weights, amounts_in):
+        ratio = div_down(balance + amount_in, balance)
+        balance_ratios_with_fee.append(ratio)
+        invariant_ratio_with_fees += mul_down(ratio, weight)
+
+    invariant_ratio = ONE
+    for balance, weight, amount_in, ratio in zip(balances, normalized_weights, amounts_in, balance_ratios_with_fee):
+        if ratio > invariant_ratio_with_fees:
+            # invariantRatioWithFees might be less than FixedPoint.ONE in edge scenarios due to rounding error,
+            # particularly if the weights don't exactly add up to 100%.
+            non_taxable_amount = (mul_down(balance, invariant_ratio_with_fees - ONE)
+                                  if invariant_ratio_with_fees > ONE else 0)
+            swap_fee = mul_up(sub(amount_in, non_taxable_amount), swap_fee_percentage)
+            amount_in_without_fee = sub(amount_in, swap_fee)
+        else:
+            amount_in_without_fee = amount_in
+            # If a token's amount in is not being charged a swap fee then it might be zero (e.g. when joining a
+            # Pool with only a subset of tokens). In this case, `balanceRatio` will equal `FixedPoint.ONE`, and
+            # the `invariantRatio` will not change at all. We therefore skip to the next iteration, avoiding
+            # the costly `powDown` call.
+            if amount_in_without_fee == 0:
+                continue
+        balance_ratio = div_down(balance + amount_in_without_fee, balance)
+        invariant_ratio = mul_down(invariant_ratio, pow_down(balance_ratio, weight, legacy))
+
+    if invariant_ratio > ONE:
+        return mul_down(bpt_total_supply, invariant_ratio - ONE)
+    return 0
+
+
+def calc_token_in_given_exact_bpt_out(balance: int, normalized_weight: int, bpt_amount_out: int,
+                                      bpt_total_supply: int, swap_fee_percentage: int, legacy: bool = False) -> int:
+    # Token in, so we round up overall.
+
+    # Calculate the factor by which the invariant will increase after minting BPTAmountOut
+    invariant_ratio = div_up(bpt_total_supply + bpt_amount_out, bpt_total_supply)
+    if invariant_ratio > MAX_INVARIANT_RATIO:
+        raise BalancerMathError("MAX_OUT_BPT_FOR_TOKEN_IN")
+
+    # Calculate by how much the token balance has to increase to match the invariantRatio
+    balance_ratio = pow_up(invariant_ratio, div_up(ONE, normalized_weight), legacy)
+    amount_in_without_fee = mul_up(balance, sub(balance_ratio, ONE))
+
+    # We can now compute how much extra balance is being deposited and used in virtual swaps, and charge swap fees
+    # accordingly.
+    taxable_amount = mul_up(amount_in_without_fee, complement(normalized_weight))
+    non_taxable_amount = sub(amount_in_without_fee, taxable_amount)
+    taxable_amount_plus_fees = div_up(taxable_amount, complement(swap_fee_percentage))
+    return non_taxable_amount + taxable_amount_plus_fees
+
+
+def calc_bpt_in_given_exact_tokens_out(balances: list[int], normalized_weights: list[int], amounts_out: list[int],
+                                       bpt_total_supply: int, swap_fee_percentage: int, legacy: bool = False) -> int:
+    # BPT in, so we round up overall.
+    balance_ratios_without_fee = []
+    invariant_ratio_without_fees = 0
+    for balance, weight, amount_out in zip(balances, normalized_weights, amounts_out):
+        ratio = div_up(sub(balance, amount_out), balance)
+        balance_ratios_without_fee.append(ratio)
+        invariant_ratio_without_fees += mul_up(ratio, weight)
+
+    invariant_ratio = ONE
+    for balance, weight, amount_out, ratio in zip(balances, normalized_weights, amounts_out,
+                                                  balance_ratios_without_fee):
+        # Swap fees are typically charged on 'token in', but there is no 'token in' here, so we apply it to
+        # 'token out'. This results in slightly larger price impact.
+        if invariant_ratio_without_fees > ratio:
+            non_taxable_amount = mul_down(balance, complement(invariant_ratio_without_fees))
+            taxable_amount = sub(amount_out, non_taxable_amount)
+            taxable_amount_plus_fees = div_up(taxable_amount, complement(swap_fee_percentage))
+            amount_out_with_fee = non_taxable_amount + taxable_amount_plus_fees
+        else:
+            amount_out_with_fee = amount_out
+            # If a token's amount out is not being charged a swap fee then it might be zero (e.g. when exiting a
+            # Pool with only a subset of tokens). In this case, `balanceRatio` will equal `FixedPoint.ONE`, and
+            # the `invariantRatio` will not change at all. We therefore skip to the next iteration, avoiding
+            # the costly `powDown` call.
+            if amount_out_with_fee == 0:
+                continue
+        balance_ratio = div_down(sub(balance, amount_out_with_fee), balance)
+        invariant_ratio = mul_down(invariant_ratio, pow_down(balance_ratio, weight, legacy))
+
+    return mul_up(bpt_total_supply, complement(invariant_ratio))
+
+
+def calc_token_out_given_exact_bpt_in(balance: int, normalized_weight: int, bpt_amount_in: int,
+                                      bpt_total_supply: int, swap_fee_percentage: int, legacy: bool = False) -> int:
+    # Token out, so we round down overall.
+
+    # Calculate the factor by which the invariant will decrease after burning BPTAmountIn
+    invariant_ratio = div_up(sub(bpt_total_supply, bpt_amount_in), bpt_total_supply)
+    if invariant_ratio < MIN_INVARIANT_RATIO:
+        raise BalancerMathError("MIN_BPT_IN_FOR_TOKEN_OUT")
+
+    # Calculate by how much the token balance has to decrease to match invariantRatio
+    balance_ratio = pow_up(invariant_ratio, div_down(ONE, normalized_weight), legacy)
+
+    # Because of rounding up, balanceRatio can be greater than one. Using complement prevents reverts.
+    amount_out_without_fee = mul_down(balance, complement(balance_ratio))
+
+    # We can now compute how much excess balance is being withdrawn as a result of the virtual swaps, which result
+    # in swap fees.
+
+    # Swap fees are typically charged on 'token in', but there is no 'token in' here, so we apply it
+    # to 'token out'. This results in slightly larger price impact. Fees are rounded up.
+    taxable_amount = mul_up(amount_out_without_fee, complement(normalized_weight))
+    non_taxable_amount = sub(amount_out_without_fee, taxable_amount)
+    taxable_amount_minus_fees = mul_down(taxable_amount, complement(swap_fee_percentage))
+    return non_taxable_amount + taxable_amount_minus_fees
+
+
+def calc_due_token_protocol_swap_fee_amount(balance: int, normalized_weight: int, previous_invariant: int,
+                                            current_invariant: int, protocol_swap_fee_percentage: int,
+                                            legacy: bool = False) -> int:
+    """The protocol fee, in the token, on the swap fees accrued since the invariant was previous_invariant.
+
+    Only the first weighted pools pay the protocol fees in tokens, the newer ones mint BPT instead.
+    """
+    if current_invariant <= previous_invariant:
+        # This shouldn't happen outside of rounding errors, but have this safeguard nonetheless to prevent the Pool
+        # from entering a locked state in which joins and exits revert while computing accumulated swap fees.
+        return 0
+
+    # We round down to prevent issues in the Pool's accounting, even if it means paying slightly less in protocol
+    # fees to the Vault.
+    base = div_up(previous_invariant, current_invariant)
+    exponent = div_down(ONE, normalized_weight)
+
+    # Because the exponent is larger than one, the base of the power function has a lower bound. We cap to this
+    # value to avoid numeric issues, which means in the extreme case (where the invariant growth is larger than
+    # 1 / min exponent) the Pool will pay less in protocol fees than it should.
+    base = max(base, MIN_POW_BASE_FREE_EXPONENT)
+    power = pow_up(base, exponent, legacy)
+    token_accrued_fees = mul_down(balance, complement(power))
+    return mul_down(token_accrued_fees, protocol_swap_fee_percentage)
@@ -0,0 +1,94 @@
+"""Offline quotes of the joins and exits of Balancer v2 WeightedPools.
+
+A WeightedPool holds the state of a pool at a block (``Vault.getPoolTokens``,
+``getNormalizedWeights``, ``getScalingFactors``, ``getSwapFeePercentage``, the supply and, for the
+first weighted pools, ``getLastInvariant``), see BasePool for the queries and builders, which
+return the Weighted* joins and exits of roles_royce.protocols.eth.balancer.
+
+Example::
+
+    pool = WeightedPool(pool_id=pool_id, tokens=tokens, balances=balances, scaling_factors=scaling_factors,
+                        normalized_weights=weights, swap_fee=swap_fee, total_supply=actual_supply)
+    bpt_out, amounts_in = pool.query_exact_tokens_join([10 ** 18, 0])
+
+The first weighted pools pay the protocol fees in the token with the highest weight before each
+join or exit, they are accounted when last_invariant and protocol_swap_fee are given. The newer
+pools pay them minting BPT, pass their ``getActualSupply`` as total_supply instead. The first
+pools also compute every power with LogExpMath (see weighted_math), set legacy for them; it is
+implied by last_invariant.
+"""
+from dataclasses import dataclass
+from functools import cached_property
+
+from roles_royce.protocols.eth import balancer
+
+from . import weighted_math
+from .base_pool import BasePool
+from .fixed_point import ONE, sub
+
+
+@dataclass(frozen=True, kw_only=True)
+class WeightedPool(BasePool):
+    normalized_weights: tuple[int, ...]  # getNormalizedWeights, 18 decimals adding up to 1
+    legacy: bool = False  # the first weighted pools, without getActualSupply
+
+    exact_tokens_join_class = balancer.WeightedExactTokensJoin
+    single_asset_join_class = balancer.WeightedSingleAssetJoin
+    proportional_join_class = balancer.WeightedProportionalJoin
+    single_asset_exit_class = balancer.WeightedSingleAssetExit
+    proportional_exit_class = balancer.WeightedProportionalExit
+    custom_exit_class = balancer.WeightedCustomExit
+
+    def __post_init__(self):
+        super().__post_init__()
+        if len(self.normalized_weights) != len(self.tokens):
+            raise ValueError("tokens and normalized_weights must have the same length")
+        object.__setattr__(self, "normalized_weights", tuple(self.normalized_weights))
+        if self.last_invariant:
+            object.__setattr__(self, "legacy", True)
+
+    def _upscaled_balances(self, balances: list[int]) -> list[int]:
+        if self.last_invariant and self.protocol_swap_fee:
+            # The fees are paid in the token with the highest weight
+            index = self.normalized_weights.index(max(self.normalized_weights))
+            invariant = weighted_math.calculate_invariant(self.normalized_weights, balances, self.legacy)
+            due_fee = weighted_math.calc_due_token_protocol_swap_fee_amount(
+                balances[index], self.normalized_weights[index], self.last_invariant, invariant,
+                self.protocol_swap_fee, self.legacy)
+            balances[index] = sub(balances[index], due_fee)
+        return balances
+
+    @cached_property
+    def invariant(self) -> int:
+        return weighted_math.calculate_invariant(self.normalized_weights, self.upscaled_balances, self.legacy)
+
+    def _swap_given_in(self, token_in_index: int, token_out_index: int, amount_in: int) -> int:
+        balances, weights = self.swap_balances, self.normalized_weights
+        return weighted_math.calc_out_given_in(balances[token_in_index], weights[token_in_index],
+                                               balances[token_out_index], weights[token_out_index], amount_in,
+                                               self.legacy)
+
+    def _bpt_out_given_exact_tokens_in(self, amounts_in: list[int]) -> int:
+        return weighted_math.calc_bpt_out_given_exact_tokens_in(self.upscaled_balances, self.normalized_weights,
+                                                                amounts_in, self.total_supply, self.swap_fee,
+                                                                self.legacy)
+
+    def _token_in_given_exact_bpt_out(self, token_index: int, bpt_amount_out: int) -> int:
+        return weighted_math.calc_token_in_given_exact_bpt_out(self.upscaled_balances[token_index],
+                                                               self.normalized_weights[token_index], bpt_amount_out,
+                                                               self.total_supply, self.swap_fee, self.legacy)
+
+    def _bpt_in_given_exact_tokens_out(self, amounts_out: list[int]) -> int:
+        return weighted_math.calc_bpt_in_given_exact_tokens_out(self.upscaled_balances, self.normalized_weights,
+                                                                amounts_out, self.total_supply, self.swap_fee,
+                                                                self.legacy)
+
+    def _token_out_given_exact_bpt_in(self, token_index: int, bpt_amount_in: int) -> int:
+        return weighted_math.calc_token_out_given_exact_bpt_in(self.upscaled_balances[token_index],
+                                                               self.normalized_weights[token_index], bpt_amount_in,
+                                                               self.total_supply, self.swap_fee, self.legacy)
+
+    def marginal_bpt_per_token(self) -> list[float]:
+        # d(supply)/d(balance_i) = supply * weight_i / balance_i, as the invariant is prod(balance_i ^ weight_i)
+        return [self.total_supply * weight / (ONE * balance)
+                for weight, balance in zip(self.normalized_weights, self.upscaled_balances)]
@@ -1,7 +1,15 @@
 import json
+from functools import lru_cache
 from types import SimpleNamespace
-from roles_royce import Operation
-from web3 import Web3
+
+from eth_abi.grammar import TupleType, parse
+from eth_utils import is_checksum_address, is_hex_address, keccak, to_bytes, to_text
+from eth_abi.codec import ABICodec
+from eth_abi.decoding import BytesDecoder
+from eth_abi.encoding import BytesEncoder
+from eth_abi.exceptions import ValueOutOfBounds
+from eth_abi.registry import BaseEquals, registry as default_registry
+from roles_royce.constants import Operation
 
 AvatarAddress = object()
 Address = str
@@ -15,6 +23,257 @@ class Args(SimpleNamespace):
     pass
 
 
+# Kinds of steps in the argument resolution plan of a MethodEncoder
+_ARG, _FIXED, _AVATAR, _TUPLE = range(4)
+
+_registry = None
+_codec = None
+
+
+class _ExactLengthBytesEncoder(BytesEncoder):
+    """bytes<M> encoder that, as the one of web3, rejects the values shorter than M bytes instead of padding them."""
+
+    def validate_value(self, value):
+        super().validate_value(value)
+        byte_size = self.value_bit_size // 8
+        if len(value) != byte_size:
+            self.invalidate_value(value, exc=ValueOutOfBounds, msg=f"is not {byte_size} bytes long for bytes{byte_size}")
+
+
+# The registry and the validations are those web3 applies in Contract.encodeABI, built from eth_abi
+# and eth_utils: importing web3 takes most of a second, that encoding calldata would otherwise pay.
+
+def _get_registry():
+    global _registry
+    if _registry is None:
+        registry = default_registry.copy()
+        registry.unregister("bytes<M>")
+        registry.register(BaseEquals("bytes", with_sub=True), _ExactLengthBytesEncoder, BytesDecoder, label="bytes<M>")
+        _registry = registry
+    return _registry
+
+
+def _get_registry_codec():
+    global _codec
+    if _codec is None:
+        _codec = ABICodec(_get_registry())
+    return _codec
+
+
+@lru_cache(maxsize=4096)
+def _normalize_address(value: str) -> str:
+    # The addresses given as strings must be checksummed, as web3's validate_address requires
+    if not is_hex_address(value):
+        raise ValueError(f"Address must be 20 bytes, as a hex string with a 0x prefix: {value}")
+    if not is_checksum_address(value):
+        raise ValueError(f"Address has an invalid EIP-55 checksum: {value}")
+    return value
+
+
+def _normalize_bytes(value):
+    if isinstance(value, str):
+        return to_bytes(hexstr=value)
+    return value
+
+
+def _normalize_text(value):
+    if isinstance(value, str):
+        return value
+    return to_text(value)
+
+
+def _resolve(step, args, avatar):
+    kind, payload = step
+    if kind == _ARG:
+        return getattr(args, payload)
+    if kind == _FIXED:
+        return payload
+    if kind == _AVATAR:
+        return avatar
+    return tuple(_resolve(s, args, avatar) for s in payload)
+
+
+def _bind_avatar(step, avatar):
+    kind, payload = step
+    if kind == _AVATAR:
+        return _FIXED, avatar
+    if kind == _TUPLE:
+        return _TUPLE, tuple(_bind_avatar(s, avatar) for s in payload)
+    return step
+
+
+def _resolve_from_mapping(step, mapping):
+    kind, payload = step
+    if kind == _ARG:
+        return mapping[payload]
+    if kind == _FIXED:
+        return payload
+    return tuple(_resolve_from_mapping(s, mapping) for s in payload)
+
+
+def _compile_normalizer(abi_type):
+    """Return a function applying to a value of the given type the same normalizations
+    web3 applies in Contract.encodeABI (checksum addresses, hexstr to bytes, ...),
+    or None if the values of that type are passed to the encoder untouched."""
+    if abi_type.is_array:
+        item_normalizer = _compile_normalizer(abi_type.item_type)
+        if item_normalizer is None:
+            return None
+        return lambda values: [item_normalizer(v) for v in values]
+    if isinstance(abi_type, TupleType):
+        normalizers = [_compile_normalizer(c) for c in abi_type.components]
+        if not any(normalizers):
+            return None
+        normalizers = [n or (lambda v: v) for n in normalizers]
+        return lambda values: tuple(n(v) for n, v in zip(normalizers, values))
+    if abi_type.base == "address":
+        return lambda value: _normalize_address(value) if isinstance(value, str) else value
+    if abi_type.base == "bytes":
+        return _normalize_bytes
+    if abi_type.base == "string":
+        return _normalize_text
+    return None
+
+
+def _abi_for_type(name: str, abi_type) -> dict:
+    """The ABI json entry of a parsed type, the components of the tuples have no names."""
+    if not isinstance(abi_type, TupleType):
+        return {"name": name, "type": abi_type.to_type_str()}
+    dimensions = "".join(f"[{dimension[0] if dimension else ''}]" for dimension in abi_type.arrlist or ())
+    return {"name": name, "type": "tuple" + dimensions,
+            "components": [_abi_for_type("", c) for c in abi_type.components]}
+
+
+_TRUE_WORD = (1).to_bytes(32, "big")
+_FALSE_WORD = bytes(32)
+
+
+def _compile_type_encoder(type_str: str):
+    """Return the encoder of a value of the type, with fast paths for the static types used as
+    arguments most of the times. Values the fast paths do not handle go to the eth_abi encoder,
+    so the result and the validation errors are the same."""
+    abi_encoder = _get_registry().get_encoder(type_str)
+    abi_type = parse(type_str)
+    if abi_type.is_array or isinstance(abi_type, TupleType):
+        return abi_encoder
+
+    if abi_type.base == "address":
+        address_word = lru_cache(maxsize=4096)(abi_encoder)
+
+        def encode(value):
+            return address_word(value) if isinstance(value, str) else abi_encoder(value)
+    elif abi_type.base == "uint":
+        upper_bound = 2 ** abi_type.sub
+
+        def encode(value):
+            if isinstance(value, int) and not isinstance(value, bool) and 0 <= value < upper_bound:
+                return value.to_bytes(32, "big")
+            return abi_encoder(value)
+    elif abi_type.base == "bool":
+        def encode(value):
+            if value is True:
+                return _TRUE_WORD
+            if value is False:
+                return _FALSE_WORD
+            return abi_encoder(value)
+    else:
+        return abi_encoder
+    return encode
+
+
+class MethodEncoder:
+    """Compiled ABI encoder for a Method subclass.
+
+    Everything that depends only on the class definition (selector, types, the plan to
+    resolve the argument values and the eth_abi encoders) is computed once and shared by
+    all the instances of the class.
+    """
+
+    def __init__(self, name: str, types: list[str], plan: tuple = (), abi: str | None = None,
+                 out_types: list[str] = ()):
+        self.name = name
+        self.types = tuple(types)
+        self.out_types = tuple(out_types)
+        self.plan = plan
+        self.abi = abi
+        self.signature = f"{name}({','.join(self.types)})"
+        self.selector = keccak(text=self.signature)[:4]
+        self._encoders = tuple(_compile_type_encoder(t) for t in self.types)
+        self._dynamic = tuple(parse(t).is_dynamic for t in self.types)
+        self._has_dynamic = any(self._dynamic)
+        self._normalizers = tuple(_compile_normalizer(parse(t)) for t in self.types)
+
+    def resolve(self, args: Args, avatar: None | str = None) -> list:
+        """Return the argument values, in signature order, following the resolution plan."""
+        return [_resolve(step, args, avatar) for step in self.plan]
+
+    def encode(self, args) -> bytes:
+        """Return the calldata (selector + encoded arguments) for the args."""
+        normalized = [n(v) if n else v for n, v in zip(self._normalizers, args)]
+        return self.selector + self._encode_values(normalized)
+
+    def encode_many(self, args_dicts, avatar: None | str = None) -> list[bytes]:
+        """Return the calldata for each dict of argument values, keyed by argument name.
+
+        The fixed arguments and the avatar address are resolved once for the whole batch.
+        """
+        template, slots, nested, normalizers = [], [], [], []
+        for i, (step, normalizer) in enumerate(zip(self.plan, self._normalizers)):
+            kind, payload = _bind_avatar(step, avatar)
+            if kind == _FIXED:
+                template.append(normalizer(payload) if normalizer else payload)
+                continue
+            template.append(None)
+            if kind == _ARG:
+                slots.append((i, payload))
+            else:
+                nested.append((i, (kind, payload)))
+            if normalizer:
+                normalizers.append((i, normalizer))
+
+        selector, encoder = self.selector, self._encode_values
+        result = []
+        for args in args_dicts:
+            values = template.copy()
+            for i, name in slots:
+                values[i] = args[name]
+            for i, step in nested:
+                values[i] = _resolve_from_mapping(step, args)
+            for i, normalizer in normalizers:
+                values[i] = normalizer(values[i])
+            result.append(selector + encoder(values))
+        return result
+
+    def decode_output(self, data: bytes):
+        """Decode the return data of a call, the result is the same as web3's ContractFunction.call."""
+        from web3._utils.abi import map_abi_data
+        from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+        decoded = map_abi_data(BASE_RETURN_NORMALIZERS, self.out_types,
+                               _get_registry_codec().decode(self.out_types, data))
+        return decoded[0] if len(decoded) == 1 else list(decoded)
+
+    def _encode_values(self, values) -> bytes:
+        # Head-tail encoding of the arguments, as done by eth_abi's TupleEncoder
+        if len(values) != len(self._encoders):
+            raise InvalidArgument(f"{self.name} expects {len(self._encoders)} arguments, got {len(values)}")
+        if not self._has_dynamic:
+            return b"".join([encode(value) for encode, value in zip(self._encoders, values)])
+        heads, tails = [], []
+        for encode, dynamic, value in zip(self._encoders, self._dynamic, values):
+            if dynamic:
+                heads.append(None)
+                tails.append(encode(value))
+            else:
+                heads.append(encode(value))
+        offset = sum(32 if head is None else len(head) for head in heads)
+        tail_iter = iter(tails)
+        for i, head in enumerate(heads):
+            if head is None:
+                heads[i] = offset.to_bytes(32, "big")
+                offset += len(next(tail_iter))
+        return b"".join(heads + tails)
+
+
 class Method:
     name = None
     in_signature = []
@@ -30,27 +289,62 @@ class Method:
 
     @property
     def args_list(self):
-        return [self._get_arg_value(e) for e in self.in_signature]
+        return self.get_encoder().resolve(self.args, self.avatar)
 
     @property
     def data(self):
+        return "0x" + self.data_bytes.hex()
+
+    @property
+    def data_bytes(self) -> bytes:
+        """The calldata as bytes."""
         if not hasattr(self, "_initialized"):
             raise ValueError(f"Missing super().__init__() call in {self.__class__.__name__}.__init__ method")
-        contract = Web3().eth.contract(address=None, abi=self.abi)
-        result = contract.encodeABI(fn_name=self.name, args=self.args_list)
-        return result
+        return self.get_encoder().encode(self.args_list)
+
+    @classmethod
+    def get_encoder(cls) -> MethodEncoder:
+        """Return the compiled encoder of the class, building it on first use."""
+        encoder = cls.__dict__.get("_encoder")
+        if encoder is None:
+            inputs = [cls._abi_for(e) for e in cls.in_signature]
+            outputs = [cls._abi_for(e) for e in cls.out_signature]
+            abi = {"name": cls.name, "type": "function", "inputs": inputs, "outputs": outputs}
+            encoder = MethodEncoder(cls.name,
+                                    types=[cls._get_arg_type(e) for e in cls.in_signature],
+                                    plan=tuple(cls._plan_for(e) for e in cls.in_signature),
+                                    abi=json.dumps([abi]),
+                                    out_types=[cls._get_arg_type(e) for e in cls.out_signature])
+            cls._encoder = encoder
+        return encoder
+
+    @classmethod
+    def encode_many(cls, args_dicts, avatar: None | str = None) -> list[bytes]:
+        """Encode the calldata of many calls to this method in one pass.
+
+        Each element of args_dicts maps the argument names of in_signature (excluding the
+        fixed arguments) to their values. Returns the list of calldata as bytes.
+        """
+        return cls.get_encoder().encode_many([cls._prepare_args(args) for args in args_dicts], avatar)
+
+    @classmethod
+    def _prepare_args(cls, args: dict) -> dict:
+        """Hook for subclasses to convert the values of a batch before encoding."""
+        return args
+
+    @classmethod
+    def _match_decoded(cls, args: dict) -> bool:
+        """Hook for subclasses to tell apart classes with the same selector, from the argument values as decoded
+        by eth_abi (lower case addresses, tuples for arrays)."""
+        return True
 
     @property
     def short_signature(self):
-        types = ",".join([self._get_arg_type(e) for e in self.in_signature])
-        return f"{self.name}({types})"
+        return self.get_encoder().signature
 
     @property
     def abi(self):
-        inputs = [self._abi_for(e) for e in self.in_signature]
-        outputs = [self._abi_for(e) for e in self.out_signature]
-        abi = {"name": self.name, "type": "function", "inputs": inputs, "outputs": outputs}
-        return json.dumps([abi])
+        return self.get_encoder().abi
 
     @property
     def contract_address(self):
@@ -64,34 +358,38 @@ class Method:
         contract = web3.eth.contract(address=self.target_address, abi=self.abi)
         return contract.functions[self.name](*self.args_list).call(*args, **kwargs)
 
-    def _get_arg_value(self, element):
+    @classmethod
+    def _plan_for(cls, element):
         arg_name, arg_type = element
         if type(arg_type) in (list, tuple):
-            value = tuple(self._get_arg_value(e) for e in arg_type)
+            step = (_TUPLE, tuple(cls._plan_for(e) for e in arg_type))
+        elif arg_name in cls.fixed_arguments:
+            value = cls.fixed_arguments[arg_name]
+            step = (_AVATAR, None) if value is AvatarAddress else (_FIXED, value)
         else:
-            if arg_name in self.fixed_arguments:
-                value = self.fixed_arguments[arg_name]
-                if value is AvatarAddress:
-                    value = self.avatar
-            else:
-                value = getattr(self.args, arg_name)
-        return value
+            step = (_ARG, arg_name)
+        return step
 
-    def _abi_for(self, element):
+    @classmethod
+    def _abi_for(cls, element):
         name, _type = element
         if type(_type) in (list, tuple):
             value = {"name": name,
                      "type": "tuple",
-                     "components": [self._abi_for(e) for e in _type]
+                     "components": [cls._abi_for(e) for e in _type]
                      }
+        elif _type.startswith("("):
+            # Arrays of tuples are given as their type string, e.g. "(bytes32,uint256)[]"
+            value = _abi_for_type(name, parse(_type))
         else:
             value = {"name": name, "type": _type}
         return value
 
-    def _get_arg_type(self, element):
+    @classmethod
+    def _get_arg_type(cls, element):
         _type = element[1]
         if type(_type) in (list, tuple):
-            types = ",".join([self._get_arg_type(e) for e in _type])
+            types = ",".join([cls._get_arg_type(e) for e in _type])
             value = f"({types})"
         else:
             value = _type
@@ -0,0 +1,298 @@
+"""Decode calldata back into instances of the Method subclasses of roles_royce.protocols.eth.
+
+The decoder indexes the classes of the registry by selector. The arguments are decoded once
+per call, then matched against the classes sharing the selector: their target address, their
+fixed arguments (including the avatar address) and their ``_match_decoded`` hook. When more than
+one class matches, the most specific one wins: more fixed arguments over fewer, a fixed target
+over any target, a subclass over its base class.
+
+Example::
+
+    from roles_royce.protocols.decoder import decode_calldata, decode_transactions
+
+    method = decode_calldata(tx["input"], to=tx["to"], value=tx["value"])
+    if method is not None:
+        print(type(method).__name__, vars(method.args))
+
+    # The calls of a multiSend payload, flattened. Calls that are not known are TxData.
+    for call in decode_transactions(data, to=multisend_address, operation=Operation.DELEGATE_CALL):
+        ...
+"""
+import inspect
+from functools import lru_cache
+from typing import Iterator, Mapping, Optional
+
+from eth_abi.decoding import ContextFramesBytesIO
+from eth_abi.exceptions import DecodingError
+from eth_abi.grammar import TupleType, parse
+from eth_abi.registry import registry as default_registry
+from eth_utils import to_bytes, to_checksum_address
+
+from roles_royce.constants import Operation
+from roles_royce.generic_method import TxData
+from roles_royce.utils import MULTISEND_SELECTOR, to_bytes_data, unpack_multisend
+from .base import _ARG, _AVATAR, _FALSE_WORD, _FIXED, _TRUE_WORD, _TUPLE, Method, MethodEncoder
+from .registry import METHODS
+
+_checksum = lru_cache(maxsize=4096)(to_checksum_address)
+
+
+def _canonical(abi_type, value):
+    """Return a fixed argument value as eth_abi decodes it, to compare it with the decoded values."""
+    if abi_type.is_array:
+        return tuple(_canonical(abi_type.item_type, v) for v in value)
+    if isinstance(abi_type, TupleType):
+        return tuple(_canonical(c, v) for c, v in zip(abi_type.components, value))
+    if abi_type.base == "address":
+        return value.lower()
+    if abi_type.base == "bytes" and isinstance(value, str):
+        return to_bytes(hexstr=value)
+    return value
+
+
+def _compile_word_decoder(abi_type):
+    """Return a fast decoder of a 32 bytes word for the static elementary types, or None."""
+    if abi_type.is_array or isinstance(abi_type, TupleType):
+        return None
+    if abi_type.base == "address":
+        def decode_word(word):
+            if any(word[:12]):
+                raise DecodingError("Padding bytes were not empty")
+            return "0x" + word[12:].hex()
+    elif abi_type.base == "uint":
+        upper_bound = 2 ** abi_type.sub
+
+        def decode_word(word):
+            value = int.from_bytes(word, "big")
+            if value >= upper_bound:
+                raise DecodingError("Padding bytes were not empty")
+            return value
+    elif abi_type.base == "bool":
+        def decode_word(word):
+            if word == _TRUE_WORD:
+                return True
+            if word == _FALSE_WORD:
+                return False
+            raise DecodingError("Boolean must be either 0x0 or 0x1")
+    elif abi_type.base == "bytes" and abi_type.sub is not None:
+        size = abi_type.sub
+
+        def decode_word(word):
+            if any(word[size:]):
+                raise DecodingError("Padding bytes were not empty")
+            return word[:size]
+    else:
+        return None
+    return decode_word
+
+
+def _compile_tuple_decoder(types):
+    """Return the decoder of the arguments, slicing words directly when all of them are static
+    elementary types and falling back to the eth_abi decoder otherwise."""
+    word_decoders = [_compile_word_decoder(parse(t)) for t in types]
+    if not all(word_decoders):
+        abi_decoder = default_registry.get_tuple_decoder(*types)
+        return lambda data: abi_decoder(ContextFramesBytesIO(data))
+
+    size = 32 * len(word_decoders)
+
+    def decode(data):
+        if len(data) < size:
+            raise DecodingError(f"Expected {size} bytes, got {len(data)}")
+        return tuple(decode_word(data[i:i + 32]) for i, decode_word in zip(range(0, size, 32), word_decoders))
+    return decode
+
+
+def _compile_converters(elements, plan, converters: dict) -> dict:
+    """Map the name of each argument to the converter of its decoded value, if it needs one."""
+    for (name, arg_type), (kind, payload) in zip(elements, plan):
+        if kind == _TUPLE:
+            _compile_converters(arg_type, payload, converters)
+        elif kind == _ARG:
+            converter = _compile_converter(parse(arg_type))
+            if converter is not None:
+                converters[payload] = converter
+    return converters
+
+
+def _compile_converter(abi_type):
+    """Return a function converting a decoded value to the value a Method instance holds
+    (checksum addresses, lists for arrays), or None if the decoded value is used as is."""
+    if abi_type.is_array:
+        item_converter = _compile_converter(abi_type.item_type)
+        if item_converter is None:
+            return list
+        return lambda values: [item_converter(v) for v in values]
+    if isinstance(abi_type, TupleType):
+        converters = [_compile_converter(c) or (lambda v: v) for c in abi_type.components]
+        return lambda values: tuple(c(v) for c, v in zip(converters, values))
+    if abi_type.base == "address":
+        return _checksum
+    return None
+
+
+def _compile_steps(elements, plan) -> tuple:
+    """Pair each fixed argument of the argument resolution plan with its value as eth_abi decodes it."""
+    steps = []
+    for (name, arg_type), (kind, payload) in zip(elements, plan):
+        if kind == _TUPLE:
+            steps.append((_TUPLE, _compile_steps(arg_type, payload)))
+        elif kind == _FIXED:
+            steps.append((_FIXED, _canonical(parse(arg_type), payload)))
+        elif kind == _ARG:
+            steps.append((_ARG, payload))
+        else:
+            steps.append((_AVATAR, None))
+    return tuple(steps)
+
+
+def _bind(steps, values, args: dict, avatars: set) -> bool:
+    for (kind, payload), value in zip(steps, values):
+        if kind == _ARG:
+            args[payload] = value
+        elif kind == _FIXED:
+            if value != payload:
+                return False
+        elif kind == _AVATAR:
+            avatars.add(value)
+        elif not _bind(payload, value, args, avatars):
+            return False
+    return True
+
+
+def _class_target(method_class: type[Method]) -> Optional[str]:
+    """The target address all the instances of the class have, if any."""
+    target = inspect.getattr_static(method_class, "target_address")
+    if isinstance(target, property):
+        # BaseApprove subclasses target their token
+        target = getattr(method_class, "token", None)
+    return target if isinstance(target, str) else None
+
+
+class _Candidate:
+    __slots__ = ("method_class", "target", "steps", "converters", "sets_token")
+
+    def __init__(self, method_class: type[Method], encoder: MethodEncoder):
+        self.method_class = method_class
+        target = _class_target(method_class)
+        self.target = target.lower() if target else None
+        self.steps = _compile_steps(method_class.in_signature, encoder.plan)
+        self.converters = _compile_converters(method_class.in_signature, encoder.plan, {})
+        self.sets_token = isinstance(inspect.getattr_static(method_class, "target_address"), property)
+
+    @property
+    def rank(self) -> tuple:
+        return len(self.method_class.fixed_arguments), self.target is not None, len(self.method_class.__mro__)
+
+    def build(self, values, to: Optional[str], value: int, avatar: Optional[str]) -> Optional[Method]:
+        if self.target is not None and to is not None and to.lower() != self.target:
+            return None
+        args, avatars = {}, set()
+        if not _bind(self.steps, values, args, avatars):
+            return None
+        if len(avatars) > 1 or (avatar is not None and avatars and avatar.lower() not in avatars):
+            return None
+        if not self.method_class._match_decoded(args):
+            return None
+
+        method = self.method_class.__new__(self.method_class)
+        Method.__init__(method, value=value, avatar=_checksum(avatars.pop()) if avatars else avatar)
+        for name, convert in self.converters.items():
+            args[name] = convert(args[name])
+        method.args.__dict__.update(args)
+        if self.target is None and to is not None:
+            if self.sets_token:
+                method.token = _checksum(to)
+            else:
+                method.target_address = _checksum(to)
+        return method
+
+
+class CalldataDecoder:
+    """Selector index of the Method subclasses, built once and shared by all the decodings."""
+
+    def __init__(self, methods: Mapping[type[Method], MethodEncoder] = METHODS):
+        index: dict[bytes, tuple] = {}
+        for method_class, encoder in methods.items():
+            if encoder.selector not in index:
+                index[encoder.selector] = (_compile_tuple_decoder(encoder.types), [])
+            index[encoder.selector][1].append(_Candidate(method_class, encoder))
+        for _, candidates in index.values():
+            candidates.sort(key=lambda c: c.rank, reverse=True)
+        self._index = index
+
+    @property
+    def selectors(self) -> set[bytes]:
+        return set(self._index)
+
+    def _iter_decoded(self, data: bytes, to: Optional[str], value: int, avatar: Optional[str]) -> Iterator[Method]:
+        entry = self._index.get(data[:4])
+        if entry is None:
+            return
+        tuple_decoder, candidates = entry
+        try:
+            values = tuple_decoder(data[4:])
+        except DecodingError:
+            return
+        for candidate in candidates:
+            method = candidate.build(values, to, value, avatar)
+            if method is not None:
+                yield method
+
+    def candidates(self, data: str | bytes, to: Optional[str] = None, value: int = 0,
+                   avatar: Optional[str] = None) -> list[Method]:
+        """All the Method instances the calldata decodes to, the most specific first."""
+        return list(self._iter_decoded(to_bytes_data(data), to, value, avatar))
+
+    def decode(self, data: str | bytes, to: Optional[str] = None, value: int = 0,
+               avatar: Optional[str] = None) -> Optional[Method]:
+        """Return the Method instance of the calldata, or None if no known method matches it.
+
+        :param to: the called address, to tell apart the methods with the same selector
+        :param avatar: if given, methods whose avatar arguments have another address do not match
+        """
+        return next(self._iter_decoded(to_bytes_data(data), to, value, avatar), None)
+
+    def decode_transactions(self, data: str | bytes, to: Optional[str] = None, value: int = 0,
+                            operation: Operation = Operation.CALL, avatar: Optional[str] = None) -> list[Method | TxData]:
+        """Return the calls made by a transaction, unpacking multiSend payloads recursively.
+
+        The calls that do not decode to a known method are returned as TxData.
+        """
+        data = to_bytes_data(data)
+        if data[:4] == MULTISEND_SELECTOR:
+            try:
+                txs = unpack_multisend(data)
+            except ValueError:
+                txs = None
+            if txs is not None:
+                calls = []
+                for tx in txs:
+                    calls.extend(self.decode_transactions(tx.data, tx.contract_address, tx.value, tx.operation, avatar))
+                return calls
+        if operation == Operation.CALL:
+            method = self.decode(data, to, value, avatar)
+            if method is not None:
+                return [method]
+        return [TxData(contract_address=to, data=data, operation=Operation(operation), value=value)]
+
+
+_default_decoder: Optional[CalldataDecoder] = None
+
+
+def get_decoder() -> CalldataDecoder:
+    """The decoder of all the methods in the registry, built on first use."""
+    global _default_decoder
+    if _default_decoder is None:
+        _default_decoder = CalldataDecoder()
+    return _default_decoder
+
+
+def decode_calldata(data: str | bytes, to: Optional[str] = None, value: int = 0,
+                    avatar: Optional[str] = None) -> Optional[Method]:
+    return get_decoder().decode(data, to, value, avatar)
+
+
+def decode_transactions(data: str | bytes, to: Optional[str] = None, value: int = 0,
+                        operation: Operation = Operation.CALL, avatar: Optional[str] = None) -> list[Method | TxData]:
+    return get_decoder().decode_transactions(data, to, value, operation, avatar)
@@ -1,5 +1,10 @@
 from enum import IntEnum
-import eth_abi
+from functools import lru_cache
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.encoding import TupleEncoder
+from eth_abi.exceptions import DecodingError
+from eth_abi.registry import registry as default_registry
+from eth_utils import to_checksum_address
 from roles_royce.constants import ETHAddr, CrossChainAddr
 from roles_royce.protocols.base import Method, InvalidArgument, AvatarAddress, Address
 from roles_royce.protocols.base import BaseApproveForToken
@@ -9,12 +14,83 @@ from roles_royce.protocols.base import BaseApproveForToken
 # StablePool encoding https://github.com/balancer/balancer-v2-monorepo/blob/d2c47f13aa5f7db1b16e37f37c9631b9a38f25a4/pkg/balancer-js/src/pool-stable/encoder.ts
 
 
+@lru_cache(maxsize=None)
+def _user_data_encoder(user_data_abi: tuple) -> TupleEncoder:
+    return TupleEncoder(encoders=tuple(default_registry.get_encoder(t) for t in user_data_abi))
+
+
+@lru_cache(maxsize=None)
+def _user_data_decoder(user_data_abi: tuple) -> TupleDecoder:
+    return TupleDecoder(decoders=tuple(default_registry.get_decoder(t) for t in user_data_abi))
+
+
+class _UserDataMixin:
+    """Encoding of the userData argument of joins and exits, shared by all the instances of a class."""
+    user_data_abi = None
+
+    @classmethod
+    def encode_user_data(cls, user_data):
+        return _user_data_encoder(tuple(cls.user_data_abi))(user_data)
+
+    @classmethod
+    def _prepare_args(cls, args: dict) -> dict:
+        # In a batch the user_data can be given as the list of values to encode
+        if isinstance(args.get("user_data"), (list, tuple)):
+            args = {**args, "user_data": cls.encode_user_data(args["user_data"])}
+        return args
+
+    @classmethod
+    def _match_decoded(cls, args: dict) -> bool:
+        # The user_data of each kind of join or exit starts with the kind. The same kind can have another
+        # layout in other pools (e.g. the exits of the weighted and stable pools), so the user_data must also
+        # be the encoding of the values it decodes to with the user_data_abi of the class.
+        if cls.user_data_abi is None:
+            return True
+        kind = getattr(cls, "exit_kind", None)
+        if kind is None:
+            kind = getattr(cls, "join_kind", None)
+        user_data = args["user_data"]
+        if int.from_bytes(user_data[:32], "big") != kind:
+            return False
+        user_data_abi = tuple(cls.user_data_abi)
+        try:
+            values = _user_data_decoder(user_data_abi)(ContextFramesBytesIO(user_data))
+        except DecodingError:
+            return False
+        return _user_data_encoder(user_data_abi)(values) == user_data
+
+
+def pool_address(pool_id: str | bytes) -> Address:
+    """The address of the pool, the first 20 bytes of its id."""
+    if isinstance(pool_id, str):
+        pool_id = bytes.fromhex(pool_id.removeprefix("0x"))
+    return to_checksum_address(pool_id[:20])
+
+
+def sort_assets(assets: list[Address], *arrays: list, wrapped_native: Address = ETHAddr.WETH) -> tuple[list, ...]:
+    """Sort the assets numerically by address, as the Vault expects, and each of the arrays in parallel.
+
+    The zero address stands for the native token (ETH, xDAI) and is sorted in the place of
+    its wrapped token, e.g. sort_assets(assets, min_amounts_out) returns the sorted assets
+    and the min_amounts_out aligned with them.
+    """
+    def key(i):
+        address = int(assets[i], 16)
+        return address if address else int(wrapped_native, 16)
+
+    for array in arrays:
+        if len(array) != len(assets):
+            raise InvalidArgument(f"Expected {len(assets)} values to sort with the assets, got {len(array)}")
+    order = sorted(range(len(assets)), key=key)
+    return ([assets[i] for i in order],) + tuple([array[i] for i in order] for array in arrays)
+
+
 class ApproveForVault(BaseApproveForToken):
     """approve Token with BalancerVault as spender"""
     fixed_arguments = {"spender": CrossChainAddr.BalancerVault}
 
 
-# There is another ExitKind that is for Weighted Pools
+# The ExitKind of Weighted Pools is WeightedPoolExitKind
 class StablePoolExitKind(IntEnum):
     EXACT_BPT_IN_FOR_ONE_TOKEN_OUT = 0
     BPT_IN_FOR_EXACT_TOKENS_OUT = 1
@@ -28,9 +104,9 @@ class QueryExit(Method):
 
 # When providing your assets, you must ensure that the tokens are sorted numerically by token address.
 # It's also important to note that the values in minAmountsOut correspond to the same index value in assets,
-# so these arrays must be made in parallel after sorting.
+# so these arrays must be made in parallel after sorting (see sort_assets).
 
-class Exit(Method):
+class Exit(_UserDataMixin, Method):
     name = "exitPool"
     in_signature = (
         ("pool_id", "bytes32"),
@@ -46,7 +122,6 @@ class Exit(Method):
     fixed_arguments = {"sender": AvatarAddress, "recipient": AvatarAddress, "to_internal_balance": False}
     target_address = CrossChainAddr.BalancerVault
     exit_kind: StablePoolExitKind
-    user_data_abi = None
 
     def __init__(self, pool_id: str, avatar: Address, assets: list[Address], min_amounts_out: list[int], user_data: list):
         super().__init__(avatar=avatar)
@@ -56,9 +131,6 @@ class Exit(Method):
         self.args.user_data = self.encode_user_data(user_data)
         self.args.request = [self.args.assets, self.args.min_amounts_out, self.args.user_data, self.fixed_arguments['to_internal_balance']]
 
-    def encode_user_data(self, user_data):
-        return eth_abi.encode(self.user_data_abi, user_data)
-
 
 class SingleAssetExit(Exit):
     """Single Asset Exit
@@ -108,7 +180,7 @@ class CustomExit(Exit):
         """
 
         :param amounts_out: are the amounts of each token to be withdrawn from the pool
-        :param max_bpt_amount_in: is the minimum acceptable BPT to burn in return for withdrawn tokens
+        :param max_bpt_amount_in: is the maximum acceptable BPT to burn in return for withdrawn tokens
         """
         super().__init__(pool_id, avatar, assets, amounts_out, user_data=[self.exit_kind, amounts_out, max_bpt_amount_in])
 
@@ -127,7 +199,7 @@ class ProportionalExitQueryExit(QueryExitMixin, ProportionalExit):
 class CustomQueryExit(QueryExitMixin, CustomExit):
     pass
 
-# There is another JoinKind that is for Weighted Pools
+# The JoinKind of Weighted Pools is WeightedPoolJoinKind
 class StablePoolJoinKind(IntEnum):
     INIT = 0
     EXACT_TOKENS_IN_FOR_BPT_OUT = 1
@@ -142,9 +214,9 @@ class QueryJoin(Method):
 
 # When providing your assets, you must ensure that the tokens are sorted numerically by token address.
 # It's also important to note that the values in maxAmountsIn correspond to the same index value in assets,
-# so these arrays must be made in parallel after sorting.
+# so these arrays must be made in parallel after sorting (see sort_assets).
 
-class Join(Method):
+class Join(_UserDataMixin, Method):
     name = "joinPool"
     in_signature = (
         ("pool_id", "bytes32"),
@@ -160,7 +232,6 @@ class Join(Method):
     fixed_arguments = {"sender": AvatarAddress, "recipient": AvatarAddress, "from_internal_balance": False}
     target_address = CrossChainAddr.BalancerVault
     exit_kind: StablePoolJoinKind
-    user_data_abi = None
 
     def __init__(self, pool_id: str, avatar: Address, assets: list[Address], max_amounts_in: list[int], user_data: list):
         super().__init__(avatar=avatar)
@@ -170,9 +241,6 @@ class Join(Method):
         self.args.user_data = self.encode_user_data(user_data)
         self.args.request = [self.args.assets, self.args.max_amounts_in, self.args.user_data, self.fixed_arguments['from_internal_balance']]
 
-    def encode_user_data(self, user_data):
-        return eth_abi.encode(self.user_data_abi, user_data)
-
 
 class SingleAssetJoin(Join):
     """Single Asset Join
@@ -239,4 +307,223 @@ class ProportionalExitQueryJoin(QueryJoinMixin, ProportionalJoin):
     pass
 
 class ExactAssetQueryJoin(QueryJoinMixin, ExactTokensJoin):
-    pass
\ No newline at end of file
+    pass
+
+
+# Weighted Pools
+# Ref: https://github.com/balancer/balancer-v2-monorepo/blob/master/pkg/balancer-js/src/pool-weighted/encoder.ts
+# The weighted joins have the kinds and the user_data of the stable ones, so their classes are the same. The exits
+# differ: EXACT_BPT_IN_FOR_ONE_TOKEN_OUT is the same, but kind 1 is EXACT_BPT_IN_FOR_TOKENS_OUT ([kind, bpt_amount_in])
+# while in the stable pools it is BPT_IN_FOR_EXACT_TOKENS_OUT ([kind, amounts_out, max_bpt_amount_in]), and kind 2 is
+# the reverse. The decoder tells them apart by the layout of the user_data.
+
+class WeightedPoolJoinKind(IntEnum):
+    INIT = 0
+    EXACT_TOKENS_IN_FOR_BPT_OUT = 1
+    TOKEN_IN_FOR_EXACT_BPT_OUT = 2
+    ALL_TOKENS_IN_FOR_EXACT_BPT_OUT = 3
+
+
+class WeightedPoolExitKind(IntEnum):
+    EXACT_BPT_IN_FOR_ONE_TOKEN_OUT = 0
+    EXACT_BPT_IN_FOR_TOKENS_OUT = 1
+    BPT_IN_FOR_EXACT_TOKENS_OUT = 2
+
+
+WeightedSingleAssetExit = SingleAssetExit
+WeightedSingleAssetQueryExit = SingleAssetQueryExit
+
+
+class WeightedProportionalExit(ProportionalExit):
+    """Proportional Exit of a Weighted Pool
+
+    User sends a precise quantity of BPT, and receives an estimated but unknown (computed at run time) quantities of all tokens.
+    """
+
+    exit_kind = WeightedPoolExitKind.EXACT_BPT_IN_FOR_TOKENS_OUT
+
+
+class WeightedCustomExit(CustomExit):
+    """Custom Exit of a Weighted Pool
+
+    User sends an estimated but unknown (computed at run time) quantity of BPT, and receives precise quantities of specified tokens.
+    """
+    exit_kind = WeightedPoolExitKind.BPT_IN_FOR_EXACT_TOKENS_OUT
+
+
+class WeightedProportionalQueryExit(QueryExitMixin, WeightedProportionalExit):
+    pass
+
+class WeightedCustomQueryExit(QueryExitMixin, WeightedCustomExit):
+    pass
+
+
+WeightedSingleAssetJoin = SingleAssetJoin
+WeightedProportionalJoin = ProportionalJoin
+WeightedExactTokensJoin = ExactTokensJoin
+WeightedSingleAssetQueryJoin = SingleAssetQueryJoin
+WeightedProportionalQueryJoin = ProportionalExitQueryJoin
+WeightedExactTokensQueryJoin = ExactAssetQueryJoin
+
+
+# Swaps
+# Ref: https://docs.balancer.fi/reference/swaps/batch-swaps.html
+
+class SwapKind(IntEnum):
+    GIVEN_IN = 0
+    GIVEN_OUT = 1
+
+
+class Swap(Method):
+    """Swap in a single pool
+
+    With GIVEN_IN the amount is the amount of asset_in and the limit the minimum amount of asset_out to receive,
+    with GIVEN_OUT the amount is the amount of asset_out and the limit the maximum amount of asset_in to send.
+    The zero address as asset_in sends the native token.
+    """
+    name = "swap"
+    in_signature = (
+        ("single_swap", (
+            ("pool_id", "bytes32"),
+            ("kind", "uint8"),
+            ("asset_in", "address"),
+            ("asset_out", "address"),
+            ("amount", "uint256"),
+            ("user_data", "bytes"))
+         ),
+        ("funds", (
+            ("sender", "address"),
+            ("from_internal_balance", "bool"),
+            ("recipient", "address"),
+            ("to_internal_balance", "bool"))
+         ),
+        ("limit", "uint256"),
+        ("deadline", "uint256")
+    )
+    fixed_arguments = {"sender": AvatarAddress, "recipient": AvatarAddress,
+                       "from_internal_balance": False, "to_internal_balance": False}
+    target_address = CrossChainAddr.BalancerVault
+
+    def __init__(self, pool_id: str, avatar: Address, kind: SwapKind, asset_in: Address, asset_out: Address,
+                 amount: int, limit: int, deadline: int, user_data: bytes = b""):
+        native_in = int(asset_in, 16) == 0
+        super().__init__(value=(amount if kind == SwapKind.GIVEN_IN else limit) if native_in else 0, avatar=avatar)
+        self.args.pool_id = pool_id
+        self.args.kind = kind
+        self.args.asset_in = asset_in
+        self.args.asset_out = asset_out
+        self.args.amount = amount
+        self.args.user_data = user_data
+        self.args.limit = limit
+        self.args.deadline = deadline
+
+
+class BatchSwap(Method):
+    """Sequence of swaps, each one using the amount out of the previous one when its amount is 0
+
+    Each step of swaps is (pool_id, asset_in_index, asset_out_index, amount, user_data), with the indexes into
+    assets. limits has one value per asset: the maximum amount to send when positive, the minimum amount to
+    receive as a negative value. The zero address in assets stands for the native token.
+    """
+    name = "batchSwap"
+    in_signature = (
+        ("kind", "uint8"),
+        ("swaps", "(bytes32,uint256,uint256,uint256,bytes)[]"),
+        ("assets", "address[]"),
+        ("funds", (
+            ("sender", "address"),
+            ("from_internal_balance", "bool"),
+            ("recipient", "address"),
+            ("to_internal_balance", "bool"))
+         ),
+        ("limits", "int256[]"),
+        ("deadline", "uint256")
+    )
+    fixed_arguments = {"sender": AvatarAddress, "recipient": AvatarAddress,
+                       "from_internal_balance": False, "to_internal_balance": False}
+    target_address = CrossChainAddr.BalancerVault
+
+    def __init__(self, avatar: Address, kind: SwapKind, swaps: list[tuple], assets: list[Address], limits: list[int],
+                 deadline: int):
+        if len(limits) != len(assets):
+            raise InvalidArgument(f"Expected {len(assets)} limits, one per asset, got {len(limits)}")
+        native_limits = [limit for asset, limit in zip(assets, limits) if int(asset, 16) == 0]
+        super().__init__(value=max(native_limits[0], 0) if native_limits else 0, avatar=avatar)
+        self.args.kind = kind
+        self.args.swaps = [tuple(step) for step in swaps]
+        self.args.assets = assets
+        self.args.limits = limits
+        self.args.deadline = deadline
+
+
+# Reads of the pool state, to quote offline with roles_royce.protocols.balancer_math
+
+class GetPoolTokens(Method):
+    """tokens of the pool (sorted), their balances and the last block they changed"""
+    name = "getPoolTokens"
+    in_signature = [("pool_id", "bytes32")]
+    out_signature = [("tokens", "address[]"), ("balances", "uint256[]"), ("last_change_block", "uint256")]
+    target_address = CrossChainAddr.BalancerVault
+
+    def __init__(self, pool_id: str):
+        super().__init__()
+        self.args.pool_id = pool_id
+
+
+class _PoolRead(Method):
+    def __init__(self, pool_id: str):
+        super().__init__()
+        self.target_address = pool_address(pool_id)
+
+
+class GetAmplificationParameter(_PoolRead):
+    """amplification parameter of a stable pool, value is multiplied by precision"""
+    name = "getAmplificationParameter"
+    out_signature = [("value", "uint256"), ("is_updating", "bool"), ("precision", "uint256")]
+
+
+class GetScalingFactors(_PoolRead):
+    """factors that upscale the balances to 18 decimals, including the price rates of meta stable pools"""
+    name = "getScalingFactors"
+    out_signature = [("scaling_factors", "uint256[]")]
+
+
+class GetSwapFeePercentage(_PoolRead):
+    name = "getSwapFeePercentage"
+    out_signature = [("swap_fee_percentage", "uint256")]
+
+
+class GetLastInvariant(_PoolRead):
+    """invariant and amplification after the last join or exit, to compute the due protocol fees"""
+    name = "getLastInvariant"
+    out_signature = [("last_invariant", "uint256"), ("last_invariant_amp", "uint256")]
+
+
+class TotalSupply(_PoolRead):
+    """total supply of BPT"""
+    name = "totalSupply"
+    out_signature = [("total_supply", "uint256")]
+
+
+class GetProtocolSwapFeePercentage(Method):
+    name = "getSwapFeePercentage"
+    out_signature = [("swap_fee_percentage", "uint256")]
+    target_address = CrossChainAddr.BalancerProtocolFeesCollector
+
+
+class GetNormalizedWeights(_PoolRead):
+    """weights of a weighted pool, 18 decimals adding up to 1"""
+    name = "getNormalizedWeights"
+    out_signature = [("normalized_weights", "uint256[]")]
+
+
+class GetWeightedLastInvariant(_PoolRead):
+    """invariant after the last join or exit of the first weighted pools, which paid the protocol fees in tokens"""
+    name = "getLastInvariant"
+    out_signature = [("last_invariant", "uint256")]
+
+
+class GetActualSupply(_PoolRead):
+    """total supply of BPT including the BPT due as protocol fees, of the pools that pay them in BPT"""
+    name = "getActualSupply"
+    out_signature = [("actual_supply", "uint256")]
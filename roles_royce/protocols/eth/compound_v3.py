@@ -1,6 +1,5 @@
 import eth_abi
 from enum import Enum
-from web3 import Web3
 from roles_royce.constants import ETHAddr
 from roles_royce.protocols.base import Method, Address, AvatarAddress, BaseApproveForToken
 
@@ -80,12 +80,13 @@ class RequestWithdrawalsWithPermitStETH(Method):
     in_signature = [
         ("amounts", "uint256[]"),
         ("owner", "address"),
-        ("permit",
-         ("value", "uint256"),
-         ("deadline", "uint256"),
-         ("v", "uint8"),
-         ("r", "bytes32"),
-         ("s", "bytes32"))
+        ("permit", (
+            ("value", "uint256"),
+            ("deadline", "uint256"),
+            ("v", "uint8"),
+            ("r", "bytes32"),
+            ("s", "bytes32"))
+         )
     ]
     fixed_arguments = {"owner": AvatarAddress}
     target_address = ETHAddr.unstETH
@@ -0,0 +1,62 @@
+"""Make many read calls of Method instances in a single eth_call through Multicall3.
+
+Multicall3 is deployed at the same address in Ethereum, Gnosis Chain and most EVM chains.
+
+Example::
+
+    from roles_royce.protocols.multicall import call_many
+
+    quotes = call_many(w3, [SingleAssetQueryExit(...), ExactAssetQueryJoin(...)], allow_failure=True)
+"""
+from typing import Sequence
+
+from eth_abi import decode, encode
+from eth_utils import keccak, to_bytes
+
+from .base import Method
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+AGGREGATE3_SELECTOR = keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+
+
+def encode_aggregate3(methods: Sequence[Method], allow_failure: Sequence[bool]) -> bytes:
+    calls = []
+    for method, allowed in zip(methods, allow_failure):
+        if method.target_address is None:
+            raise ValueError(f"{method.__class__.__name__} has no target address")
+        calls.append((to_bytes(hexstr=method.target_address), allowed, method.data_bytes))
+    return AGGREGATE3_SELECTOR + encode(["(address,bool,bytes)[]"], [calls])
+
+
+def call_many(web3, methods: Sequence[Method], block='latest', allow_failure: bool | Sequence[bool] = False,
+              multicall_address: str = MULTICALL3_ADDRESS) -> list:
+    """Call all the methods in one eth_call and decode each result with the method's out_signature.
+
+    The results are in the same order as the methods and are the same values Method.call
+    would return. allow_failure can be given for all the calls or per call: when a call that is
+    allowed to fail fails its result is None, when any other call fails the whole multicall
+    reverts and web3 raises ContractLogicError.
+    """
+    if isinstance(allow_failure, bool):
+        allow_failure = [allow_failure] * len(methods)
+    if len(allow_failure) != len(methods):
+        raise ValueError("allow_failure must have one value per method")
+    if not methods:
+        return []
+
+    data = encode_aggregate3(methods, allow_failure)
+    return_data = web3.eth.call({"to": multicall_address, "data": data}, block)
+    (results,) = decode(["(bool,bytes)[]"], return_data)
+
+    values = []
+    for method, allowed, (success, result) in zip(methods, allow_failure, results):
+        if not success:
+            values.append(None)
+            continue
+        try:
+            values.append(method.get_encoder().decode_output(result))
+        except Exception:
+            if not allowed:
+                raise
+            values.append(None)
+    return values
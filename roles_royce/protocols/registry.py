@@ -0,0 +1,40 @@
+"""Registry of the Method subclasses defined in the roles_royce.protocols.eth modules.
+
+The registry is built when this module is imported: every concrete Method subclass gets its
+compiled encoder (selector, flattened types and argument resolution plan), so encoding any
+of them is a dict lookup plus a single eth_abi encoding.
+
+Example::
+
+    from roles_royce.protocols.registry import METHODS
+
+    for method_class, encoder in METHODS.items():
+        print(method_class.__module__, method_class.__name__, encoder.signature, encoder.selector.hex())
+"""
+import importlib
+import inspect
+import pkgutil
+from types import MappingProxyType
+
+from . import eth
+from .base import Method, MethodEncoder
+
+
+def _iter_method_classes():
+    for module_info in pkgutil.iter_modules(eth.__path__):
+        module = importlib.import_module(f"{eth.__name__}.{module_info.name}")
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            if (issubclass(obj, Method)
+                    and obj.__module__ == module.__name__
+                    and obj.name is not None
+                    and not name.startswith("_")):
+                yield obj
+
+
+def _build_registry() -> dict[type[Method], MethodEncoder]:
+    return {method_class: method_class.get_encoder() for method_class in _iter_method_classes()}
+
+
+METHODS: MappingProxyType = MappingProxyType(_build_registry())
+"""Read only mapping of each concrete Method subclass to its compiled MethodEncoder."""
+
@@ -0,0 +1,144 @@
+"""Wait for the receipts of many transactions with a single poll loop.
+
+Instead of one ``wait_for_transaction_receipt`` per transaction, the tracker asks for the block
+number and, only when there is a new block, requests the receipts of all the tracked transactions
+in one JSON-RPC batch.
+
+Example::
+
+    tracker = ReceiptTracker(w3)
+    futures = [tracker.track(roles.execute(contract_address, data)) for data in calls]
+    receipts = tracker.wait(timeout=300)
+
+When the chain head is already known (e.g. from a ``newHeads`` subscription) call ``new_block``
+with each new block number, the tracker then makes no block number requests. Give it the FeeOracle
+used to send the transactions and the new blocks are reported to it too::
+
+    tracker = ReceiptTracker(w3, fee_oracle=roles.fee_oracle)
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+from hexbytes import HexBytes
+from web3 import Web3, exceptions
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+
+from .fees import FeeOracle
+from .rpc import batch_request
+
+logger = logging.getLogger(__name__)
+
+
+class ReceiptTracker:
+    """Resolves a Future per tracked transaction when its receipt shows up in a new block.
+
+    Poll it with ``poll``/``wait`` or let it poll in a background thread with ``start``. The
+    fee_oracle, if any, is told about each new block so it drops its outdated fees.
+    """
+
+    def __init__(self, web3: Web3, poll_interval: float = 1.0, fee_oracle: Optional[FeeOracle] = None):
+        self.web3 = web3
+        self.poll_interval = poll_interval
+        self.fee_oracle = fee_oracle
+        self.last_block: Optional[int] = None
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def track(self, tx_hash: str | bytes, callback: Callable[[Future], None] = None) -> Future:
+        """Return a Future resolved with the receipt of the transaction.
+
+        The callback, if any, is called with the Future once it is resolved.
+        """
+        tx_hash = HexBytes(tx_hash).hex()
+        with self._lock:
+            future = self._futures.get(tx_hash)
+            if future is None:
+                future = self._futures[tx_hash] = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        return future
+
+    @property
+    def pending(self) -> list[str]:
+        with self._lock:
+            return list(self._futures)
+
+    def new_block(self, block_number: int) -> int:
+        """Fetch the receipts if block_number is a new block. Returns the number of receipts found."""
+        if self.last_block is not None and block_number <= self.last_block:
+            return 0
+        self.last_block = block_number
+        if self.fee_oracle is not None:
+            self.fee_oracle.new_block(block_number)
+        return self._fetch_receipts()
+
+    def poll(self) -> int:
+        """Check for a new block and fetch the receipts. Returns the number of receipts found."""
+        return self.new_block(self.web3.eth.block_number)
+
+    def _fetch_receipts(self) -> int:
+        tx_hashes = self.pending
+        if not tx_hashes:
+            return 0
+        responses = batch_request(self.web3, [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in tx_hashes])
+        found = 0
+        for tx_hash, response in zip(tx_hashes, responses):
+            if "error" in response:
+                logger.warning(f"Error getting the receipt of {tx_hash}: {response['error']}")
+                continue
+            if response.get("result") is None:
+                continue
+            with self._lock:
+                future = self._futures.pop(tx_hash, None)
+            if future is None:  # resolved meanwhile by another poll
+                continue
+            future.set_result(AttributeDict.recursive(receipt_formatter(response["result"])))
+            found += 1
+        return found
+
+    def wait(self, timeout: float = 120) -> dict[str, AttributeDict]:
+        """Poll until all the tracked transactions have a receipt, returns them by tx hash.
+
+        Raises TimeExhausted if some receipts are still missing after timeout seconds, those
+        transactions are still tracked.
+        """
+        futures = {tx_hash: self.track(tx_hash) for tx_hash in self.pending}
+        deadline = time.monotonic() + timeout
+        while self.pending:
+            if self._thread is None:
+                self.poll()
+            if not self.pending:
+                break
+            if time.monotonic() >= deadline:
+                raise exceptions.TimeExhausted(f"No receipts after {timeout} seconds for {self.pending}")
+            time.sleep(self.poll_interval)
+        return {tx_hash: future.result() for tx_hash, future in futures.items()}
+
+    def start(self):
+        """Poll in a background thread until ``stop`` is called."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ReceiptTracker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(f"Error polling for receipts: {e}")
+            self._stop.wait(self.poll_interval)
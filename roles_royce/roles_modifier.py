@@ -1,21 +1,33 @@
 from dataclasses import dataclass
-from enum import IntEnum
+from functools import lru_cache
+import json
 import logging
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from web3 import Web3, exceptions
 from web3.types import Address, ChecksumAddress
 from eth_account import Account
 
+from .constants import Operation  # noqa: F401 (re-exported)
+from .fees import FeeOracle
+from .nonces import NonceManager, is_nonce_too_low
+from .protocols.base import MethodEncoder
+from .rpc import RPCError, batch_results, to_int
+
+if TYPE_CHECKING:
+    from .chunking import GasCostModel
+    from .permissions import RolesPermissions
+
 logger = logging.getLogger(__name__)
 
 class TransactionWouldBeReverted(Exception):
     pass
 
 
-class Operation(IntEnum):
-    CALL = 0
-    DELEGATE_CALL = 1
+@lru_cache
+def _exec_transaction_with_role_encoder(contract_abi: str) -> MethodEncoder:
+    [abi] = [e for e in json.loads(contract_abi) if e.get("name") == "execTransactionWithRole"]
+    return MethodEncoder("execTransactionWithRole", [i["type"] for i in abi["inputs"]])
 
 
 @dataclass
@@ -37,6 +49,12 @@ class RolesMod:
     operation: Operation = Operation.CALL
     should_revert: bool = True
     nonce: Optional[int] = None
+    gas_model: Optional["GasCostModel"] = None  # when set, it learns from every gas estimation
+    batch_preflight: bool = False  # send the execute pre-flight calls as a single JSON-RPC batch
+    nonce_manager: Optional[NonceManager] = None  # when set and nonce is not, nonces are handed out locally
+    fee_oracle: Optional[FeeOracle] = None  # defaults to the oracle shared by the users of the web3 instance
+    permissions: Optional["RolesPermissions"] = None  # when set, check() evaluates the permissions locally
+    confirm_check: bool = False  # with permissions, also confirm the allowed transactions with an eth_call
 
     def __post_init__(self):
         if not self.private_key and not self.account:
@@ -47,45 +65,83 @@ class RolesMod:
         self.contract = self.web3.eth.contract(
             address=self.contract_address, abi=self.contract_abi
         )
+        if self.fee_oracle is None:
+            self.fee_oracle = self._default_fee_oracle()
+        self._cached_chain_id: Optional[int] = None  # the chain of a web3 instance does not change
+
+    def _get_chain_id(self) -> int:
+        if self._cached_chain_id is None:
+            self._cached_chain_id = self.web3.eth.chain_id
+        return self._cached_chain_id
+
+    def _default_fee_oracle(self) -> Optional[FeeOracle]:
+        return FeeOracle.for_web3(self.web3)
 
     def get_base_fee_per_gas(self) -> int:
-        latest_block = self.web3.eth.get_block("latest")
-        base_fee_per_gas = latest_block["baseFeePerGas"]
-        return base_fee_per_gas
+        return self.fee_oracle.fees().base_fee
+
+    def check(self, contract_address: str, data: str | bytes, block='latest') -> bool:
+        """make a static call to validate a transaction.
 
-    def check(self, contract_address: str, data: str, block='latest') -> bool:
-        """make a static call to validate a transaction."""
+        The data can be given as a hex str or as bytes, the same applies to the other methods.
+        When the permissions of the roles are loaded the check is done in memory, and only the
+        allowed transactions are confirmed with the static call if confirm_check is set."""
+        allowed = self._check_permissions(contract_address, data)
+        if allowed is not None:
+            return allowed
         try:
             self._build_exec_transaction(contract_address, data).call({"from": self.account}, block_identifier=block)
             return True
         except exceptions.ContractLogicError:
             return False
 
-    def estimate_gas(self, contract_address: str, data: str, block='latest') -> int:
-        return self._build_exec_transaction(contract_address, data).estimate_gas({"from": self.account}, block_identifier=block)
+    def _check_permissions(self, contract_address: str, data: str | bytes) -> Optional[bool]:
+        """The result of the check from the loaded permissions, None if the static call has to be made."""
+        if self.permissions is None:
+            return None
+        if not self.permissions.is_allowed(self.role, contract_address, data, self.value, self.operation,
+                                           self.account):
+            return False
+        return None if self.confirm_check else True
+
+    def estimate_gas(self, contract_address: str, data: str | bytes, block='latest') -> int:
+        gas = self._build_exec_transaction(contract_address, data).estimate_gas({"from": self.account}, block_identifier=block)
+        if self.gas_model is not None:
+            self.gas_model.observe_calldata(contract_address, data, self.operation, gas)
+        return gas
 
     def execute(self,
                 contract_address: str,
-                data: str,
+                data: str | bytes,
                 max_priority_fee: int = None,
                 max_fee_per_gas: int = None,
                 check: bool = True,
                 fee_multiplier: float = 1.2,
                 gas_limit_multiplier: float = 1.4
                 ) -> str:
-        """Execute a role-based transaction. Returns the transaction hash as a str."""
+        """Execute a role-based transaction. Returns the transaction hash as a str.
+
+        With ``batch_preflight`` the check, fees, gas estimation, chain id and nonce are all
+        requested in one JSON-RPC batch instead of one round-trip each."""
+
+        if self.batch_preflight:
+            return self._execute_batched(contract_address, data, max_priority_fee, max_fee_per_gas, check,
+                                         fee_multiplier, gas_limit_multiplier)
 
         if check and not self.check(contract_address, data):
             raise TransactionWouldBeReverted()
 
-        if not max_priority_fee:
-            max_priority_fee = self.web3.eth.max_priority_fee
-
-        if not max_fee_per_gas:
-            max_fee_per_gas = max_priority_fee + int(self.get_base_fee_per_gas() * fee_multiplier)
+        if not max_priority_fee or not max_fee_per_gas:
+            fees = self.fee_oracle.fees()
+            max_priority_fee = max_priority_fee or fees.priority_fee
+            max_fee_per_gas = max_fee_per_gas or max_priority_fee + int(fees.next_base_fee * fee_multiplier)
 
         gas_limit = int(self.estimate_gas(contract_address, data) * gas_limit_multiplier)
 
+        if self._uses_nonce_manager():
+            return self._send_with_managed_nonce(contract_address, data, gas_limit, max_priority_fee,
+                                                 max_fee_per_gas, self._get_chain_id())
+
         nonce = self.nonce or self.web3.eth.get_transaction_count(self.account)
 
         tx = self._build_transaction(contract_address, data, gas_limit, max_priority_fee, max_fee_per_gas, nonce)
@@ -94,7 +150,92 @@ class RolesMod:
         executed_txn = self._send_raw_transaction(signed_txn.rawTransaction)
         return executed_txn.hex()
 
-    def _build_exec_transaction(self, contract_address: str, data: str):
+    def _execute_batched(self, contract_address, data, max_priority_fee, max_fee_per_gas, check,
+                         fee_multiplier, gas_limit_multiplier) -> str:
+        exec_tx = {"from": self.account, "to": self.contract.address,
+                   "data": "0x" + self._exec_transaction_data(contract_address, data).hex()}
+        calls = {}
+        if check:
+            allowed = self._check_permissions(contract_address, data)
+            if allowed is False:
+                raise TransactionWouldBeReverted()
+            if allowed is None:
+                calls["check"] = ("eth_call", [exec_tx, "latest"])
+        fees = None
+        if not max_priority_fee or not max_fee_per_gas:
+            fees = self.fee_oracle.cached()
+            if fees is None:
+                calls["fee_history"] = self.fee_oracle.fee_history_request()
+        calls["gas"] = ("eth_estimateGas", [exec_tx, "latest"])
+        if self._cached_chain_id is None:
+            calls["chain_id"] = ("eth_chainId", [])
+        if not self.nonce and not self._uses_nonce_manager():
+            calls["nonce"] = ("eth_getTransactionCount", [self.account, "latest"])
+
+        try:
+            results = dict(zip(calls, batch_results(self.web3, list(calls.values()))))
+        except RPCError as e:
+            if check and e.is_revert:
+                raise TransactionWouldBeReverted() from e
+            raise
+
+        if "fee_history" in results:
+            fees = self.fee_oracle.update(results["fee_history"])
+        if fees is not None:
+            max_priority_fee = max_priority_fee or fees.priority_fee
+            max_fee_per_gas = max_fee_per_gas or max_priority_fee + int(fees.next_base_fee * fee_multiplier)
+        gas = to_int(results["gas"])
+        if self.gas_model is not None:
+            self.gas_model.observe_calldata(contract_address, data, self.operation, gas)
+        gas_limit = int(gas * gas_limit_multiplier)
+        if "chain_id" in results:
+            self._cached_chain_id = to_int(results["chain_id"])
+        chain_id = self._cached_chain_id
+        if self._uses_nonce_manager():
+            return self._send_with_managed_nonce(contract_address, data, gas_limit, max_priority_fee,
+                                                 max_fee_per_gas, chain_id)
+        nonce = self.nonce or to_int(results["nonce"])
+
+        tx = self._build_transaction(contract_address, data, gas_limit, max_priority_fee,
+                                     max_fee_per_gas, nonce, chain_id=chain_id)
+        logger.debug(f"Executing tx: {tx}")
+        signed_txn = self._sign_transaction(tx)
+        executed_txn = self._send_raw_transaction(signed_txn.rawTransaction)
+        return executed_txn.hex()
+
+    def _uses_nonce_manager(self) -> bool:
+        return self.nonce_manager is not None and not self.nonce
+
+    def _send_with_managed_nonce(self, contract_address, data, gas_limit, max_priority_fee, max_fee_per_gas,
+                                 chain_id) -> str:
+        """Send the transaction with a nonce from the nonce manager, retrying once on 'nonce too low'."""
+        for attempt in range(2):
+            nonce = self.nonce_manager.reserve(self.web3, chain_id, self.account)
+            try:
+                tx = self._build_transaction(contract_address, data, gas_limit, max_priority_fee, max_fee_per_gas,
+                                             nonce, chain_id=chain_id)
+                logger.debug(f"Executing tx: {tx}")
+                executed_txn = self._send_raw_transaction(self._sign_transaction(tx).rawTransaction)
+            except Exception as e:
+                self.nonce_manager.release(chain_id, self.account, nonce)
+                if attempt == 0 and is_nonce_too_low(e):
+                    logger.info(f"Nonce {nonce} too low for {self.account}, resyncing with the node")
+                    self.nonce_manager.resync(self.web3, chain_id, self.account)
+                    continue
+                raise
+            self.nonce_manager.mark_sent(chain_id, self.account, nonce, executed_txn.hex())
+            return executed_txn.hex()
+
+    def _exec_transaction_data(self, contract_address: str, data: str | bytes) -> bytes:
+        """The calldata of execTransactionWithRole, the same as the contract function encodes."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return _exec_transaction_with_role_encoder(self.contract_abi).encode(
+            [contract_address, self.value, data, self.operation, self.role, self.should_revert])
+
+    def _build_exec_transaction(self, contract_address: str, data: str | bytes):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
         return self.contract.functions.execTransactionWithRole(
             contract_address,
             self.value,
@@ -105,15 +246,16 @@ class RolesMod:
         )
 
     def _build_transaction(self, contract_address: str,
-                           data: str,
+                           data: str | bytes,
                            gas_limit: int,
                            max_priority_fee: int,
                            max_gas: int,
-                           nonce: int):
+                           nonce: int,
+                           chain_id: Optional[int] = None):
 
         tx = self._build_exec_transaction(contract_address, data).build_transaction(
             {
-                "chainId": self.web3.eth.chain_id,
+                "chainId": self._get_chain_id() if chain_id is None else chain_id,
                 "gas": gas_limit,
                 "maxFeePerGas": max_gas,
                 "maxPriorityFeePerGas": max_priority_fee,
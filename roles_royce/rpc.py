@@ -0,0 +1,71 @@
+"""Helpers to talk JSON-RPC to the node with fewer round-trips.
+
+web3 v6 has no batch support, so :func:`batch_request` builds the JSON-RPC batch itself and
+posts it through the same session the ``HTTPProvider`` uses. For any other provider the calls
+are made one by one through ``provider.make_request``, the results are the same.
+
+The raw responses are returned: no middlewares nor result formatters are applied, hex
+quantities have to be converted by the caller (see :func:`to_int`).
+"""
+import itertools
+import json
+from typing import Any, Sequence
+
+from web3 import Web3
+from web3.providers import HTTPProvider
+from web3._utils.request import make_post_request
+
+RPCCall = tuple[str, list]
+
+_ids = itertools.count()
+
+
+class RPCError(ValueError):
+    """The node answered a request with an error."""
+
+    def __init__(self, method: str, error: dict):
+        super().__init__(error)
+        self.method = method
+        self.error = error
+
+    @property
+    def is_revert(self) -> bool:
+        """True when the error is an EVM revert, as returned by eth_call and eth_estimateGas."""
+        error = self.error if isinstance(self.error, dict) else {"message": str(self.error)}
+        return error.get("code") == 3 or "revert" in str(error.get("message", "")).lower()
+
+
+def to_int(value: str | int) -> int:
+    return value if isinstance(value, int) else int(value, 16)
+
+
+def batch_request(web3: Web3, calls: Sequence[RPCCall]) -> list[dict]:
+    """Send the (method, params) calls and return the responses in the same order.
+
+    With an ``HTTPProvider`` all the calls go in a single HTTP request.
+    """
+    provider = web3.provider
+    if not isinstance(provider, HTTPProvider):
+        return [provider.make_request(method, params) for method, params in calls]
+
+    requests = [{"jsonrpc": "2.0", "method": method, "params": params, "id": next(_ids)}
+                for method, params in calls]
+    raw_response = make_post_request(provider.endpoint_uri, json.dumps(requests).encode(),
+                                     **provider.get_request_kwargs())
+    responses = json.loads(raw_response)
+    if isinstance(responses, dict):
+        # Nodes that do not support batches answer with a single error object
+        raise RPCError("batch", responses.get("error", responses))
+    by_id = {response.get("id"): response for response in responses}
+    return [by_id.get(request["id"], {"error": {"code": -32603, "message": "missing response"}})
+            for request in requests]
+
+
+def batch_results(web3: Web3, calls: Sequence[RPCCall]) -> list[Any]:
+    """Like :func:`batch_request` but returns the results, raising RPCError for the first failed call."""
+    results = []
+    for (method, _), response in zip(calls, batch_request(web3, calls)):
+        if "error" in response:
+            raise RPCError(method, response["error"])
+        results.append(response["result"])
+    return results
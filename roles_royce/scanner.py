@@ -0,0 +1,158 @@
+"""Scan block ranges for the execTransactionWithRole calls sent to Roles modifiers.
+
+The blocks (with their transactions) are fetched in JSON-RPC batches of ``blocks_per_batch``
+blocks, with up to ``max_workers`` batches in flight, and only the receipts of the matching
+transactions are requested. The records are yielded lazily in chain order, so a backfill of
+months of history keeps at most ``max_workers`` batches in memory.
+
+Example::
+
+    scanner = RolesScanner(w3, [roles_mod_address], from_block=17_000_000)
+    for execution in scanner.scan():
+        print(execution.block_number, execution.role, execution.calls)
+        save(scanner.checkpoint())
+    ...
+    scanner = RolesScanner.from_checkpoint(w3, load())  # resumes where it stopped
+
+The checkpoint is the first block whose records have not all been yielded, so a scan resumed
+from it may yield again some records of that block, but never skips one.
+"""
+import json
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Sequence
+
+from eth_abi import decode
+from eth_utils import keccak, to_checksum_address
+
+from .constants import Operation
+from .generic_method import TxData
+from .protocols.base import Method
+from .protocols.decoder import decode_transactions
+from .roles_modifier import RolesMod
+from .rpc import batch_results, to_int
+
+logger = logging.getLogger(__name__)
+
+
+def _exec_transaction_with_role_abi() -> tuple[bytes, list[str]]:
+    [abi] = [e for e in json.loads(RolesMod.contract_abi) if e.get("name") == "execTransactionWithRole"]
+    types = [i["type"] for i in abi["inputs"]]
+    return keccak(text=f"execTransactionWithRole({','.join(types)})")[:4], types
+
+
+EXEC_WITH_ROLE_SELECTOR, _EXEC_WITH_ROLE_TYPES = _exec_transaction_with_role_abi()
+
+
+@dataclass
+class RoleExecution:
+    """An execTransactionWithRole call and the calls it made through the avatar."""
+    block_number: int
+    transaction_index: int
+    tx_hash: str
+    sender: str
+    roles_mod_address: str
+    role: int
+    to: str
+    value: int
+    data: bytes
+    operation: Operation
+    should_revert: bool
+    success: Optional[bool]  # status of the transaction receipt
+    calls: list[Method | TxData] = field(default_factory=list)  # decoded protocol calls, multiSends unpacked
+
+
+def decode_exec_transaction_with_role(data: bytes) -> Optional[tuple]:
+    """Return (to, value, data, operation, role, should_revert) of execTransactionWithRole calldata, or None."""
+    if data[:4] != EXEC_WITH_ROLE_SELECTOR:
+        return None
+    to, value, inner_data, operation, role, should_revert = decode(_EXEC_WITH_ROLE_TYPES, data[4:])
+    return to_checksum_address(to), value, inner_data, Operation(operation), role, should_revert
+
+
+class RolesScanner:
+    def __init__(self, web3, roles_mod_addresses: Sequence[str], from_block: int, to_block: Optional[int] = None,
+                 blocks_per_batch: int = 20, max_workers: int = 4, confirmations: int = 0):
+        """
+        :param to_block: the last block to scan, by default the head (minus confirmations) when the scan starts
+        :param blocks_per_batch: the number of blocks requested in each JSON-RPC batch
+        :param max_workers: the number of batches requested concurrently
+        """
+        self.web3 = web3
+        self.roles_mod_addresses = [to_checksum_address(a) for a in roles_mod_addresses]
+        self._watched = {a.lower() for a in self.roles_mod_addresses}
+        self.next_block = from_block
+        self.to_block = to_block
+        self.blocks_per_batch = blocks_per_batch
+        self.max_workers = max_workers
+        self.confirmations = confirmations
+
+    def checkpoint(self) -> dict:
+        """A JSON serializable checkpoint to resume the scan later."""
+        return {"roles_mod_addresses": self.roles_mod_addresses, "next_block": self.next_block}
+
+    @classmethod
+    def from_checkpoint(cls, web3, checkpoint: dict, **kwargs) -> "RolesScanner":
+        return cls(web3, checkpoint["roles_mod_addresses"], from_block=checkpoint["next_block"], **kwargs)
+
+    def scan(self) -> Iterator[RoleExecution]:
+        """Yield the executions from next_block up to to_block, in chain order."""
+        to_block = self.to_block
+        if to_block is None:
+            to_block = self.web3.eth.block_number - self.confirmations
+        ranges = ((start, min(start + self.blocks_per_batch - 1, to_block))
+                  for start in range(self.next_block, to_block + 1, self.blocks_per_batch))
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="RolesScanner")
+        try:
+            in_flight = deque()
+            for block_range in ranges:
+                in_flight.append((block_range, executor.submit(self._scan_range, *block_range)))
+                if len(in_flight) < self.max_workers:
+                    continue
+                yield from self._drain(*in_flight.popleft())
+            while in_flight:
+                yield from self._drain(*in_flight.popleft())
+        finally:
+            # When the caller stops iterating, the batches not started yet are not requested
+            executor.shutdown(cancel_futures=True)
+
+    def _drain(self, block_range, future) -> Iterator[RoleExecution]:
+        for execution in future.result():
+            self.next_block = execution.block_number
+            yield execution
+        self.next_block = block_range[1] + 1
+
+    def _scan_range(self, start: int, end: int) -> list[RoleExecution]:
+        blocks = batch_results(self.web3, [("eth_getBlockByNumber", [hex(n), True]) for n in range(start, end + 1)])
+        matches = []
+        for block in blocks:
+            for tx in (block or {}).get("transactions", []):
+                if (tx.get("to") or "").lower() not in self._watched:
+                    continue
+                try:
+                    decoded = decode_exec_transaction_with_role(bytes.fromhex(tx["input"][2:]))
+                except Exception as e:
+                    logger.warning(f"Could not decode the execTransactionWithRole call of {tx['hash']}: {e}")
+                    continue
+                if decoded is not None:
+                    matches.append((tx, decoded))
+        if not matches:
+            return []
+        receipts = batch_results(self.web3, [("eth_getTransactionReceipt", [tx["hash"]]) for tx, _ in matches])
+
+        executions = []
+        for (tx, (to, value, data, operation, role, should_revert)), receipt in zip(matches, receipts):
+            executions.append(RoleExecution(
+                block_number=to_int(tx["blockNumber"]),
+                transaction_index=to_int(tx["transactionIndex"]),
+                tx_hash=tx["hash"],
+                sender=to_checksum_address(tx["from"]),
+                roles_mod_address=to_checksum_address(tx["to"]),
+                role=role, to=to, value=value, data=data, operation=operation, should_revert=should_revert,
+                success=to_int(receipt["status"]) == 1 if receipt and receipt.get("status") else None,
+                calls=decode_transactions(data, to, value, operation),
+            ))
+        return executions
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from typing import List
 from eth_abi import abi
 from web3 import Web3
@@ -10,12 +11,33 @@ from .generic_method import TxData
 logger = logging.getLogger(__name__)
 
 
-def to_data_input(name, signature, args):
+def to_data_input(name, signature, args, as_bytes=False):
+    if as_bytes:
+        return Web3.keccak(text=f"{name}{signature}")[:4] + abi.encode([signature], [args])
     encoded_signature = Web3.keccak(text=f"{name}{signature}").hex()[:10]
     encoded_args = abi.encode([signature], [args]).hex()
     return f"{encoded_signature}{encoded_args}"
 
 
+def to_bytes_data(data: str | bytes | bytearray | memoryview) -> bytes:
+    """Return the calldata as bytes, converting it only if it is a hex str or a buffer."""
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return bytes.fromhex(data[2:] if data[:2] in ("0x", "0X") else data)
+    return bytes(data)
+
+
+def _tx_data_bytes(tx) -> bytes:
+    # Methods can produce the calldata as bytes directly
+    data_bytes = getattr(tx, "data_bytes", None)
+    if data_bytes is not None:
+        return data_bytes
+    return to_bytes_data(tx.data)
+
+
+MULTISEND_SELECTOR = bytes.fromhex("8d80ff0a")  # multiSend(bytes)
+
 MULTISENDS = {
     Chain.ETHEREUM: '0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761',
     Chain.GC: '0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761'
@@ -35,31 +57,90 @@ class MultiSendOffline(MultiSend):
         ).build_transaction({"gas": 1, "gasPrice": 1, "chainId": self.chain_id})["data"]
 
 
-def _make_multisend(txs: List[TxData], blockchain: Blockchain) -> tuple:
+@lru_cache(maxsize=4096)
+def _address_bytes(address: str) -> bytes:
+    raw = bytes.fromhex(address[2:] if address[:2] in ("0x", "0X") else address)
+    if len(raw) != 20:
+        raise ValueError(f"Invalid address: {address}")
+    return raw
+
+
+def pack_multisend(txs: List[TxData]) -> bytes:
+    """Return the multiSend(bytes) calldata for the txs.
+
+    The packed operation|to|value|data length|data records are written into one preallocated
+    buffer that already holds the selector and the ABI head of the bytes argument.
+    """
+    datas = [_tx_data_bytes(tx) for tx in txs]
+    payload_length = sum(85 + len(data) for data in datas)
+    buffer = bytearray(4 + 32 + 32 + (payload_length + 31) // 32 * 32)  # zero padded to a 32 bytes word
+    view = memoryview(buffer)
+    view[0:4] = MULTISEND_SELECTOR
+    view[4:36] = (32).to_bytes(32, "big")  # offset of the bytes argument
+    view[36:68] = payload_length.to_bytes(32, "big")
+    pos = 68
+    for tx, data in zip(txs, datas):
+        data_length = len(data)
+        # As MultiSendTx was used with MultiSendOperation.CALL, the operation byte stays 0
+        view[pos + 1:pos + 21] = _address_bytes(tx.contract_address)
+        view[pos + 21:pos + 53] = tx.value.to_bytes(32, "big")
+        view[pos + 53:pos + 85] = data_length.to_bytes(32, "big")
+        view[pos + 85:pos + 85 + data_length] = data
+        pos += 85 + data_length
+    return bytes(buffer)
+
+
+def unpack_multisend(data: str | bytes) -> List[TxData]:
+    """Return the transactions packed in the calldata of a multiSend(bytes) call, with bytes data."""
+    data = to_bytes_data(data)
+    if data[:4] != MULTISEND_SELECTOR:
+        raise ValueError("The data is not a multiSend call")
+    offset = 4 + int.from_bytes(data[4:36], "big")
+    length = int.from_bytes(data[offset:offset + 32], "big")
+    payload = memoryview(data)[offset + 32:offset + 32 + length]
+    if len(payload) != length:
+        raise ValueError("Malformed multiSend data")
+    txs = []
+    pos = 0
+    while pos < length:
+        data_length = int.from_bytes(payload[pos + 53:pos + 85], "big")
+        if pos + 85 + data_length > length:
+            raise ValueError("Malformed multiSend data")
+        txs.append(TxData(contract_address=Web3.to_checksum_address(payload[pos + 1:pos + 21].tobytes()),
+                          data=payload[pos + 85:pos + 85 + data_length].tobytes(),
+                          operation=Operation(payload[pos]),
+                          value=int.from_bytes(payload[pos + 21:pos + 53], "big")))
+        pos += 85 + data_length
+    return txs
+
+
+def _make_multisend(txs: List[TxData], blockchain: Blockchain, as_bytes: bool = False) -> tuple:
     multisend_address = MULTISENDS.get(blockchain)
-    transactions = [
-        MultiSendTx(
-            MultiSendOperation.CALL,
-            tx.contract_address,
-            tx.value,
-            tx.data
-        ) for tx in txs
-    ]
-    data = MultiSendOffline(
-        address=multisend_address,
-        chain_id=blockchain.chain_id,
-    ).build_tx_data(transactions)
+    data = pack_multisend(txs)
+    if not as_bytes:
+        data = "0x" + data.hex()
     return multisend_address, data
 
 
-def multi_or_one(txs: List[TxData], blockchain: Blockchain) -> TxData:
+def multi_or_one(txs: List[TxData], blockchain: Blockchain, as_bytes: bool = False) -> TxData:
+    """Return a single transaction for the txs, using the MultiSend contract if there are more than one.
+
+    With as_bytes=True the calldata of the returned transaction is always bytes, so it can be passed
+    to RolesMod without hex round-trips.
+    """
     if len(txs) > 1:
-        contract_address, data = _make_multisend(txs, blockchain)
+        contract_address, data = _make_multisend(txs, blockchain, as_bytes=as_bytes)
         return TxData(contract_address=contract_address,
                       data=data,
                       operation=Operation.DELEGATE_CALL,
                       value=0)
     elif len(txs) == 1:
-        return txs[0]
+        tx = txs[0]
+        if as_bytes:
+            return TxData(contract_address=tx.contract_address,
+                          data=_tx_data_bytes(tx),
+                          operation=tx.operation,
+                          value=tx.value)
+        return tx
     else:
         raise ValueError("No transactions found")
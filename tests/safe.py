@@ -1,12 +1,70 @@
+import json
+
 from gnosis.safe import addresses, Safe, SafeOperation
 from gnosis.eth import EthereumNetwork, EthereumClient
 from eth_account.signers.local import LocalAccount
+from web3 import Web3
 
 from roles_royce.generic_method import TxData
 from roles_royce.constants import ETHAddr, Chain
 from roles_royce.utils import multi_or_one
 
 
+class _ProviderResponse:
+    ok = True
+    status_code = 200
+
+    def __init__(self, body):
+        self.body = body
+
+    @property
+    def text(self) -> str:
+        return json.dumps(self.body)
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode()
+
+    def json(self):
+        return self.body
+
+    def raise_for_status(self):
+        pass
+
+
+class _ProviderSession:
+    """Stand-in of the requests session of EthereumClient, sending its JSON-RPC requests (single or
+    batched, posted by its HTTPProviders or by itself) one at a time through a provider."""
+
+    def __init__(self, provider):
+        self.provider = provider
+
+    def _respond(self, request: dict) -> dict:
+        return {**self.provider.make_request(request["method"], request["params"]), "id": request["id"]}
+
+    def post(self, url, data=None, **kwargs):
+        payload = kwargs["json"] if "json" in kwargs else json.loads(data)
+        if isinstance(payload, list):
+            return _ProviderResponse([self._respond(request) for request in payload])
+        return _ProviderResponse(self._respond(payload))
+
+
+class ProviderEthereumClient(EthereumClient):
+    """EthereumClient sending all its requests through the provider of w3 (e.g. the CassetteProvider of the
+    local node), instead of connecting to the node by its url.
+
+    Its http session is a _ProviderSession, which the providers it builds for its url use too.
+    The url only identifies the session, it is never connected to.
+    """
+
+    def __init__(self, w3: Web3, **kwargs):
+        self.provider = w3.provider
+        super().__init__(f"http://provider-{id(self.provider)}.invalid", **kwargs)
+
+    def _prepare_http_session(self, retry_count: int) -> _ProviderSession:
+        return _ProviderSession(self.provider)
+
+
 class SimpleSafe(Safe):
     """A simple Safe with one signer to be used in tests"""
 
@@ -24,8 +82,8 @@ class SimpleSafe(Safe):
         return safe_tx.execute(self.signer_key)
 
     @classmethod
-    def build(cls, owner: LocalAccount, node_url) -> "SimpleSafe":
-        ethereum_client = EthereumClient(node_url)
+    def build(cls, owner: LocalAccount, w3: Web3) -> "SimpleSafe":
+        ethereum_client = ProviderEthereumClient(w3)
         ethereum_tx_sent = cls.create(ethereum_client, deployer_account=owner,
                                              master_copy_address=addresses.MASTER_COPIES[EthereumNetwork.MAINNET][0][0],
                                              owners=[owner.address], threshold=1)
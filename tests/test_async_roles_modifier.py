@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+from web3 import AsyncWeb3
+
+from roles_royce.async_roles_modifier import AsyncNonceManager, AsyncRolesMod
+from roles_royce.fees import FeeOracle
+from roles_royce.nonces import NonceManager
+from roles_royce.permissions import RolesPermissions
+from roles_royce.roles_modifier import TransactionWouldBeReverted
+from .utils import fake_rpc_node
+
+ROLE = 2
+ROLES_MOD_ADDRESS = "0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503"
+USDT = "0x4ECaBa5870353805a9F068101A40E0f32ed605C6"
+PRIVATE_KEY = '0xa60429f7d6b751ca19d52302826b4a611893fbb138f0059f354b79846f2ab125'
+USDT_APPROVE = "0x095ea7b30000000000000000000000007f90122bf0700f9e7e1f688fe926940e8839f35300000000000000000000000000000000000000000000000000000000000003e8"
+TX_HASH = "0x" + "ab" * 32
+
+NODE_RESULTS = {
+    "eth_call": "0x" + "00" * 31 + "01",
+    "eth_maxPriorityFeePerGas": hex(10),
+    "eth_feeHistory": {"oldestBlock": hex(1), "baseFeePerGas": [hex(100), hex(112)], "gasUsedRatio": [1.0]},
+    "eth_estimateGas": hex(100_000),
+    "eth_chainId": hex(0x64),
+    "eth_getTransactionCount": hex(42),
+    "eth_sendRawTransaction": TX_HASH,
+}
+
+
+class AsyncRolesModTester(AsyncRolesMod):
+    """Test class that captures the signed txs"""
+    def _sign_transaction(self, tx):
+        self.txs = getattr(self, "txs", []) + [tx]
+        return super()._sign_transaction(tx)
+
+
+def test_concurrent_executions_get_consecutive_nonces(fake_rpc_node):
+    node = fake_rpc_node(dict(NODE_RESULTS))
+    roles = AsyncRolesModTester(role=ROLE, contract_address=ROLES_MOD_ADDRESS,
+                                web3=AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(node.url)),
+                                private_key=PRIVATE_KEY, nonce_manager=AsyncNonceManager())
+
+    async def main():
+        return await asyncio.gather(*[roles.execute(USDT, USDT_APPROVE) for _ in range(3)])
+
+    assert asyncio.run(main()) == [TX_HASH] * 3
+    assert sorted(tx["nonce"] for tx in roles.txs) == [42, 43, 44]
+    assert all(tx["chainId"] == 0x64 and tx["gas"] == 140_000 and tx["maxFeePerGas"] == 130 for tx in roles.txs)
+    assert sum(methods.count("eth_getTransactionCount") for methods in node.posts) == 1
+
+
+def test_failed_send_releases_only_its_nonce(fake_rpc_node):
+    sends = []
+
+    def send_raw_transaction(params):
+        sends.append(params)
+        if len(sends) == 2:
+            return {"error": {"code": -32000, "message": "insufficient funds for gas"}}
+        return TX_HASH
+
+    node = fake_rpc_node(dict(NODE_RESULTS, eth_sendRawTransaction=send_raw_transaction))
+    nonce_manager = AsyncNonceManager()
+    roles = AsyncRolesModTester(role=ROLE, contract_address=ROLES_MOD_ADDRESS,
+                                web3=AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(node.url)),
+                                private_key=PRIVATE_KEY, nonce_manager=nonce_manager)
+
+    async def main():
+        results = await asyncio.gather(*[roles.execute(USDT, USDT_APPROVE) for _ in range(3)],
+                                       return_exceptions=True)
+        return results, await roles.execute(USDT, USDT_APPROVE)
+
+    results, last = asyncio.run(main())
+    assert sum(isinstance(result, Exception) for result in results) == 1 and last == TX_HASH
+    # The nonce of the failed send is handed out again, those of the sent transactions are not
+    assert sorted(tx["nonce"] for tx in roles.txs[:3]) == [42, 43, 44]
+    assert set(nonce_manager.pending(0x64, roles.account)) == {42, 43, 44}
+    assert sum(methods.count("eth_getTransactionCount") for methods in node.posts) == 1
+
+
+def test_execute_reverted(fake_rpc_node):
+    node = fake_rpc_node(dict(NODE_RESULTS, eth_call={"error": {"code": 3, "message": "execution reverted"}}))
+    roles = AsyncRolesMod(role=ROLE, contract_address=ROLES_MOD_ADDRESS,
+                          web3=AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(node.url)), private_key=PRIVATE_KEY)
+    with pytest.raises(TransactionWouldBeReverted):
+        asyncio.run(roles.execute(USDT, USDT_APPROVE))
+    assert asyncio.run(roles.check(USDT, USDT_APPROVE)) is False
+
+
+def test_receipt_polling(fake_rpc_node):
+    receipts = [None, None, {"transactionHash": TX_HASH, "status": "0x1", "blockNumber": "0x2"}]
+    node = fake_rpc_node({"eth_getTransactionReceipt": lambda params: receipts.pop(0)})
+    roles = AsyncRolesMod(role=ROLE, contract_address=ROLES_MOD_ADDRESS,
+                          web3=AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(node.url)), private_key=PRIVATE_KEY,
+                          receipt_poll_interval=0.01)
+    receipt = asyncio.run(roles.get_tx_receipt(TX_HASH))
+    assert receipt.status == 1
+    assert len(node.posts) == 3
+
+
+def test_permissions_check_without_requests(fake_rpc_node):
+    node = fake_rpc_node(dict(NODE_RESULTS))
+    permissions = RolesPermissions()
+    permissions.apply_call("allowTarget", ROLE, USDT, 0)
+    roles = AsyncRolesMod(role=ROLE, contract_address=ROLES_MOD_ADDRESS,
+                          web3=AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(node.url)), private_key=PRIVATE_KEY,
+                          permissions=permissions)
+    assert roles.fee_oracle is None
+    assert asyncio.run(roles.check(USDT, USDT_APPROVE)) is True
+    assert asyncio.run(roles.check(ROLES_MOD_ADDRESS, USDT_APPROVE)) is False
+    assert node.posts == []
+
+    roles.confirm_check = True
+    assert asyncio.run(roles.check(USDT, USDT_APPROVE)) is True
+    assert ["eth_call"] in node.posts
+    assert asyncio.run(roles.get_base_fee_per_gas()) == 100
+
+
+@pytest.mark.parametrize("options", [{"batch_preflight": True}, {"fee_oracle": FeeOracle(None)},
+                                     {"nonce_manager": NonceManager()}])
+def test_sync_only_options_raise(options):
+    with pytest.raises(ValueError):
+        AsyncRolesMod(role=ROLE, contract_address=ROLES_MOD_ADDRESS, web3=AsyncWeb3(), private_key=PRIVATE_KEY,
+                      **options)
@@ -1,6 +1,8 @@
 import pytest
+from eth_abi import decode
 
 from roles_royce import check, Chain
+from roles_royce.protocols.balancer_math import PoolStateCache
 from roles_royce.protocols.eth import balancer
 
 from .utils import web3_eth
@@ -184,3 +186,99 @@ def test_join_pool_exact(web3_eth):
                     "00000000000000000060000000000000000000000000000000000000000000000000e95a6b91df94680000000000000000" \
                     "000000000000000000000000000000000000000000000000020000000000000000000000000000000000000000000000f7" \
                     "0a2b39e417e9fed2000000000000000000000000000000000000000000000101f8634eee9faad825"
+
+
+def test_offline_math_matches_queries(web3_eth):
+    # The legacy MetaStablePool wstETH/WETH, the results are those of BALANCER_Queries in
+    # test_exit_pool_single and test_join_pool_exact at the same block
+    pool = PoolStateCache(web3_eth).get(bb_a_USD_pid, block_identifier=17658530)
+    bpt_in, amounts_out = pool.query_single_asset_exit(16991614618808728544, exit_token_index=1)
+    assert bpt_in == 16991614618808728544
+    assert amounts_out == [0, 17604819345413045908]
+    bpt_out, amounts_in = pool.query_exact_tokens_join([0, 17604819345413045908])
+    assert bpt_out == 16984717609097619472
+
+
+B_80BAL_20WETH_pid = "0x5c6ee304399dbdb9c8ef030ab642b10820db8f56000200000000000000000014"
+QUERY_BATCH_SWAP_ABI = [{
+    "name": "queryBatchSwap", "type": "function", "stateMutability": "nonpayable",
+    "inputs": [{"name": "kind", "type": "uint8"},
+               {"name": "swaps", "type": "tuple[]", "components": [
+                   {"name": "poolId", "type": "bytes32"}, {"name": "assetInIndex", "type": "uint256"},
+                   {"name": "assetOutIndex", "type": "uint256"}, {"name": "amount", "type": "uint256"},
+                   {"name": "userData", "type": "bytes"}]},
+               {"name": "assets", "type": "address[]"},
+               {"name": "funds", "type": "tuple", "components": [
+                   {"name": "sender", "type": "address"}, {"name": "fromInternalBalance", "type": "bool"},
+                   {"name": "recipient", "type": "address"}, {"name": "toInternalBalance", "type": "bool"}]}],
+    "outputs": [{"name": "", "type": "int256[]"}]}]
+
+
+def test_offline_legacy_weighted_math_matches_queries(web3_eth):
+    # B-80BAL-20WETH is a WeightedPool2Tokens, BAL in for WETH out has the exponent 4 the newer pools shortcut
+    block = 17658530
+    pool = PoolStateCache(web3_eth).get(B_80BAL_20WETH_pid, block_identifier=block)
+    assert pool.legacy
+    vault = web3_eth.eth.contract(address=balancer.CrossChainAddr.BalancerVault, abi=QUERY_BATCH_SWAP_ABI)
+    for amount_in in [10 ** 18, 1_000 * 10 ** 18]:
+        deltas = vault.functions.queryBatchSwap(
+            balancer.SwapKind.GIVEN_IN, [(bytes.fromhex(B_80BAL_20WETH_pid[2:]), 0, 1, amount_in, b"")],
+            list(pool.tokens), (avatar_address, False, avatar_address, False)).call(block_identifier=block)
+        assert deltas == [amount_in, -pool.query_swap_given_in(0, 1, amount_in)]
+
+    m = balancer.WeightedSingleAssetQueryExit(pool_id=B_80BAL_20WETH_pid, avatar=avatar_address,
+                                              assets=list(pool.tokens), min_amounts_out=[0, 0],
+                                              bpt_amount_in=10 ** 18, exit_token_index=1)
+    bpt_in, amounts_out = m.call(web3=web3_eth, block_identifier=block)
+    assert (bpt_in, amounts_out) == pool.query_single_asset_exit(10 ** 18, exit_token_index=1)
+
+
+def test_sort_assets():
+    weth = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+    assert balancer.sort_assets([weth, asset1], [1, 2], [3, 4]) == ([asset1, weth], [2, 1], [4, 3])
+    # ETH (the zero address) is sorted as WETH
+    assert balancer.sort_assets([asset2, asset1], [1, 2]) == ([asset1, asset2], [2, 1])
+    assert balancer.sort_assets([asset3, asset2, asset1])[0] == [asset1, asset3, asset2]
+    with pytest.raises(balancer.InvalidArgument):
+        balancer.sort_assets([asset1, asset2], [1])
+
+
+def test_pool_address():
+    assert balancer.pool_address(bb_a_USD_pid) == "0x32296969Ef14EB0c6d29669C550D4a0449130230"
+
+
+def test_weighted_user_data():
+    m = balancer.WeightedProportionalExit(pool_id=bb_a_USD_pid, avatar=avatar_address, assets=[asset1, asset3],
+                                          min_amounts_out=[0, 0], bpt_amount_in=10)
+    assert decode(["uint256", "uint256"], m.args.user_data) == (balancer.WeightedPoolExitKind.EXACT_BPT_IN_FOR_TOKENS_OUT, 10)
+    m = balancer.WeightedCustomExit(pool_id=bb_a_USD_pid, avatar=avatar_address, assets=[asset1, asset3],
+                                    amounts_out=[1, 2], max_bpt_amount_in=3)
+    assert decode(["uint256", "uint256[]", "uint256"], m.args.user_data) == (2, (1, 2), 3)
+    m = balancer.WeightedSingleAssetJoin(pool_id=bb_a_USD_pid, avatar=avatar_address, assets=[asset1, asset3],
+                                         max_amounts_in=[5, 0], bpt_amount_out=4, join_token_index=0)
+    assert decode(["uint256", "uint256", "uint256"], m.args.user_data) == (2, 4, 0)
+    m = balancer.WeightedProportionalJoin(pool_id=bb_a_USD_pid, avatar=avatar_address, assets=[asset1, asset3],
+                                          max_amounts_in=[5, 6], bpt_amount_out=4)
+    assert decode(["uint256", "uint256"], m.args.user_data) == (3, 4)
+    # The kinds shared with the stable pools encode the same
+    m = balancer.WeightedExactTokensJoin(pool_id=bb_a_USD_pid, avatar=avatar_address, assets=[asset1, asset3],
+                                         amounts_in=[5, 6], min_bpt_out=4)
+    assert m.data == balancer.ExactTokensJoin(pool_id=bb_a_USD_pid, avatar=avatar_address, assets=[asset1, asset3],
+                                              amounts_in=[5, 6], min_bpt_out=4).data
+
+
+def test_swaps():
+    m = balancer.Swap(pool_id=bb_a_USD_pid, avatar=avatar_address, kind=balancer.SwapKind.GIVEN_IN, asset_in=asset2,
+                      asset_out=asset1, amount=10, limit=9, deadline=1_700_000_000)
+    assert m.get_encoder().selector.hex() == "52bbbe29"
+    assert m.value == 10  # the native token is sent
+    assert m.args_list[1] == (avatar_address, False, avatar_address, False)
+
+    m = balancer.BatchSwap(avatar=avatar_address, kind=balancer.SwapKind.GIVEN_OUT,
+                           swaps=[(bb_a_USD_pid, 0, 1, 10, b"")], assets=[asset2, asset1], limits=[12, -10],
+                           deadline=1_700_000_000)
+    assert m.get_encoder().selector.hex() == "945bcec9"
+    assert m.value == 12
+    with pytest.raises(balancer.InvalidArgument):
+        balancer.BatchSwap(avatar=avatar_address, kind=balancer.SwapKind.GIVEN_IN, swaps=[], assets=[asset1],
+                           limits=[], deadline=0)
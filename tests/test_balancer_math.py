@@ -0,0 +1,445 @@
+import math
+
+import pytest
+from eth_abi import decode, encode
+from web3 import Web3
+
+from roles_royce.constants import CrossChainAddr, ETHAddr
+from roles_royce.protocols.balancer_math import ONE, BalancerMathError, StablePool, WeightedPool, max_limit, min_limit
+from roles_royce.protocols.balancer_math import quote_exact_tokens_joins, quote_single_asset_exits, quote_single_token_joins
+from roles_royce.protocols.balancer_math import PoolGraph, PoolStateCache, fixed_point, log_exp_math, stable_math, weighted_math
+from roles_royce.protocols.eth import balancer
+from roles_royce.protocols.multicall import AGGREGATE3_SELECTOR
+from .utils import fake_rpc_node
+
+pool_id = "0x32296969ef14eb0c6d29669c550d4a0449130230000200000000000000000080"
+avatar_address = '0x0bEcEb88bf999727F52f0f8EfeD66d92c089BD45'
+wstETH = "0x7f39C581F595B53c5cb19bD0b3f8dA6c935E2Ca0"
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+
+
+def make_pool(**kwargs):
+    state = dict(pool_id=pool_id, tokens=[wstETH, WETH],
+                 balances=[30_000 * ONE + 123456789, 34_000 * ONE + 987654321],
+                 scaling_factors=[1_130_000_000_000_000_000, ONE],  # wstETH with its price rate
+                 amp=50_000, swap_fee=400_000_000_000_000, total_supply=68_000 * ONE, block_number=17658530)
+    state.update(kwargs)
+    return StablePool(**state)
+
+
+def test_fixed_point_rounding():
+    assert fixed_point.mul_down(3, ONE // 2) == 1
+    assert fixed_point.mul_up(3, ONE // 2) == 2
+    assert fixed_point.div_down(1, 3) == 333333333333333333
+    assert fixed_point.div_up(1, 3) == 333333333333333334
+    assert fixed_point.div_up(0, 3) == 0
+    assert fixed_point.int_div_up(7, 2) == 4
+    assert fixed_point.complement(2 * ONE) == 0
+    with pytest.raises(BalancerMathError, match="SUB_OVERFLOW"):
+        fixed_point.sub(1, 2)
+    with pytest.raises(BalancerMathError):
+        fixed_point.div_down(1, 0)
+
+
+def test_invariant():
+    assert stable_math.calculate_invariant(50_000, [0, 0], round_up=True) == 0
+    # With equal balances the invariant is the sum of the balances
+    assert stable_math.calculate_invariant(50_000, [1000 * ONE, 1000 * ONE], round_up=True) in range(2000 * ONE - 2,
+                                                                                                        2000 * ONE + 3)
+    balances = [1000 * ONE, 3000 * ONE]
+    invariant = stable_math.calculate_invariant(100_000, balances, round_up=True)
+    assert invariant < 4000 * ONE
+    # The new invariants of the joins and exits are rounded down
+    assert invariant - 3 <= stable_math.calculate_invariant(100_000, balances, round_up=False) <= invariant
+    # A lower amplification weights the imbalance more
+    assert stable_math.calculate_invariant(1_000, balances, round_up=True) < invariant
+    for i in range(2):
+        balance = stable_math.get_token_balance_given_invariant_and_all_other_balances(100_000, balances, invariant, i)
+        # The contract rounds the invariant and the balance, the error is of a few wei per 10**18
+        assert abs(balance - balances[i]) < 10 ** 6
+
+
+def test_swaps_round_in_favor_of_the_pool():
+    balances = [1000 * ONE, 1200 * ONE, 900 * ONE]
+    invariant = stable_math.calculate_invariant(200_000, balances, round_up=True)
+    out = stable_math.calc_out_given_in(200_000, balances, 0, 1, 10 * ONE, invariant)
+    assert 9 * ONE < out < 10 * ONE + ONE // 10
+    back = stable_math.calc_in_given_out(200_000, balances, 0, 1, out, invariant)
+    assert 10 * ONE <= back < 10 * ONE + 10 ** 6
+    assert balances == [1000 * ONE, 1200 * ONE, 900 * ONE]
+
+
+def test_joins():
+    pool = make_pool()
+    bpt_out, amounts_in = pool.query_exact_tokens_join([10 * ONE, 0])
+    assert amounts_in == [10 * ONE, 0]
+    assert 10 * ONE < bpt_out < 12 * ONE
+
+    # Joining a token for the BPT it is worth gives back about the same amount
+    _, [amount_in, zero] = pool.query_single_asset_join(bpt_out, join_token_index=0)
+    assert zero == 0
+    assert 10 * ONE <= amount_in < 10 * ONE + 10 ** 15
+
+    bpt_out, amounts_in = pool.query_proportional_join(68 * ONE)
+    assert bpt_out == 68 * ONE
+    assert amounts_in == [30 * ONE + 123458, 34 * ONE + 987655]
+
+
+def test_exits():
+    pool = make_pool()
+    bpt_in, amounts_out = pool.query_single_asset_exit(10 * ONE, exit_token_index=1)
+    assert bpt_in == 10 * ONE
+    assert amounts_out[0] == 0 and 9 * ONE < amounts_out[1] < 10 * ONE
+
+    bpt_in, amounts_out = pool.query_custom_exit(amounts_out)
+    assert 10 * ONE <= bpt_in < 10 * ONE + 10 ** 15
+
+    bpt_in, amounts_out = pool.query_proportional_exit(68 * ONE)
+    assert amounts_out == [30 * ONE + 123456, 34 * ONE + 987654]
+
+    with pytest.raises(IndexError):
+        pool.query_single_asset_exit(ONE, exit_token_index=2)
+    with pytest.raises(BalancerMathError):
+        pool.query_single_asset_exit(69_000 * ONE, exit_token_index=0)
+
+
+def test_due_protocol_fees_reduce_the_balances():
+    pool = make_pool()
+    with_fees = make_pool(last_invariant=pool.invariant * 999 // 1000, last_invariant_amp=50_000,
+                          protocol_swap_fee=ONE // 2)
+    assert with_fees.upscaled_balances[0] == pool.upscaled_balances[0]
+    assert with_fees.upscaled_balances[1] < pool.upscaled_balances[1]
+    assert with_fees.query_single_asset_exit(ONE, 1)[1][1] < pool.query_single_asset_exit(ONE, 1)[1][1]
+
+
+def test_builders():
+    pool = make_pool()
+    assert min_limit(1000, 0.01) == 990
+    assert max_limit(1000, 0.01) == 1010
+    with pytest.raises(ValueError):
+        min_limit(1000, 1.5)
+
+    _, amounts_out = pool.query_single_asset_exit(10 * ONE, exit_token_index=1)
+    m = pool.single_asset_exit(avatar_address, 10 * ONE, exit_token_index=1, max_slippage=0.01,
+                               assets=[wstETH, "0x0000000000000000000000000000000000000000"])
+    expected = balancer.SingleAssetExit(pool_id=pool_id, avatar=avatar_address,
+                                        assets=[wstETH, "0x0000000000000000000000000000000000000000"],
+                                        min_amounts_out=[0, min_limit(amounts_out[1], 0.01)],
+                                        bpt_amount_in=10 * ONE, exit_token_index=1)
+    assert m.data == expected.data
+
+    m = pool.exact_tokens_join(avatar_address, [ONE, 2 * ONE], max_slippage=0.005)
+    assert isinstance(m, balancer.ExactTokensJoin)
+    assert m.args.max_amounts_in == [ONE, 2 * ONE]
+    assert m.args.assets == [wstETH, WETH]
+
+    m = pool.proportional_join(avatar_address, ONE, max_slippage=0.01)
+    assert m.args.max_amounts_in == [max_limit(a, 0.01) for a in pool.query_proportional_join(ONE)[1]]
+
+
+def test_batch_quotes_match_the_single_quotes():
+    pool = make_pool()
+    bpt_amounts = [0, 1, 10 ** 15, ONE, 10 * ONE, 1000 * ONE, 20_000 * ONE]
+    quote = quote_single_asset_exits(pool, bpt_amounts, exit_token_index=0)
+    assert len(quote) == len(bpt_amounts)
+    # The pool reverts for exits of a few wei
+    assert quote.outputs[:2] == [None, None] and math.isnan(quote.price_impacts[1])
+    assert quote.outputs[2:] == [pool.query_single_asset_exit(bpt, 0)[1][0] for bpt in bpt_amounts[2:]]
+    # The price impact grows with the size of the exit
+    assert quote.price_impacts[3] < quote.price_impacts[5] < quote.price_impacts[6]
+    assert 0 < quote.price_impacts[3] < 0.001  # mostly the swap fee of the taxable part
+
+    rows = [[ONE, 0], [0, ONE], [30 * ONE, 34 * ONE], [5_000 * ONE, 10], [0, 0]]
+    quote = quote_exact_tokens_joins(pool, rows)
+    assert quote.outputs[:-1] == [pool.query_exact_tokens_join(row)[0] for row in rows[:-1]]
+    with pytest.raises(BalancerMathError):
+        pool.query_exact_tokens_join([0, 0])
+    assert quote.outputs[-1] is None
+    assert abs(quote.price_impacts[2]) < 1e-6  # a proportional join pays no fees
+
+    quote = quote_single_token_joins(pool, [ONE, 100 * ONE], join_token_index=1)
+    assert quote.outputs == [pool.query_exact_tokens_join([0, amount])[0] for amount in [ONE, 100 * ONE]]
+
+    with pytest.raises(ValueError):
+        quote_exact_tokens_joins(pool, [[ONE]])
+
+
+def test_batch_quotes_of_numpy_arrays():
+    numpy = pytest.importorskip("numpy")
+    pool = make_pool()
+    bpt_amounts = numpy.array([ONE, 10 * ONE], dtype=object)
+    quote = quote_single_asset_exits(pool, bpt_amounts, exit_token_index=1)
+    assert isinstance(quote.outputs, numpy.ndarray) and quote.price_impacts.dtype == numpy.float64
+    assert quote.outputs.tolist() == [pool.query_single_asset_exit(bpt, 1)[1][1] for bpt in [ONE, 10 * ONE]]
+
+
+def fake_multicall_node(fake_rpc_node, pools: dict, block_number=17_000_000, decimals=None):
+    """A node answering the multicalls of the pool reads from the pools' StablePool and WeightedPool states.
+
+    When decimals (token -> decimals) is given the weighted pools have no getScalingFactors.
+    """
+    by_address = {balancer.pool_address(pool.pool_id).lower(): pool for pool in pools.values()}
+    reads = []
+
+    def read(target, data):
+        selector = data[:4]
+        if target == CrossChainAddr.BalancerProtocolFeesCollector.lower():
+            return encode(["uint256"], [ONE // 2])
+        if selector == balancer.GetPoolTokens.get_encoder().selector:
+            pool = pools["0x" + data[4:36].hex()]
+            return encode(["address[]", "uint256[]", "uint256"], [pool.tokens, pool.balances, block_number - 5])
+        if decimals and target not in by_address:
+            return encode(["uint8"], [decimals[Web3.to_checksum_address(target)]])
+        pool = by_address[target]
+        weighted = isinstance(pool, WeightedPool)
+        if selector == balancer.GetAmplificationParameter.get_encoder().selector and not weighted:
+            return encode(["uint256", "bool", "uint256"], [pool.amp, False, 1000])
+        if selector == balancer.GetNormalizedWeights.get_encoder().selector and weighted:
+            return encode(["uint256[]"], [pool.normalized_weights])
+        if selector == balancer.GetScalingFactors.get_encoder().selector and not (weighted and decimals):
+            return encode(["uint256[]"], [pool.scaling_factors])
+        if selector == balancer.GetSwapFeePercentage.get_encoder().selector:
+            return encode(["uint256"], [pool.swap_fee])
+        if selector == balancer.TotalSupply.get_encoder().selector:
+            return encode(["uint256"], [pool.total_supply])
+        if selector == balancer.GetActualSupply.get_encoder().selector and weighted and not decimals:
+            return encode(["uint256"], [pool.total_supply])
+        return None  # getLastInvariant reverts
+
+    def eth_call(params):
+        tx, block = params
+        data = bytes.fromhex(tx["data"][2:])
+        assert data[:4] == AGGREGATE3_SELECTOR
+        calls = decode(["(address,bool,bytes)[]"], data[4:])[0]
+        reads.append((int(block, 16), len(calls)))
+        results = [read(target, call_data) for target, _, call_data in calls]
+        return "0x" + encode(["(bool,bytes)[]"], [[(r is not None, r or b"") for r in results]]).hex()
+
+    node = fake_rpc_node({"eth_call": eth_call, "eth_chainId": hex(1), "eth_blockNumber": hex(block_number)})
+    return node, reads
+
+
+def test_pool_state_cache(fake_rpc_node):
+    other_id = "0x1e19cf2d73a72ef1332c882f20534b6519be0276000200000000000000000112"
+    pools = {pool_id: make_pool(), other_id: make_pool(pool_id=other_id, balances=[ONE, 2 * ONE],
+                                                      scaling_factors=[ONE, ONE])}
+    node, reads = fake_multicall_node(fake_rpc_node, pools)
+    cache = PoolStateCache(Web3(Web3.HTTPProvider(node.url)), max_block_age=2)
+
+    first, second = cache.get_many([pool_id, other_id])
+    assert reads == [(17_000_000, 19)]  # the protocol fee and 9 reads per pool in one multicall
+    assert first.block_number == 17_000_000 and first.protocol_swap_fee == ONE // 2
+    assert (first.tokens, first.balances, first.amp) == (tuple(pools[pool_id].tokens), pools[pool_id].balances, 50_000)
+    assert second.balances == (ONE, 2 * ONE) and second.last_invariant == 0
+    assert first.query_single_asset_exit(ONE, 1) == pools[pool_id].query_single_asset_exit(ONE, 1)
+
+    assert cache.get(pool_id, 17_000_000) is first
+    assert cache.get(pool_id.upper().replace("0X", "0x")) is first
+    assert len(reads) == 1
+    cache.get(pool_id, 17_000_001)
+    assert reads[-1] == (17_000_001, 10) and len(cache) == 3
+    cache.get(pool_id, 17_000_003)
+    assert len(cache) == 2  # the states of 17_000_000 are evicted
+
+    # The builders align the amounts to the pool tokens
+    m = first.custom_exit(avatar_address, {WETH: ONE}, max_slippage=0.01)
+    assert m.args.assets == [wstETH, WETH] and m.args.min_amounts_out == [0, ONE]
+    m = first.single_asset_exit(avatar_address, ONE, exit_token_index=ETHAddr.ZERO, max_slippage=0.01)
+    assert m.args.assets == [wstETH, ETHAddr.ZERO] and m.args.min_amounts_out[0] == 0
+    assert m.data == first.single_asset_exit(avatar_address, ONE, 1, 0.01, assets=[wstETH, ETHAddr.ZERO]).data
+    with pytest.raises(ValueError):
+        first.token_index(ETHAddr.DAI)
+
+
+def test_pool_state_cache_rejects_composable_stable_pools(fake_rpc_node):
+    # wstETH-rETH-sfrxETH, a ComposableStable pool with its own BPT among its tokens
+    composable_pid = "0x5aee1e99fe86960377de9f88689616916d5dcabe000000000000000000000467"
+    bpt = balancer.pool_address(composable_pid)
+    pools = {pool_id: make_pool(),
+             composable_pid: make_pool(pool_id=composable_pid, tokens=[bpt, wstETH, WETH],
+                                       balances=[2 ** 111, 1_000 * ONE, 1_000 * ONE], scaling_factors=[ONE] * 3)}
+    node, _ = fake_multicall_node(fake_rpc_node, pools)
+    cache = PoolStateCache(Web3(Web3.HTTPProvider(node.url)))
+    with pytest.raises(BalancerMathError, match="ComposableStable"):
+        cache.get(composable_pid)
+    assert isinstance(cache.get(pool_id), StablePool)
+
+
+BAL = "0xba100000625a3754423978a60c9317c58a424e3D"
+B_80BAL_20WETH_pid = "0x5c6ee304399dbdb9c8ef030ab642b10820db8f56000200000000000000000014"
+
+
+def make_weighted_pool(**kwargs):
+    state = dict(pool_id=B_80BAL_20WETH_pid, tokens=[BAL, WETH],
+                 balances=[8_000_000 * ONE + 123456789, 1_000 * ONE + 987654321], scaling_factors=[ONE, ONE],
+                 normalized_weights=[8 * 10 ** 17, 2 * 10 ** 17], swap_fee=10 ** 16, total_supply=100_000 * ONE,
+                 block_number=17658530)
+    state.update(kwargs)
+    return WeightedPool(**state)
+
+
+def test_log_exp_math():
+    for x, y in [(2 * ONE, ONE // 2), (ONE // 3, 4 * ONE // 10), (10 ** 24, 25 * 10 ** 16), (ONE + 10 ** 12, 5 * ONE)]:
+        assert math.isclose(log_exp_math.pow(x, y), (x / ONE) ** (y / ONE) * ONE, rel_tol=1e-14)
+    assert math.isclose(log_exp_math.exp(3 * ONE), math.exp(3) * ONE, rel_tol=1e-14)
+    assert math.isclose(log_exp_math.exp(-3 * ONE), math.exp(-3) * ONE, rel_tol=1e-14)
+    assert math.isclose(log_exp_math.ln(ONE // 7), math.log(1 / 7) * ONE, rel_tol=1e-14)
+    assert log_exp_math.pow(0, ONE) == 0 and log_exp_math.pow(ONE, 0) == ONE
+    # powDown and powUp bound the exact power
+    exact = 2 ** 0.5 * ONE
+    assert weighted_math.pow_down(2 * ONE, ONE // 2) < exact < weighted_math.pow_up(2 * ONE, ONE // 2)
+    assert weighted_math.pow_down(3 * ONE, 2 * ONE) == 9 * ONE
+
+
+def test_weighted_math():
+    weights, balances = [8 * 10 ** 17, 2 * 10 ** 17], [8_000 * ONE, 1_000 * ONE]
+    invariant = weighted_math.calculate_invariant(weights, balances)
+    assert math.isclose(invariant, 8_000 ** 0.8 * 1_000 ** 0.2 * ONE, rel_tol=1e-12)
+    # 1 WETH is worth 2 BAL at these balances and weights
+    out = weighted_math.calc_out_given_in(balances[1], weights[1], balances[0], weights[0], ONE // 100)
+    assert 0.0199 * ONE < out < 0.02 * ONE
+    back = weighted_math.calc_in_given_out(balances[1], weights[1], balances[0], weights[0], out)
+    # The error bound of pow_up is charged on both swaps, the round trip is a few wei per 10**9 short
+    assert ONE // 100 - 10 ** 8 < back <= ONE // 100
+    with pytest.raises(BalancerMathError, match="MAX_IN_RATIO"):
+        weighted_math.calc_out_given_in(balances[1], weights[1], balances[0], weights[0], 301 * ONE)
+
+
+def test_weighted_joins_and_exits():
+    pool = make_weighted_pool()
+    bpt_out, amounts_in = pool.query_exact_tokens_join([0, ONE])
+    assert amounts_in == [0, ONE]
+    # 1 WETH of a 20% weight, without the fees, is worth 20 BPT
+    assert 19 * ONE < bpt_out < 20 * ONE
+    _, [zero, amount_in] = pool.query_single_asset_join(bpt_out, join_token_index=1)
+    assert zero == 0 and ONE <= amount_in < ONE + 10 ** 15
+
+    _, amounts_out = pool.query_single_asset_exit(20 * ONE, exit_token_index=1)
+    assert amounts_out[0] == 0 and 0.98 * ONE < amounts_out[1] < ONE
+    bpt_in, _ = pool.query_custom_exit(amounts_out)
+    assert 20 * ONE <= bpt_in < 20 * ONE + 10 ** 15
+
+    _, amounts_out = pool.query_proportional_exit(100 * ONE)
+    assert amounts_out == [8_000 * ONE + 123456, ONE + 987654]
+    with pytest.raises(BalancerMathError, match="MIN_BPT_IN_FOR_TOKEN_OUT"):
+        pool.query_single_asset_exit(31_000 * ONE, exit_token_index=0)
+
+    # The first weighted pools pay the protocol fees in the token of the highest weight
+    with_fees = make_weighted_pool(last_invariant=pool.invariant * 999 // 1000, protocol_swap_fee=ONE // 2)
+    assert with_fees.upscaled_balances[0] < pool.upscaled_balances[0]
+    assert with_fees.upscaled_balances[1] == pool.upscaled_balances[1]
+
+    m = pool.single_asset_exit(avatar_address, 20 * ONE, exit_token_index=WETH, max_slippage=0.01)
+    assert isinstance(m, balancer.WeightedSingleAssetExit)
+    assert m.args.min_amounts_out == [0, min_limit(pool.query_single_asset_exit(20 * ONE, 1)[1][1], 0.01)]
+    assert isinstance(pool.exact_tokens_join(avatar_address, {WETH: ONE}, 0.01), balancer.WeightedExactTokensJoin)
+
+    quote = quote_single_asset_exits(pool, [0, ONE, 20 * ONE, 31_000 * ONE], exit_token_index=1)
+    assert quote.outputs[:3] == [pool.query_single_asset_exit(a, 1)[1][1] for a in [0, ONE, 20 * ONE]]
+    assert quote.outputs[3] is None
+    assert 0 < quote.price_impacts[1] < quote.price_impacts[2] < 0.02
+    quote = quote_single_token_joins(pool, [ONE, 10 * ONE], join_token_index=1)
+    assert quote.outputs == [pool.query_exact_tokens_join([0, a])[0] for a in [ONE, 10 * ONE]]
+
+
+def test_pool_state_cache_of_weighted_pools(fake_rpc_node):
+    pools = {pool_id: make_pool(), B_80BAL_20WETH_pid: make_weighted_pool()}
+    node, reads = fake_multicall_node(fake_rpc_node, pools)
+    stable, weighted = PoolStateCache(Web3(Web3.HTTPProvider(node.url))).get_many([pool_id, B_80BAL_20WETH_pid])
+    assert isinstance(stable, StablePool) and isinstance(weighted, WeightedPool)
+    assert not weighted.legacy  # it has getActualSupply
+    assert weighted.normalized_weights == (8 * 10 ** 17, 2 * 10 ** 17)
+    assert weighted.query_exact_tokens_join([0, ONE]) == pools[B_80BAL_20WETH_pid].query_exact_tokens_join([0, ONE])
+
+    # Without getScalingFactors the decimals of the tokens are read in a second multicall
+    pools = {B_80BAL_20WETH_pid: make_weighted_pool(scaling_factors=[ONE, 10 ** 30])}
+    node, reads = fake_multicall_node(fake_rpc_node, pools, decimals={BAL: 18, WETH: 6})
+    weighted = PoolStateCache(Web3(Web3.HTTPProvider(node.url))).get(B_80BAL_20WETH_pid)
+    assert reads == [(17_000_000, 10), (17_000_000, 2)]
+    assert weighted.scaling_factors == (ONE, 10 ** 30)
+    assert weighted.legacy
+
+
+def test_legacy_weighted_pools_always_use_log_exp_math():
+    x = 9 * 10 ** 17
+    assert weighted_math.pow_up(x, 4 * ONE) == fixed_point.mul_up(fixed_point.mul_up(x, x), fixed_point.mul_up(x, x))
+    raw = log_exp_math.pow(x, 4 * ONE)
+    assert weighted_math.pow_up(x, 4 * ONE, legacy=True) == raw + fixed_point.mul_up(raw, 10000) + 1
+    assert weighted_math.pow_down(x, ONE, legacy=True) < x == weighted_math.pow_down(x, ONE)
+
+    # BAL in for WETH out of the 80/20 pool has an exponent of 4, and of 1 in a 50/50 pool
+    pool, legacy = make_weighted_pool(), make_weighted_pool(legacy=True)
+    assert legacy.query_swap_given_in(0, 1, 1_000 * ONE) < pool.query_swap_given_in(0, 1, 1_000 * ONE)
+    assert make_weighted_pool(last_invariant=pool.invariant, protocol_swap_fee=ONE // 2).legacy
+    even = make_weighted_pool(normalized_weights=[ONE // 2, ONE // 2])
+    even_legacy = make_weighted_pool(normalized_weights=[ONE // 2, ONE // 2], legacy=True)
+    assert even_legacy.query_swap_given_in(1, 0, ONE) < even.query_swap_given_in(1, 0, ONE)
+
+
+def test_swaps():
+    pool = make_pool()
+    # The fee is taken from the amount in, wstETH is worth 1.13 WETH at its price rate
+    amount_out = pool.query_swap_given_in(0, 1, ONE)
+    assert 1.125 * ONE < amount_out < 1.13 * ONE
+    assert make_pool(swap_fee=0).query_swap_given_in(0, 1, ONE) > amount_out
+    # The swaps do not pay the due protocol fees
+    with_fees = make_pool(last_invariant=pool.invariant * 999 // 1000, last_invariant_amp=50_000,
+                          protocol_swap_fee=ONE // 2)
+    assert with_fees.query_swap_given_in(0, 1, ONE) == amount_out
+
+    weighted = make_weighted_pool()
+    amount_out = weighted.query_swap_given_in(1, 0, ONE // 100)
+    # 1 WETH is worth 2000 BAL in the 80/20 pool
+    assert 19.7 * ONE < amount_out < 0.99 * 20 * ONE
+    with pytest.raises(BalancerMathError, match="MAX_IN_RATIO"):
+        weighted.query_swap_given_in(1, 0, 400 * ONE)
+
+
+def test_route_search():
+    DAI = ETHAddr.DAI
+    BAL_DAI_pid = "0x" + "22" * 20 + "0002" + "00" * 9 + "01"
+    BAL_DAI = make_weighted_pool(pool_id=BAL_DAI_pid, tokens=[BAL, DAI], balances=[1_000_000 * ONE, 2_500_000 * ONE],
+                                 normalized_weights=[ONE // 2, ONE // 2])
+    graph = PoolGraph([make_pool(), make_weighted_pool(), BAL_DAI])
+
+    route = graph.find_route(wstETH, DAI, ONE)
+    assert route.pool_ids == [pool_id, B_80BAL_20WETH_pid, BAL_DAI_pid]
+    assert route.assets == [wstETH, WETH, BAL, DAI]
+    weth_out = make_pool().query_swap_given_in(0, 1, ONE)
+    bal_out = make_weighted_pool().query_swap_given_in(1, 0, weth_out)
+    assert route.amount_out == BAL_DAI.query_swap_given_in(0, 1, bal_out)
+    assert graph.find_route(wstETH, DAI, ONE, max_hops=2) is None
+    assert graph.find_route(DAI, ETHAddr.USDC, ONE) is None
+
+    # A direct pool giving more is preferred to the longer route
+    direct = make_weighted_pool(pool_id="0x" + "11" * 20 + "00" * 12, tokens=[wstETH, DAI],
+                                balances=[1_000 * ONE, 10_000_000 * ONE], normalized_weights=[ONE // 2, ONE // 2])
+    route = PoolGraph([make_pool(), make_weighted_pool(), BAL_DAI, direct]).find_route(wstETH.lower(), DAI, ONE)
+    assert route.pool_ids == [direct.pool_id]
+
+    route = graph.find_route(wstETH, DAI, ONE)
+    m = route.batch_swap(avatar_address, max_slippage=0.01, deadline=1_700_000_000)
+    assert m.args.kind == balancer.SwapKind.GIVEN_IN
+    assert m.args.swaps == [(pool_id, 0, 1, ONE, b""), (B_80BAL_20WETH_pid, 1, 2, 0, b""),
+                            (BAL_DAI_pid, 2, 3, 0, b"")]
+    assert m.args.limits == [ONE, 0, 0, -min_limit(route.amount_out, 0.01)]
+    assert m.value == 0 and m.target_address == CrossChainAddr.BalancerVault
+
+
+def test_route_search_skips_unsupported_pools(fake_rpc_node):
+    # A ComposableStable pool giving far more DAI is not an edge of the graph
+    composable_pid = "0x" + "33" * 20 + "0000" + "00" * 9 + "02"
+    composable = make_pool(pool_id=composable_pid, tokens=[balancer.pool_address(composable_pid), wstETH, ETHAddr.DAI],
+                           balances=[2 ** 111, ONE, 10_000_000 * ONE], scaling_factors=[ONE] * 3)
+    graph = PoolGraph([make_pool(), composable])
+    assert graph.pools == [make_pool()]
+    assert graph.find_route(wstETH, ETHAddr.DAI, ONE) is None
+
+    pools = {pool_id: make_pool(), composable_pid: composable}
+    node, _ = fake_multicall_node(fake_rpc_node, pools)
+    cache = PoolStateCache(Web3(Web3.HTTPProvider(node.url)))
+    graph = PoolGraph.from_cache(cache, [pool_id, composable_pid])
+    assert [pool.pool_id for pool in graph.pools] == [pool_id]
+    assert graph.find_route(wstETH, WETH, ONE).pool_ids == [pool_id]
+    with pytest.raises(BalancerMathError):
+        cache.get(composable_pid)
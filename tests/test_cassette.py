@@ -0,0 +1,70 @@
+import pytest
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+
+from roles_royce.cassette import CassetteMiss, CassetteProvider
+from roles_royce.constants import ETHAddr
+from roles_royce.rpc import batch_results
+from .utils import fake_rpc_node
+
+ACCOUNT = "0x0EFcCBb9E2C09Ea29551879bd9Da32362b32fc89"
+
+
+def test_record_and_replay(fake_rpc_node, tmp_path):
+    balances = iter([hex(10), hex(20)])
+    node = fake_rpc_node({
+        "eth_blockNumber": hex(17_000_000),
+        "eth_chainId": hex(1),
+        "eth_getBalance": lambda params: next(balances) if params[1] == "latest" else hex(5),
+        "eth_call": lambda params: {"error": {"code": 3, "message": "execution reverted"}},
+    })
+    path = str(tmp_path / "cassette.json.gz")
+    recorder = CassetteProvider(path, Web3.HTTPProvider(node.url), mode="record")
+    w3 = Web3(recorder)
+    assert w3.eth.block_number == 17_000_000
+    assert w3.eth.get_balance(ACCOUNT) == 10
+    assert w3.eth.get_balance(ACCOUNT) == 20
+    assert w3.eth.get_balance(ACCOUNT, block_identifier=16_000_000) == 5
+    with pytest.raises(ContractLogicError):
+        w3.eth.call({"to": ETHAddr.DAI, "data": "0x"})
+    recorder.save()
+    node.stop()
+    posts = len(node.posts)
+
+    w3 = Web3(CassetteProvider(path, mode="replay"))
+    assert w3.eth.block_number == 17_000_000
+    assert w3.eth.get_balance(ACCOUNT) == 10
+    assert w3.eth.get_balance(ACCOUNT) == 20
+    assert w3.eth.get_balance(ACCOUNT) == 20  # the last response is repeated
+    assert w3.eth.get_balance(ACCOUNT, block_identifier=16_000_000) == 5
+    with pytest.raises(ContractLogicError):
+        w3.eth.call({"to": ETHAddr.DAI, "data": "0x"})
+    assert batch_results(w3, [("eth_blockNumber", [])]) == [hex(17_000_000)]
+    with pytest.raises(CassetteMiss):
+        w3.eth.get_transaction_count(ACCOUNT)
+    assert len(node.posts) == posts
+
+
+def test_auto_records_the_missing_requests(fake_rpc_node, tmp_path):
+    node = fake_rpc_node({"eth_blockNumber": hex(1), "eth_chainId": hex(100)})
+    path = str(tmp_path / "cassette.json")
+    provider = CassetteProvider(path, Web3.HTTPProvider(node.url), mode="auto")
+    assert Web3(provider).eth.block_number == 1
+    provider.save()
+
+    provider = CassetteProvider(path, Web3.HTTPProvider(node.url), mode="auto")
+    w3 = Web3(provider)
+    assert w3.eth.block_number == 1
+    assert not provider.recorded
+    assert w3.eth.chain_id == 100
+    assert provider.recorded
+    provider.save()
+    assert node.posts == [["eth_blockNumber"], ["eth_chainId"]]
+
+    w3 = Web3(CassetteProvider(path, mode="replay"))
+    assert (w3.eth.block_number, w3.eth.chain_id) == (1, 100)
+
+
+def test_a_provider_is_needed_to_record(tmp_path):
+    with pytest.raises(ValueError):
+        CassetteProvider(str(tmp_path / "cassette.json"), mode="record")
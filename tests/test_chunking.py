@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+from web3 import Web3
+
+from roles_royce import Chain, Operation
+from roles_royce.chunking import GasCostModel, plan_chunks, multi_or_many
+from roles_royce.constants import ETHAddr
+from roles_royce.protocols.eth import aave_v2, lido
+from roles_royce.roles_modifier import RolesMod
+from roles_royce.utils import MULTISENDS, multi_or_one, unpack_multisend
+
+AVATAR = "0x0EFcCBb9E2C09Ea29551879bd9Da32362b32fc89"
+DEPOSIT_SELECTOR = aave_v2.DepositToken.get_encoder().selector
+WRAP_SELECTOR = lido.Wrap.get_encoder().selector
+
+
+def deposits(n):
+    return [aave_v2.DepositToken(asset=ETHAddr.DAI, amount=i + 1, avatar=AVATAR) for i in range(n)]
+
+
+def test_unpack_multisend():
+    txs = deposits(3) + [lido.Wrap(amount=10)]
+    multisend = multi_or_one(txs, Chain.ETHEREUM)
+    unpacked = unpack_multisend(multisend.data)
+    assert [tx.contract_address for tx in unpacked] == [tx.target_address for tx in txs]
+    assert [tx.data for tx in unpacked] == [tx.data_bytes for tx in txs]
+    assert all(tx.operation == Operation.CALL and tx.value == 0 for tx in unpacked)
+
+
+def test_observe():
+    model = GasCostModel(base_cost=50_000)
+    txs = deposits(2) + [lido.Wrap(amount=10)]
+    calldata = sum(model.cost_of(tx.data_bytes) - model.default_cost for tx in txs)
+    model.observe(txs, gas=50_000 + calldata + 3 * 100_000)
+    assert model.costs == {DEPOSIT_SELECTOR: 100_000, WRAP_SELECTOR: 100_000}
+
+    model.observe(txs[:1], gas=50_000 + model.cost_of(txs[0].data_bytes) - 100_000 + 200_000)
+    assert model.costs[DEPOSIT_SELECTOR] == 130_000
+
+
+def test_plan_chunks_gas_budget():
+    model = GasCostModel(base_cost=50_000)
+    model.costs[DEPOSIT_SELECTOR] = 100_000
+    txs = deposits(25)
+    chunks = plan_chunks(txs, model, max_gas=1_000_000, gas_margin=1)
+    assert [tx for chunk in chunks for tx in chunk] == txs
+    assert all(model.estimate(chunk) <= 1_000_000 for chunk in chunks)
+    assert len(chunks) == 3
+
+
+def test_plan_chunks_calldata_budget():
+    model = GasCostModel()
+    chunks = plan_chunks(deposits(10), model, max_gas=10 ** 9, max_calldata_size=1000)
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+
+
+def test_multi_or_many():
+    model = GasCostModel(base_cost=50_000)
+    model.costs[DEPOSIT_SELECTOR] = 100_000
+    txs = multi_or_many(deposits(10), Chain.ETHEREUM, model, max_gas=1_000_000)
+    assert all(tx.contract_address == MULTISENDS[Chain.ETHEREUM] for tx in txs)
+    assert [len(unpack_multisend(tx.data)) for tx in txs] == [6, 4]
+
+
+def test_roles_mod_feeds_gas_model():
+    model = GasCostModel(base_cost=50_000)
+    tx = multi_or_one(deposits(2), Chain.ETHEREUM)
+    roles = RolesMod(role=1, contract_address=ETHAddr.ZERO, account=AVATAR, web3=Web3(),
+                     operation=tx.operation, gas_model=model)
+    with patch("web3.contract.contract.ContractFunction.estimate_gas", return_value=400_000):
+        assert roles.estimate_gas(tx.contract_address, tx.data) == 400_000
+    assert DEPOSIT_SELECTOR in model.costs
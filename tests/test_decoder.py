@@ -0,0 +1,140 @@
+from roles_royce.constants import ETHAddr, Operation
+from roles_royce.generic_method import TxData
+from roles_royce.protocols.decoder import decode_calldata, decode_transactions, get_decoder
+from roles_royce.protocols.eth import aave_v2 as aave, aura, balancer, compound_v3
+from roles_royce.utils import MULTISENDS, pack_multisend
+from roles_royce.constants import Chain
+
+AVATAR = "0x0EFcCBb9E2C09Ea29551879bd9Da32362b32fc89"
+POOL_ID = "0x32296969ef14eb0c6d29669c550d4a0449130230000200000000000000000080"
+
+
+def assert_same_call(decoded, method):
+    assert type(decoded) is type(method)
+    assert decoded.data == method.data
+    assert decoded.target_address == method.target_address
+    assert decoded.avatar == method.avatar
+
+
+def test_decode_methods():
+    methods = [
+        aave.DepositToken(asset=ETHAddr.DAI, amount=123, avatar=AVATAR),
+        aave.ApproveForAaveLendingPoolV2(token=ETHAddr.DAI, amount=2 ** 256 - 1),
+        aave.ApproveForStkAAVE(amount=10),
+        aura.WithdrawAndUndwrapStakedBPT(reward_address=ETHAddr.USDC, amount=7),
+        balancer.SingleAssetExit(pool_id=POOL_ID, avatar=AVATAR, assets=[ETHAddr.wstETH, ETHAddr.WETH],
+                                 min_amounts_out=[1, 0], bpt_amount_in=10 ** 18, exit_token_index=0),
+        balancer.ProportionalExit(pool_id=POOL_ID, avatar=AVATAR, assets=[ETHAddr.wstETH, ETHAddr.WETH],
+                                  min_amounts_out=[1, 2], bpt_amount_in=10 ** 18),
+        balancer.ExactTokensJoin(pool_id=POOL_ID, avatar=AVATAR, assets=[ETHAddr.wstETH, ETHAddr.WETH],
+                                 amounts_in=[3, 4], min_bpt_out=5),
+        balancer.BatchSwap(avatar=AVATAR, kind=balancer.SwapKind.GIVEN_IN, swaps=[(POOL_ID, 0, 1, 6, b"")],
+                           assets=[ETHAddr.ZERO, ETHAddr.wstETH], limits=[6, -5], deadline=7),
+        compound_v3.SupplyETH(comet=compound_v3.Comet.cWETHv3, avatar=AVATAR, amount=8),
+    ]
+    for method in methods:
+        decoded = decode_calldata(method.data_bytes, to=method.target_address, value=method.value)
+        assert_same_call(decoded, method)
+        assert decoded.value == method.value
+
+
+def test_decoded_arguments():
+    method = aave.DepositToken(asset=ETHAddr.DAI, amount=123, avatar=AVATAR)
+    decoded = decode_calldata(method.data)
+    assert decoded.args.asset == ETHAddr.DAI
+    assert decoded.args.amount == 123
+    assert decoded.avatar == AVATAR
+
+    exit_ = balancer.CustomExit(pool_id=POOL_ID, avatar=AVATAR, assets=[ETHAddr.wstETH, ETHAddr.WETH],
+                                amounts_out=[1, 2], max_bpt_amount_in=3)
+    decoded = decode_calldata(exit_.data)
+    assert decoded.args.assets == [ETHAddr.wstETH, ETHAddr.WETH]
+    assert decoded.args.min_amounts_out == [1, 2]
+
+
+def test_same_selector_told_apart():
+    # approve(address,uint256) by the token (target) and the spender (fixed argument)
+    approve = aave.ApproveForStkABPT(amount=1)
+    assert type(decode_calldata(approve.data, to=ETHAddr.ABPT)) is aave.ApproveForStkABPT
+    assert type(decode_calldata(approve.data, to=ETHAddr.DAI)) is not aave.ApproveForStkABPT
+
+    # The same target and selector, told apart by the spender
+    assert type(decode_calldata(aave.ApproveForParaSwapRepay(token=ETHAddr.DAI, amount=1).data,
+                                to=ETHAddr.DAI)) is aave.ApproveForParaSwapRepay
+
+    # The exit kind in the user data
+    exit_ = balancer.ProportionalExitQueryExit(pool_id=POOL_ID, avatar=AVATAR, assets=[ETHAddr.WETH],
+                                               min_amounts_out=[0], bpt_amount_in=1)
+    assert type(decode_calldata(exit_.data)) is balancer.ProportionalExitQueryExit
+
+
+def test_weighted_exits():
+    # Kinds 1 and 2 of the weighted exits have the layouts of kinds 2 and 1 of the stable ones
+    assets = [ETHAddr.wstETH, ETHAddr.WETH]
+    exits = [
+        balancer.WeightedProportionalExit(pool_id=POOL_ID, avatar=AVATAR, assets=assets, min_amounts_out=[1, 2],
+                                          bpt_amount_in=10 ** 18),
+        balancer.WeightedCustomExit(pool_id=POOL_ID, avatar=AVATAR, assets=assets, amounts_out=[1, 2],
+                                    max_bpt_amount_in=3),
+        balancer.WeightedProportionalQueryExit(pool_id=POOL_ID, avatar=AVATAR, assets=assets, min_amounts_out=[1, 2],
+                                               bpt_amount_in=10 ** 18),
+        balancer.WeightedCustomQueryExit(pool_id=POOL_ID, avatar=AVATAR, assets=assets, amounts_out=[1, 2],
+                                         max_bpt_amount_in=3),
+    ]
+    for exit_ in exits:
+        assert_same_call(decode_calldata(exit_.data), exit_)
+
+    # The single asset exits and the joins are the same in both pools
+    assert balancer.WeightedSingleAssetExit is balancer.SingleAssetExit
+    assert balancer.WeightedExactTokensJoin is balancer.ExactTokensJoin
+    exit_ = balancer.WeightedSingleAssetExit(pool_id=POOL_ID, avatar=AVATAR, assets=assets, min_amounts_out=[1, 0],
+                                             bpt_amount_in=10 ** 18, exit_token_index=0)
+    assert_same_call(decode_calldata(exit_.data), exit_)
+
+    # A stable exit does not decode as the weighted exit of the same kind
+    exit_ = balancer.CustomExit(pool_id=POOL_ID, avatar=AVATAR, assets=assets, amounts_out=[1, 2],
+                                max_bpt_amount_in=3)
+    assert type(decode_calldata(exit_.data)) is balancer.CustomExit
+
+
+def test_ambiguous_and_unknown():
+    borrow = compound_v3.Borrow(comet=compound_v3.Comet.cUSDCv3, token=ETHAddr.USDC, amount=1)
+    candidates = get_decoder().candidates(borrow.data, to=borrow.target_address)
+    assert {type(c) for c in candidates} == {compound_v3.Borrow, compound_v3.Withdraw}
+    assert all(c.target_address == compound_v3.Comet.cUSDCv3.value for c in candidates)
+
+    assert decode_calldata("0x12345678" + "00" * 32) is None
+    assert decode_calldata(aave.DepositToken(asset=ETHAddr.DAI, amount=1, avatar=AVATAR).data[:40]) is None
+
+
+def test_avatar_must_match():
+    method = aave.DepositToken(asset=ETHAddr.DAI, amount=1, avatar=AVATAR)
+    assert decode_calldata(method.data, avatar=AVATAR) is not None
+    assert decode_calldata(method.data, avatar=ETHAddr.ZERO) is None
+
+
+def test_decode_multisend():
+    deposit = aave.DepositToken(asset=ETHAddr.DAI, amount=1, avatar=AVATAR)
+    approve = aave.ApproveForAaveLendingPoolV2(token=ETHAddr.DAI, amount=1)
+    unknown = TxData(contract_address=ETHAddr.USDC, data=b"\x12\x34\x56\x78", value=5)
+    inner = pack_multisend([TxData(contract_address=approve.target_address, data=approve.data_bytes), unknown])
+    outer = pack_multisend([TxData(contract_address=MULTISENDS[Chain.ETHEREUM], data=inner),
+                            TxData(contract_address=deposit.target_address, data=deposit.data)])
+
+    calls = decode_transactions(outer, to=MULTISENDS[Chain.ETHEREUM], operation=Operation.DELEGATE_CALL)
+    assert len(calls) == 3
+    assert_same_call(calls[0], approve)
+    assert calls[1] == TxData(contract_address=ETHAddr.USDC, data=b"\x12\x34\x56\x78", value=5)
+    assert_same_call(calls[2], deposit)
+
+    # Delegate calls are not calls to the protocol methods
+    [call] = decode_transactions(deposit.data, to=deposit.target_address, operation=Operation.DELEGATE_CALL)
+    assert isinstance(call, TxData) and call.operation == Operation.DELEGATE_CALL
+
+
+def test_static_arguments_decoded_as_eth_abi():
+    method = aave.DepositToken(asset=ETHAddr.DAI, amount=1, avatar=AVATAR)
+    data = bytearray(method.data_bytes)
+    data[4] = 1  # dirty padding of the asset address
+    assert decode_calldata(bytes(data)) is None
+    assert decode_calldata(method.data_bytes + bytes(32)).args.amount == 1
@@ -0,0 +1,16 @@
+import json
+
+import pytest
+
+from roles_royce import evm_utils
+
+
+def test_lazy_attributes():
+    from roles_royce.evm_utils import erc20_abi, roles_bytecode
+
+    assert json.loads(erc20_abi) == evm_utils.load_abi("erc20_abi")
+    assert evm_utils.load_abi("erc20_abi") is evm_utils.load_abi("erc20_abi")
+    assert roles_bytecode.startswith("6080604052")
+    assert "safe_abi" in dir(evm_utils)
+    with pytest.raises(AttributeError):
+        evm_utils.unknown_abi
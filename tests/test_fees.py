@@ -0,0 +1,84 @@
+from web3 import Web3
+
+from roles_royce.fees import FeeOracle, predict_base_fee
+from roles_royce.roles_modifier import RolesMod
+from .utils import fake_rpc_node
+
+FEE_HISTORY = {"oldestBlock": hex(99), "baseFeePerGas": [hex(1000), hex(1100), hex(1200)],
+               "gasUsedRatio": [0.9, 0.8], "reward": [[hex(0)], [hex(7)]]}
+
+
+def test_predict_base_fee():
+    assert predict_base_fee(1000, 15_000_000, 30_000_000) == 1000
+    assert predict_base_fee(1000, 30_000_000, 30_000_000) == 1125
+    assert predict_base_fee(1000, 0, 30_000_000) == 875
+    assert predict_base_fee(1000, 22_500_000, 30_000_000) == 1062
+    assert predict_base_fee(1, 15_000_001, 30_000_000) == 2
+    # exact where a float would round
+    assert predict_base_fee(10 ** 20 + 1, 30_000_000, 30_000_000) == 10 ** 20 + 1 + (10 ** 20 + 1) // 8
+
+
+def test_fees_from_history():
+    oracle = FeeOracle(Web3())
+    fees = oracle.update(FEE_HISTORY)
+    assert (fees.block_number, fees.base_fee, fees.next_base_fee, fees.priority_fee) == (100, 1100, 1200, 7)
+    assert oracle.cached() is fees
+    assert oracle.cached(100) is fees
+    assert oracle.cached(101) is None
+    # without the next block base fee it is predicted locally
+    fees = oracle.update(dict(FEE_HISTORY, baseFeePerGas=FEE_HISTORY["baseFeePerGas"][:2]))
+    assert fees.next_base_fee == predict_base_fee(1100, 24_000_000, 30_000_000) == 1182
+
+    # with a reported chain head the age does not matter, only the block
+    oracle.max_age = 0
+    assert oracle.cached() is None
+    oracle.new_block(100)
+    assert oracle.cached() is fees
+    oracle.new_block(101)
+    assert oracle.cached() is None
+    assert oracle.cached(100) is None
+
+
+def test_fees_requests(fake_rpc_node):
+    head = {"block": 100}
+    node = fake_rpc_node({"eth_feeHistory": lambda params: dict(FEE_HISTORY, oldestBlock=hex(head["block"] - 1))})
+    oracle = FeeOracle(Web3(Web3.HTTPProvider(node.url)), max_age=60)
+    assert all(oracle.fees().block_number == 100 for _ in range(10))
+    assert node.posts == [["eth_feeHistory"]]
+
+    head["block"] = 101
+    assert oracle.fees().block_number == 100  # until the new block is reported
+    oracle.new_block(101)
+    assert all(oracle.fees().block_number == 101 for _ in range(10))
+    assert node.posts == [["eth_feeHistory"]] * 2
+
+    assert oracle.fees(block_number=101).block_number == 101
+    assert len(node.posts) == 2
+
+
+def test_fees_requested_once_per_block(fake_rpc_node):
+    usdt_approve = "0x095ea7b30000000000000000000000007f90122bf0700f9e7e1f688fe926940e8839f35300000000000000000000000000000000000000000000000000000000000003e8"
+    node = fake_rpc_node({
+        "eth_call": "0x" + "00" * 31 + "01",
+        "eth_feeHistory": FEE_HISTORY,
+        "eth_estimateGas": hex(100_000),
+        "eth_chainId": hex(100),
+        "eth_getTransactionCount": hex(0),
+        "eth_sendRawTransaction": "0x" + "ab" * 32,
+    })
+    w3 = Web3(Web3.HTTPProvider(node.url))
+    roles = RolesMod(role=2, contract_address="0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503", web3=w3,
+                     private_key='0xa60429f7d6b751ca19d52302826b4a611893fbb138f0059f354b79846f2ab125')
+    assert roles.fee_oracle is FeeOracle.for_web3(w3)
+    roles.fee_oracle.new_block(100)
+    for _ in range(10):
+        roles.execute("0x4ECaBa5870353805a9F068101A40E0f32ed605C6", usdt_approve)
+    assert sum(methods.count("eth_feeHistory") for methods in node.posts) == 1
+    assert roles.get_base_fee_per_gas() == 1100
+
+    # a new block is a new fee request
+    roles.fee_oracle.new_block(101)
+    node.results["eth_feeHistory"] = dict(FEE_HISTORY, oldestBlock=hex(100))
+    roles.execute("0x4ECaBa5870353805a9F068101A40E0f32ed605C6", usdt_approve)
+    assert sum(methods.count("eth_feeHistory") for methods in node.posts) == 2
+    assert roles.fee_oracle.cached().block_number == 101
@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+import pytest
+
+# Importing web3, eth_account and safe-eth-py takes about 2 seconds, building calldata with the
+# protocol classes takes about 0.2 seconds without them. The budget leaves room for slow machines.
+IMPORT_TIME_BUDGET = 1.0
+HEAVY_MODULES = ("web3", "eth_account", "gnosis")
+
+
+def import_time(module_name: str) -> tuple[float, set[str]]:
+    """Return the seconds `python -X importtime` reports for importing the module, and the imported modules."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+                            capture_output=True, text=True, check=True)
+    total = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.add(name.strip())
+        if not name[1:].startswith(" "):  # top level import, its time includes the nested ones
+            total += int(cumulative)
+    return total / 1_000_000, modules
+
+
+def test_protocols_import_without_heavy_dependencies():
+    seconds, modules = import_time("roles_royce.protocols.eth.aave_v2")
+    assert not {m.split(".")[0] for m in modules} & set(HEAVY_MODULES)
+    assert seconds < IMPORT_TIME_BUDGET
+
+
+def test_encode_without_heavy_dependencies():
+    code = ("import sys, time; from roles_royce.constants import ETHAddr; from roles_royce.protocols.eth import aave_v2; "
+            "start = time.perf_counter(); "
+            "aave_v2.DepositToken(asset=ETHAddr.DAI, amount=1, avatar=ETHAddr.ZERO).data; "
+            "print(time.perf_counter() - start); "
+            "print(sorted({m.split('.')[0] for m in sys.modules} & set(sys.argv[1:])))")
+    result = subprocess.run([sys.executable, "-c", code, *HEAVY_MODULES], capture_output=True, text=True, check=True)
+    seconds, imported = result.stdout.splitlines()
+    assert imported == "[]"
+    assert float(seconds) < IMPORT_TIME_BUDGET
+
+
+def test_lazy_package_attributes():
+    import roles_royce
+    from roles_royce import operations
+
+    assert roles_royce.send is operations.send
+    assert roles_royce.check_async is operations.check_async
+    assert "GenericMethodTransaction" in dir(roles_royce)
+    with pytest.raises(AttributeError):
+        roles_royce.not_an_attribute
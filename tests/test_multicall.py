@@ -0,0 +1,54 @@
+import pytest
+from eth_abi import decode, encode
+from web3 import Web3
+
+from roles_royce.constants import ETHAddr
+from roles_royce.protocols.base import Method
+from roles_royce.protocols.eth import aave_v2 as aave, balancer
+from roles_royce.protocols.multicall import AGGREGATE3_SELECTOR, MULTICALL3_ADDRESS, call_many
+from .utils import fake_rpc_node
+
+AVATAR = "0x0EFcCBb9E2C09Ea29551879bd9Da32362b32fc89"
+POOL_ID = "0x32296969ef14eb0c6d29669c550d4a0449130230000200000000000000000080"
+
+
+class Owner(Method):
+    name = "owner"
+    out_signature = [("owner", "address")]
+    target_address = ETHAddr.MakerProxy
+
+
+def test_call_many(fake_rpc_node):
+    methods = [
+        balancer.SingleAssetQueryExit(pool_id=POOL_ID, avatar=AVATAR, assets=[ETHAddr.wstETH, ETHAddr.WETH],
+                                      min_amounts_out=[0, 0], bpt_amount_in=10 ** 18, exit_token_index=0),
+        Owner(),
+        aave.ApproveForStkAAVE(amount=1),
+    ]
+    returns = [
+        (True, encode(["uint256", "uint256[]"], [10 ** 18, [5, 0]])),
+        (True, encode(["address"], [AVATAR.lower()])),
+        (False, b""),
+    ]
+    calls = []
+
+    def eth_call(params):
+        tx, block = params
+        assert tx["to"].lower() == MULTICALL3_ADDRESS.lower() and block == hex(17_000_000)
+        data = bytes.fromhex(tx["data"][2:])
+        assert data[:4] == AGGREGATE3_SELECTOR
+        calls.extend(decode(["(address,bool,bytes)[]"], data[4:])[0])
+        return "0x" + encode(["(bool,bytes)[]"], [returns]).hex()
+
+    node = fake_rpc_node({"eth_call": eth_call, "eth_chainId": hex(1)})
+    w3 = Web3(Web3.HTTPProvider(node.url))
+    results = call_many(w3, methods, block=17_000_000, allow_failure=[False, False, True])
+
+    assert results == [[10 ** 18, [5, 0]], AVATAR, None]
+    assert [(target, allowed, data) for target, allowed, data in calls] == [
+        (method.target_address.lower(), allowed, method.data_bytes)
+        for method, allowed in zip(methods, [False, False, True])]
+    assert sum(methods.count("eth_call") for methods in node.posts) == 1
+    assert call_many(w3, []) == []
+    with pytest.raises(ValueError):
+        call_many(w3, methods, allow_failure=[True])
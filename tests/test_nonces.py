@@ -0,0 +1,86 @@
+from web3 import Web3
+
+from roles_royce.nonces import NonceManager
+from roles_royce.roles_modifier import RolesMod
+from .utils import fake_rpc_node
+
+ACCOUNT = "0x7e19DE37A31E40eec58977CEA36ef7fB70e2c5CD"
+CHAIN_ID = 100
+
+
+def test_nonces_are_handed_out_locally(fake_rpc_node):
+    node = fake_rpc_node({"eth_getTransactionCount": hex(7)})
+    w3 = Web3(Web3.HTTPProvider(node.url))
+    manager = NonceManager()
+    assert [manager.reserve(w3, CHAIN_ID, ACCOUNT) for _ in range(3)] == [7, 8, 9]
+    assert manager.reserve(w3, 1, ACCOUNT) == 7
+    assert len(node.posts) == 2
+
+    manager.mark_sent(CHAIN_ID, ACCOUNT, 7, "0x07")
+    manager.release(CHAIN_ID, ACCOUNT, 8)
+    manager.mark_sent(CHAIN_ID, ACCOUNT, 9, "0x09")
+    assert manager.reserve(w3, CHAIN_ID, ACCOUNT) == 8
+    assert manager.reserve(w3, CHAIN_ID, ACCOUNT) == 10
+    assert manager.pending(CHAIN_ID, ACCOUNT) == {7: "0x07", 9: "0x09"}
+
+
+def test_resync_and_gaps(fake_rpc_node):
+    counts = {"pending": 3, "latest": 3}
+    node = fake_rpc_node({"eth_getTransactionCount": lambda params: hex(counts[params[1]])})
+    w3 = Web3(Web3.HTTPProvider(node.url))
+    manager = NonceManager()
+    nonces = [manager.reserve(w3, CHAIN_ID, ACCOUNT) for _ in range(3)]
+    manager.mark_sent(CHAIN_ID, ACCOUNT, nonces[0], "0x")
+    manager.mark_sent(CHAIN_ID, ACCOUNT, nonces[1], "0x")
+    manager.release(CHAIN_ID, ACCOUNT, nonces[2])
+
+    # nonce 3 is mined, the tx with nonce 4 was dropped by the node and nonce 5 was never sent
+    counts.update(latest=4, pending=4)
+    assert manager.find_gaps(w3, CHAIN_ID, ACCOUNT) == [4, 5]
+    assert manager.pending(CHAIN_ID, ACCOUNT) == {}
+    assert manager.reserve(w3, CHAIN_ID, ACCOUNT) == 4
+    assert manager.reserve(w3, CHAIN_ID, ACCOUNT) == 5
+    assert manager.reserve(w3, CHAIN_ID, ACCOUNT) == 6
+
+    # another process used some nonces of the account
+    counts["pending"] = 10
+    manager.resync(w3, CHAIN_ID, ACCOUNT)
+    assert manager.reserve(w3, CHAIN_ID, ACCOUNT) == 10
+
+
+def test_roles_mod_retries_on_nonce_too_low(fake_rpc_node):
+    usdt_approve = "0x095ea7b30000000000000000000000007f90122bf0700f9e7e1f688fe926940e8839f35300000000000000000000000000000000000000000000000000000000000003e8"
+    counts = {"pending": 5}
+    sent = []
+
+    def send_raw_transaction(params):
+        sent.append(params[0])
+        if len(sent) == 1:
+            counts["pending"] = 6
+            return {"error": {"code": -32000, "message": "nonce too low"}}
+        return "0x" + "ab" * 32
+
+    node = fake_rpc_node({
+        "eth_call": "0x" + "00" * 31 + "01",
+        "eth_feeHistory": {"oldestBlock": hex(1), "baseFeePerGas": [hex(90), hex(100), hex(105)],
+                           "gasUsedRatio": [0.4, 0.7], "reward": [[hex(8)], [hex(12)]]},
+        "eth_estimateGas": hex(100_000),
+        "eth_chainId": hex(CHAIN_ID),
+        "eth_getTransactionCount": lambda params: hex(counts["pending"]),
+        "eth_sendRawTransaction": send_raw_transaction,
+    })
+    manager = NonceManager()
+    roles = RolesMod(role=2, contract_address="0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503",
+                     web3=Web3(Web3.HTTPProvider(node.url)), nonce_manager=manager, batch_preflight=True,
+                     private_key='0xa60429f7d6b751ca19d52302826b4a611893fbb138f0059f354b79846f2ab125')
+    tx_hash = roles.execute("0x4ECaBa5870353805a9F068101A40E0f32ed605C6", usdt_approve)
+    assert len(sent) == 2
+    assert manager.pending(CHAIN_ID, roles.account) == {6: tx_hash}
+    assert roles.execute("0x4ECaBa5870353805a9F068101A40E0f32ed605C6", usdt_approve) == tx_hash
+    assert manager.pending(CHAIN_ID, roles.account) == {6: tx_hash, 7: tx_hash}
+
+    # The chain id is not read again for the send, without batch_preflight too
+    assert sum(methods.count("eth_chainId") for methods in node.posts) == 1
+    roles.batch_preflight = False
+    roles.execute("0x4ECaBa5870353805a9F068101A40E0f32ed605C6", usdt_approve)
+    assert node.posts[-2:] == [["eth_estimateGas"], ["eth_sendRawTransaction"]]
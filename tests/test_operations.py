@@ -1,6 +1,8 @@
 from roles_royce import check, send, GenericMethodTransaction, Operation, Chain
 from roles_royce.constants import GCAddr
-from roles_royce.utils import multi_or_one, MULTISENDS
+from gnosis.safe.multi_send import MultiSendOperation, MultiSendTx
+from roles_royce.generic_method import TxData
+from roles_royce.utils import multi_or_one, pack_multisend, to_data_input, MultiSendOffline, MULTISENDS
 from .utils import web3_gnosis, web3_eth
 
 CURVE_USDC_USDT_REWARD_GAUGE = "0x7f90122BF0700F9E7e1F688fe926940E8839F353"
@@ -64,3 +66,52 @@ def test_check_multi(web3_gnosis):
     status = check(txs=[approve, add_liquidity], role=2, account=ACCOUNT, roles_mod_address=ROLES_MOD_ADDRESS,
                    web3=web3_gnosis, blockchain=Chain.GC, block=27586992)
     assert status
+
+
+def test_multi_or_one_as_bytes():
+    approve_bytes = GenericMethodTransaction(
+        function_name=approve.function_name,
+        function_args=approve.function_args,
+        contract_address=approve.contract_address,
+        contract_abi=approve.contract_abi,
+        as_bytes=True,
+    )
+    assert approve_bytes.data == bytes.fromhex(approve.data[2:])
+
+    tx = multi_or_one([approve], blockchain=Chain.GC, as_bytes=True)
+    assert tx.data == bytes.fromhex(approve.data[2:])
+    assert tx.operation == Operation.CALL
+
+    tx = multi_or_one([approve_bytes, add_liquidity], blockchain=Chain.GC, as_bytes=True)
+    assert tx.operation == Operation.DELEGATE_CALL
+    assert tx.contract_address == MULTISENDS[Chain.GC]
+    assert tx.data == bytes.fromhex(multi_or_one([approve, add_liquidity], blockchain=Chain.GC).data[2:])
+
+
+def test_generic_method_as_bytes_matches_web3():
+    abi = ('[{"type":"function","name":"swap","inputs":[{"name":"route","type":"tuple","components":['
+           '{"name":"pool","type":"bytes32"},{"name":"tokens","type":"address[]"}]},{"name":"data","type":"bytes"},'
+           '{"name":"memo","type":"string"}],"outputs":[]},'
+           '{"type":"function","name":"swap","inputs":[{"name":"amount","type":"uint256"}],"outputs":[]}]')
+    for function_args in ([("0x" + "ab" * 32, [CURVE_USDC_USDT_REWARD_GAUGE, GCAddr.USDT]), "0x0102", "memo"],
+                          [10 ** 18]):
+        tx = GenericMethodTransaction(function_name="swap", function_args=function_args, contract_abi=abi,
+                                      contract_address=GCAddr.USDT)
+        tx_bytes = GenericMethodTransaction(function_name="swap", function_args=function_args, contract_abi=abi,
+                                            contract_address=GCAddr.USDT, as_bytes=True)
+        assert tx_bytes.data == bytes.fromhex(tx.data[2:])
+
+
+def test_to_data_input_as_bytes():
+    data = to_data_input("approve", "(address,uint256)", [CURVE_USDC_USDT_REWARD_GAUGE, 1000])
+    assert to_data_input("approve", "(address,uint256)", [CURVE_USDC_USDT_REWARD_GAUGE, 1000], as_bytes=True) == \
+           bytes.fromhex(data[2:])
+
+
+def test_pack_multisend_matches_gnosis():
+    txs = [approve, add_liquidity,
+           TxData(contract_address=GCAddr.USDT, data="0x", value=10 ** 18),
+           TxData(contract_address=CURVE_USDC_USDT_REWARD_GAUGE, data=b"\x01\x02\x03", value=1)]
+    multisend_txs = [MultiSendTx(MultiSendOperation.CALL, tx.contract_address, tx.value, tx.data) for tx in txs]
+    expected = MultiSendOffline(address=MULTISENDS[Chain.GC], chain_id=Chain.GC.chain_id).build_tx_data(multisend_txs)
+    assert pack_multisend(txs) == bytes.fromhex(expected[2:])
@@ -0,0 +1,129 @@
+import json
+
+import pytest
+from web3 import Web3
+
+from roles_royce.constants import ETHAddr, Chain
+from roles_royce.evm_utils import roles_abi
+from roles_royce.generic_method import TxData
+from roles_royce.permissions import (Comparison, ExecutionOptions, ParameterType, PermissionDenied, RolesPermissions)
+from roles_royce.protocols.eth import aura, balancer
+from roles_royce.roles_modifier import Operation, RolesMod
+from roles_royce.utils import MULTISENDS, multi_or_one
+
+AVATAR = "0x0EFcCBb9E2C09Ea29551879bd9Da32362b32fc89"
+ACCOUNT = "0x7e19DE37A31E40eec58977CEA36ef7fB70e2c5CD"
+BPT = "0x32296969Ef14EB0c6d29669C550D4a0449130230"
+POOL_ID = "0x32296969ef14eb0c6d29669c550d4a0449130230000200000000000000000080"
+ROLES = Web3().eth.contract(abi=roles_abi)
+
+# From the presets of test_safe_and_roles.test_balancer_aura_withdraw: role 2 can approve the Aura booster
+# to spend the BPT and the Balancer vault to spend WETH, role 1 can deposit in Aura (any pool id)
+PRESETS = {"transactions": [
+    {"to": "0x1ffAdc16726dd4F91fF275b4bF50651801B06a86", "data": "0x5e826695000000000000000000000000000000000000000000000000000000000000000200000000000000000000000032296969ef14eb0c6d29669c550d4a0449130230", "value": "0"},
+    {"to": "0x1ffAdc16726dd4F91fF275b4bF50651801B06a86", "data": "0x33a0480c000000000000000000000000000000000000000000000000000000000000000200000000000000000000000032296969ef14eb0c6d29669c550d4a0449130230095ea7b30000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000001000000000000000000000000000000000000000000000000000000000000000140000000000000000000000000000000000000000000000000000000000000018000000000000000000000000000000000000000000000000000000000000001c00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000100000000000000000000000000000000000000000000000000000000000000010000000000000000000000000000000000000000000000000000000000000001000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000010000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000100000000000000000000000000000000000000000000000000000000000000200000000000000000000000000000000000000000000000000000000000000020000000000000000000000000a57b8d98dae62b26ec3bcc4a365338157060b234", "value": "0"},
+    {"to": "0x1ffAdc16726dd4F91fF275b4bF50651801B06a86", "data": "0x5e8266950000000000000000000000000000000000000000000000000000000000000001000000000000000000000000a57b8d98dae62b26ec3bcc4a365338157060b234", "value": "0"},
+    {"to": "0x1ffAdc16726dd4F91fF275b4bF50651801B06a86", "data": "0x33a0480c0000000000000000000000000000000000000000000000000000000000000001000000000000000000000000a57b8d98dae62b26ec3bcc4a365338157060b23443a0d0660000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000001000000000000000000000000000000000000000000000000000000000000000140000000000000000000000000000000000000000000000000000000000000018000000000000000000000000000000000000000000000000000000000000001c000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000001000000000000000000000000000000000000000000000000000000000000000100000000000000000000000000000000000000000000000000000000000000010000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000100000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000001000000000000000000000000000000000000000000000000000000000000002000000000000000000000000000000000000000000000000000000000000000200000000000000000000000000000000000000000000000000000000000000073", "value": "0"},
+    {"to": "0x1ffAdc16726dd4F91fF275b4bF50651801B06a86", "data": "0x5e8266950000000000000000000000000000000000000000000000000000000000000002000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2", "value": "0"},
+    {"to": "0x1ffAdc16726dd4F91fF275b4bF50651801B06a86", "data": "0x33a0480c0000000000000000000000000000000000000000000000000000000000000002000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2095ea7b30000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000001000000000000000000000000000000000000000000000000000000000000000140000000000000000000000000000000000000000000000000000000000000018000000000000000000000000000000000000000000000000000000000000001c00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000100000000000000000000000000000000000000000000000000000000000000010000000000000000000000000000000000000000000000000000000000000001000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000010000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000100000000000000000000000000000000000000000000000000000000000000200000000000000000000000000000000000000000000000000000000000000020000000000000000000000000ba12222222228d8ba445958a75a0704d566bf2c8", "value": "0"},
+]}
+
+
+def admin_call(fn_name, *args):
+    return ROLES.encodeABI(fn_name=fn_name, args=args)
+
+
+def test_presets():
+    permissions = RolesPermissions.from_presets(json.dumps(PRESETS))
+    approve_vault = balancer.ApproveForVault(token=ETHAddr.WETH, amount=10)
+    approve_booster = aura.ApproveForBooster(token=BPT, amount=10)
+    assert permissions.is_allowed(2, approve_vault.contract_address, approve_vault.data)
+    assert permissions.is_allowed(2, approve_booster.contract_address, approve_booster.data_bytes)
+    assert permissions.is_allowed(1, aura.DepositBPT(pool_id=115, amount=1).contract_address,
+                                  aura.DepositBPT(pool_id=115, amount=1).data)
+
+    def denied(role, method, **kwargs):
+        try:
+            permissions.check(role, method.contract_address, method.data, **kwargs)
+        except PermissionDenied as e:
+            return str(e)
+
+    assert denied(1, approve_vault) == "TargetAddressNotAllowed"
+    assert denied(2, balancer.ApproveForVault(token=BPT, amount=10)) == "ParameterNotAllowed"
+    assert denied(2, aura.ApproveForBooster(token=ETHAddr.WETH, amount=10)) == "ParameterNotAllowed"
+    assert denied(2, approve_vault, value=1) == "SendNotAllowed"
+    assert denied(2, approve_vault, operation=Operation.DELEGATE_CALL) == "DelegateCallNotAllowed"
+    with pytest.raises(PermissionDenied, match="FunctionNotAllowed"):
+        permissions.check(1, ETHAddr.AURABooster, approve_vault.data)
+
+
+def test_scoping_calls():
+    permissions = RolesPermissions()
+    permissions.apply(admin_call("scopeTarget", 1, ETHAddr.WETH))
+    approve = balancer.ApproveForVault(token=ETHAddr.WETH, amount=100)
+    assert not permissions.is_allowed(1, ETHAddr.WETH, approve.data)
+
+    permissions.apply(admin_call("scopeAllowFunction", 1, ETHAddr.WETH, approve.data_bytes[:4], ExecutionOptions.NONE))
+    assert permissions.is_allowed(1, ETHAddr.WETH, approve.data)
+
+    permissions.apply(admin_call("scopeParameter", 1, ETHAddr.WETH, approve.data_bytes[:4], 1,
+                                 ParameterType.STATIC, Comparison.LESS_THAN, (101).to_bytes(32, "big")))
+    assert permissions.is_allowed(1, ETHAddr.WETH, approve.data)
+    assert not permissions.is_allowed(1, ETHAddr.WETH, balancer.ApproveForVault(token=ETHAddr.WETH, amount=101).data)
+
+    permissions.apply(admin_call("unscopeParameter", 1, ETHAddr.WETH, approve.data_bytes[:4], 1))
+    assert permissions.is_allowed(1, ETHAddr.WETH, balancer.ApproveForVault(token=ETHAddr.WETH, amount=101).data)
+
+    # As packParameter, unscoping clears the wildcard and extends the length of the scope config
+    permissions.apply(admin_call("scopeAllowFunction", 1, ETHAddr.WETH, approve.data_bytes[:4], ExecutionOptions.NONE))
+    permissions.apply(admin_call("unscopeParameter", 1, ETHAddr.WETH, approve.data_bytes[:4], 2))
+    function = permissions.roles[1].targets[ETHAddr.WETH].functions[approve.data_bytes[:4]]
+    assert (function.wildcarded, function.length, function.parameters) == (False, 3, {})
+    assert permissions.is_allowed(1, ETHAddr.WETH, approve.data)
+    permissions.apply(admin_call("scopeRevokeFunction", 1, ETHAddr.WETH, approve.data_bytes[:4]))
+    assert not permissions.is_allowed(1, ETHAddr.WETH, approve.data)
+
+    # dynamic parameters are compared by their hash, here the assets of a Balancer exit
+    exit = balancer.ProportionalExit(pool_id=POOL_ID, avatar=AVATAR, assets=[ETHAddr.wstETH, ETHAddr.WETH],
+                                     min_amounts_out=[1, 2], bpt_amount_in=10)
+    permissions.apply(admin_call("allowTarget", 1, balancer.CrossChainAddr.BalancerVault, ExecutionOptions.SEND))
+    assert permissions.is_allowed(1, exit.contract_address, exit.data, value=1)
+    permissions.apply(admin_call("scopeTarget", 1, balancer.CrossChainAddr.BalancerVault))
+    permissions.apply(admin_call("scopeParameterAsOneOf", 1, balancer.CrossChainAddr.BalancerVault,
+                                 exit.data_bytes[:4], 0, ParameterType.STATIC,
+                                 [bytes.fromhex(POOL_ID[2:]), bytes(32)]))
+    assert permissions.is_allowed(1, exit.contract_address, exit.data)
+
+    # OneOf is only set with scopeParameterAsOneOf
+    with pytest.raises(ValueError, match="UnsuitableOneOfComparison"):
+        permissions.apply(admin_call("scopeFunction", 1, ETHAddr.WETH, approve.data_bytes[:4], [True, False],
+                                     [ParameterType.STATIC, ParameterType.STATIC], [Comparison.ONE_OF, 0],
+                                     [bytes(32), b""], ExecutionOptions.NONE))
+    with pytest.raises(ValueError, match="UnsuitableRelativeComparison"):
+        permissions.apply(admin_call("scopeParameter", 1, ETHAddr.WETH, approve.data_bytes[:4], 0,
+                                     ParameterType.DYNAMIC, Comparison.GREATER_THAN, b""))
+
+    permissions.apply(admin_call("assignRoles", ACCOUNT, [1], [True]))
+    assert permissions.is_allowed(1, exit.contract_address, exit.data, account=ACCOUNT)
+    assert not permissions.is_allowed(1, exit.contract_address, exit.data, account=AVATAR)
+
+
+def test_multisend_and_roles_mod_check():
+    permissions = RolesPermissions.from_presets(PRESETS, multisend=MULTISENDS[Chain.ETHEREUM])
+    approve_vault = balancer.ApproveForVault(token=ETHAddr.WETH, amount=10)
+    approve_booster = aura.ApproveForBooster(token=BPT, amount=10)
+    multisend = multi_or_one([approve_vault, approve_booster], Chain.ETHEREUM, as_bytes=True)
+    assert multisend.operation == Operation.DELEGATE_CALL
+    assert permissions.is_allowed(2, multisend.contract_address, multisend.data, operation=multisend.operation)
+    multisend = multi_or_one([approve_vault, aura.ApproveForBooster(token=ETHAddr.WETH, amount=10)], Chain.ETHEREUM)
+    assert not permissions.is_allowed(2, multisend.contract_address, multisend.data, operation=multisend.operation)
+    # Any call to the multisend is checked as the transactions it packs, whatever its selector
+    data = bytes.fromhex("12345678") + multi_or_one([approve_vault, approve_booster], Chain.ETHEREUM,
+                                                    as_bytes=True).data[4:]
+    assert permissions.is_allowed(2, multisend.contract_address, data, operation=Operation.DELEGATE_CALL)
+
+    # No RPC is made, the Web3 instance has no provider
+    roles = RolesMod(role=2, contract_address="0x1ffAdc16726dd4F91fF275b4bF50651801B06a86", web3=Web3(),
+                     account=ACCOUNT, permissions=permissions)
+    assert roles.check(approve_vault.contract_address, approve_vault.data)
+    assert not roles.check(BPT, balancer.ApproveForVault(token=BPT, amount=10).data)
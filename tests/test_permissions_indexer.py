@@ -0,0 +1,125 @@
+import json
+
+from eth_abi import encode
+from eth_utils import keccak
+from hexbytes import HexBytes
+from web3 import Web3
+
+from roles_royce.constants import ETHAddr
+from roles_royce.permissions import (Comparison, ExecutionOptions, FunctionScope, ParameterScope, ParameterType,
+                                    RolesPermissions, pack_scope_config)
+from roles_royce.permissions_indexer import PermissionsIndexer
+from roles_royce.protocols.eth import balancer
+from .utils import fake_rpc_node
+
+ROLES_MOD_ADDRESS = "0x1ffAdc16726dd4F91fF275b4bF50651801B06a86"
+ACCOUNT = "0x7e19DE37A31E40eec58977CEA36ef7fB70e2c5CD"
+APPROVE = bytes.fromhex("095ea7b3")
+SPENDER_SCOPE = ParameterScope(ParameterType.STATIC, Comparison.EQUAL_TO, [])
+AMOUNT_SCOPE = ParameterScope(ParameterType.STATIC, Comparison.LESS_THAN, [])
+APPROVE_CONFIG = pack_scope_config(FunctionScope(parameters={0: SPENDER_SCOPE, 1: AMOUNT_SCOPE}, length=2))
+
+
+def event_log(block, signature, types, args):
+    return {"address": ROLES_MOD_ADDRESS.lower(), "topics": ["0x" + keccak(text=signature).hex()],
+            "data": "0x" + encode(types, args).hex(), "blockNumber": hex(block), "logIndex": "0x0",
+            "transactionIndex": "0x0", "transactionHash": "0x" + "11" * 32, "blockHash": "0x" + "22" * 32,
+            "removed": False}
+
+
+LOGS = [
+    event_log(100, "AssignRoles(address,uint16[],bool[])", ["address", "uint16[]", "bool[]"], [ACCOUNT, [1], [True]]),
+    event_log(150, "ScopeTarget(uint16,address)", ["uint16", "address"], [1, ETHAddr.WETH]),
+    event_log(2_000, "ScopeFunction(uint16,address,bytes4,bool[],uint8[],uint8[],bytes[],uint8,uint256)",
+              ["uint16", "address", "bytes4", "bool[]", "uint8[]", "uint8[]", "bytes[]", "uint8", "uint256"],
+              [1, ETHAddr.WETH, APPROVE, [True, False], [0, 0], [0, 0],
+               [encode(["address"], [balancer.CrossChainAddr.BalancerVault]), b""], 0,
+               pack_scope_config(FunctionScope(parameters={0: SPENDER_SCOPE}, length=2))]),
+    event_log(2_500, "ScopeParameter(uint16,address,bytes4,uint256,uint8,uint8,bytes,uint256)",
+              ["uint16", "address", "bytes4", "uint256", "uint8", "uint8", "bytes", "uint256"],
+              [1, ETHAddr.WETH, APPROVE, 1, ParameterType.STATIC, Comparison.LESS_THAN, encode(["uint256"], [1000]),
+               APPROVE_CONFIG]),
+]
+
+
+def get_logs(params):
+    log_filter = params[0]
+    from_block, to_block = int(log_filter["fromBlock"], 16), int(log_filter["toBlock"], 16)
+    assert ROLES_MOD_ADDRESS in log_filter["address"]
+    return [log for log in LOGS if from_block <= int(log["blockNumber"], 16) <= to_block]
+
+
+def test_index_and_resume(fake_rpc_node):
+    head = {"block": 2_200}
+    node = fake_rpc_node({"eth_getLogs": get_logs, "eth_blockNumber": lambda params: hex(head["block"])})
+    w3 = Web3(Web3.HTTPProvider(node.url))
+    indexer = PermissionsIndexer(w3, ROLES_MOD_ADDRESS, from_block=100, block_range=1_000)
+    permissions = indexer.update()
+    assert indexer.last_block == 2_200
+    assert sum(methods.count("eth_getLogs") for methods in node.posts) == 3
+
+    approve = balancer.ApproveForVault(token=ETHAddr.WETH, amount=5000)
+    assert permissions.is_allowed(1, ETHAddr.WETH, approve.data, account=ACCOUNT)
+    assert not permissions.is_allowed(1, ETHAddr.WETH, approve.data, account=ROLES_MOD_ADDRESS)
+
+    snapshot = json.loads(json.dumps(indexer.snapshot()))
+    assert list(snapshot["permissions"]["roles"]["1"]["targets"][ETHAddr.WETH]["functions"]) == ["0x095ea7b3"]
+    node.posts.clear()
+    head["block"] = 2_600
+    indexer = PermissionsIndexer.from_snapshot(w3, snapshot)
+    permissions = indexer.update()
+    assert node.posts == [["eth_blockNumber"], ["eth_getLogs"]]
+    assert not permissions.is_allowed(1, ETHAddr.WETH, approve.data, account=ACCOUNT)
+    assert permissions.is_allowed(1, ETHAddr.WETH, balancer.ApproveForVault(token=ETHAddr.WETH, amount=999).data)
+
+
+def test_resulting_scope_config():
+    indexer = PermissionsIndexer(Web3(), ROLES_MOD_ADDRESS)
+
+    def apply_log(log):
+        # As web3 formats the logs of eth_getLogs
+        indexer.apply_log({**log, "topics": [HexBytes(topic) for topic in log["topics"]], "data": HexBytes(log["data"])})
+
+    for log in LOGS:
+        apply_log(log)
+    function = indexer.permissions.roles[1].targets[ETHAddr.WETH].functions[APPROVE]
+    assert pack_scope_config(function) == APPROVE_CONFIG
+
+    # The scope config of the event wins over the one the call would give
+    apply_log(event_log(
+        3_000, "ScopeFunctionExecutionOptions(uint16,address,bytes4,uint8,uint256)",
+        ["uint16", "address", "bytes4", "uint8", "uint256"],
+        [1, ETHAddr.WETH, APPROVE, ExecutionOptions.NONE,
+         pack_scope_config(FunctionScope(ExecutionOptions.SEND, parameters={1: AMOUNT_SCOPE}, length=2))]))
+    assert function.options == ExecutionOptions.SEND
+    assert list(function.parameters) == [1]
+    assert function.parameters[1].comp_values == [(1000).to_bytes(32, "big")]
+    approve = balancer.ApproveForVault(token=ETHAddr.WETH, amount=999)
+    assert indexer.permissions.is_allowed(1, ETHAddr.WETH, approve.data, value=1)
+
+    apply_log(event_log(3_100, "ScopeRevokeFunction(uint16,address,bytes4,uint256)",
+                        ["uint16", "address", "bytes4", "uint256"], [1, ETHAddr.WETH, APPROVE, 0]))
+    assert not indexer.permissions.is_allowed(1, ETHAddr.WETH, approve.data)
+
+
+def test_block_range_is_reduced_on_errors(fake_rpc_node):
+    def limited_get_logs(params):
+        if int(params[0]["toBlock"], 16) - int(params[0]["fromBlock"], 16) >= 500:
+            return {"error": {"code": -32005, "message": "query returned more than 10000 results"}}
+        return get_logs(params)
+
+    node = fake_rpc_node({"eth_getLogs": limited_get_logs})
+    indexer = PermissionsIndexer(Web3(Web3.HTTPProvider(node.url)), ROLES_MOD_ADDRESS, from_block=0, block_range=2_000)
+    indexer.update(to_block=2_999)
+    assert indexer.block_range == 500
+    assert ACCOUNT in indexer.permissions.roles[1].members
+
+
+def test_permissions_to_dict_roundtrip():
+    permissions = RolesPermissions(multisend="0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761")
+    permissions.apply_call("allowTarget", 3, ETHAddr.DAI, ExecutionOptions.BOTH)
+    permissions.apply_call("scopeTarget", 4, ETHAddr.WETH)
+    permissions.apply_call("scopeParameterAsOneOf", 4, ETHAddr.WETH, APPROVE, 0, ParameterType.STATIC,
+                           [bytes(32), b"\1" * 32])
+    data = json.loads(json.dumps(permissions.to_dict()))
+    assert RolesPermissions.from_dict(data).to_dict() == data
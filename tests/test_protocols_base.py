@@ -0,0 +1,159 @@
+import eth_abi
+import pytest
+from eth_abi.exceptions import EncodingError
+from eth_abi.grammar import TupleType, parse
+from eth_utils import keccak, to_checksum_address
+from web3 import Web3
+
+from roles_royce.constants import ETHAddr
+from roles_royce.protocols.eth import aave_v2 as aave, balancer, compound_v3, lido
+
+AVATAR = "0x0EFcCBb9E2C09Ea29551879bd9Da32362b32fc89"
+
+
+def web3_encode(method):
+    contract = Web3().eth.contract(address=None, abi=method.abi)
+    return contract.encodeABI(fn_name=method.name, args=method.args_list)
+
+
+def test_encoder_is_shared_by_instances():
+    m1 = aave.DepositToken(asset=ETHAddr.DAI, amount=1, avatar=AVATAR)
+    m2 = aave.DepositToken(asset=ETHAddr.USDC, amount=2, avatar=AVATAR)
+    assert m1.get_encoder() is m2.get_encoder()
+    assert m1.get_encoder() is not aave.WithdrawToken.get_encoder()
+    assert m1.get_encoder().selector == bytes.fromhex("e8eda9df")
+    assert m1.get_encoder().signature == "deposit(address,uint256,address,uint16)"
+
+
+def test_encoder_matches_web3():
+    methods = [
+        aave.DepositToken(asset=ETHAddr.DAI, amount=10 ** 18, avatar=AVATAR),
+        aave.ApproveForStkAAVE(amount=123),
+        aave.CooldownStkAAVE(),
+        lido.RequestWithdrawalsStETH(amounts=[1, 2, 3], avatar=AVATAR),
+        compound_v3.SupplyETH(comet=compound_v3.Comet.cWETHv3, avatar=AVATAR, amount=10),
+        balancer.ProportionalExit(pool_id="0x32296969ef14eb0c6d29669c550d4a0449130230000200000000000000000080",
+                                  avatar=AVATAR, assets=[ETHAddr.wstETH, ETHAddr.WETH],
+                                  min_amounts_out=[1, 2], bpt_amount_in=10),
+        balancer.BatchSwap(avatar=AVATAR, kind=balancer.SwapKind.GIVEN_IN,
+                           swaps=[("0x32296969ef14eb0c6d29669c550d4a0449130230000200000000000000000080", 0, 1, 10, b"")],
+                           assets=[ETHAddr.wstETH, ETHAddr.WETH], limits=[10, -9], deadline=1_700_000_000),
+    ]
+    for method in methods:
+        assert method.data == web3_encode(method)
+
+
+def test_registry():
+    from roles_royce.protocols.registry import METHODS
+
+    assert METHODS[aave.DepositToken] is aave.DepositToken.get_encoder()
+    assert balancer.SingleAssetQueryExit in METHODS
+    assert compound_v3._Invoke not in METHODS
+    for method_class, encoder in METHODS.items():
+        assert encoder.selector == keccak(text=encoder.signature)[:4]
+        assert len(encoder.types) == len(method_class.in_signature)
+
+    encoder = METHODS[balancer.SingleAssetExit]
+    assert encoder.types == ("bytes32", "address", "address", "(address[],uint256[],bytes,bool)")
+    assert encoder.selector.hex() == "8bdb3913"
+
+
+def test_encode_many():
+    amounts = [1, 10 ** 18, 2 ** 255]
+    calldata = aave.DepositToken.encode_many([{"asset": ETHAddr.DAI, "amount": amount} for amount in amounts],
+                                             avatar=AVATAR)
+    assert calldata == [bytes.fromhex(aave.DepositToken(asset=ETHAddr.DAI, amount=amount, avatar=AVATAR).data[2:])
+                        for amount in amounts]
+
+    pool_id = "0x32296969ef14eb0c6d29669c550d4a0449130230000200000000000000000080"
+    assets = [ETHAddr.wstETH, ETHAddr.WETH]
+    joins = [balancer.ExactTokensJoin(pool_id=pool_id, avatar=AVATAR, assets=assets, amounts_in=[amount, 1],
+                                      min_bpt_out=amount // 2) for amount in amounts]
+    calldata = balancer.ExactTokensJoin.encode_many([
+        {"pool_id": pool_id, "assets": assets, "max_amounts_in": [amount, 1],
+         "user_data": [balancer.StablePoolJoinKind.EXACT_TOKENS_IN_FOR_BPT_OUT, [amount, 1], amount // 2]}
+        for amount in amounts], avatar=AVATAR)
+    assert calldata == [bytes.fromhex(join.data[2:]) for join in joins]
+
+
+def test_encode_invalid_values():
+    from eth_abi.exceptions import EncodingError
+
+    with pytest.raises(EncodingError):
+        aave.DepositToken(asset=ETHAddr.DAI, amount=-1, avatar=AVATAR).data
+    with pytest.raises(EncodingError):
+        aave.Collateralize(asset=ETHAddr.DAI, use_as_collateral=1).data
+
+
+def representative_value(abi_type, edge: bool = False):
+    """A valid value of the parsed type: small values, or with edge the bounds and the lengths that
+    are not multiples of a word."""
+    if abi_type.is_array:
+        item_type = abi_type.item_type
+        length = abi_type.arrlist[-1][0] if abi_type.arrlist[-1] else (0 if edge else 2)
+        return [representative_value(item_type, edge) for _ in range(length)]
+    if isinstance(abi_type, TupleType):
+        return tuple(representative_value(c, edge) for c in abi_type.components)
+    if abi_type.base == "uint":
+        return 2 ** abi_type.sub - 1 if edge else 7
+    if abi_type.base == "int":
+        return -2 ** (abi_type.sub - 1) if edge else -7
+    if abi_type.base == "bool":
+        return edge
+    if abi_type.base == "address":
+        return to_checksum_address(("ff" if edge else "12") * 20)
+    if abi_type.base == "bytes":
+        if abi_type.sub:
+            return bytes(range(abi_type.sub))
+        return bytes(range(33)) if edge else b"\x01\x02"
+    if abi_type.base == "string":
+        return "é" * 17 if edge else "text"
+    raise NotImplementedError(abi_type.to_type_str())
+
+
+def invalid_value(abi_type):
+    """A value of the parsed type that can not be encoded."""
+    if abi_type.is_array:
+        if abi_type.arrlist[-1]:
+            return [representative_value(abi_type.item_type)] * (abi_type.arrlist[-1][0] + 1)
+        return [representative_value(abi_type.item_type), invalid_value(abi_type.item_type)]
+    if isinstance(abi_type, TupleType):
+        return (invalid_value(abi_type.components[0]),) + representative_value(abi_type)[1:]
+    if abi_type.base == "uint":
+        return 2 ** abi_type.sub
+    if abi_type.base == "int":
+        return 2 ** (abi_type.sub - 1)
+    if abi_type.base == "bool":
+        return 2
+    if abi_type.base == "address":
+        return b"\x12" * 19
+    if abi_type.base == "bytes":
+        return b"\x01" * (abi_type.sub + 1) if abi_type.sub else 1
+    raise NotImplementedError(abi_type.to_type_str())
+
+
+def test_registry_encoders_match_eth_abi():
+    from roles_royce.protocols.registry import METHODS
+
+    for method_class, encoder in METHODS.items():
+        types = [parse(t) for t in encoder.types]
+        for edge in (False, True):
+            values = [representative_value(t, edge) for t in types]
+            assert encoder.encode(values) == encoder.selector + eth_abi.encode(encoder.types, values), \
+                (method_class, values)
+        for i, abi_type in enumerate(types):
+            values = [representative_value(t) for t in types]
+            values[i] = invalid_value(abi_type)
+            with pytest.raises(EncodingError):
+                eth_abi.encode(encoder.types, values)
+            with pytest.raises(EncodingError):
+                encoder.encode(values)
+
+
+def test_bytes_given_as_hex_strings():
+    encoder = balancer.SingleAssetExit.get_encoder()
+    pool_id = bytes(range(32))
+    request = ([ETHAddr.WETH], [1], bytes(range(40)), False)
+    expected = encoder.encode([pool_id, AVATAR, AVATAR, request])
+    assert encoder.encode(["0x" + pool_id.hex(), AVATAR, AVATAR, request[:2] + ("0x" + request[2].hex(), False)]) \
+        == expected == encoder.selector + eth_abi.encode(encoder.types, [pool_id, AVATAR, AVATAR, request])
@@ -0,0 +1,85 @@
+from web3 import Web3
+
+from roles_royce.fees import FeeOracle
+from roles_royce.receipts import ReceiptTracker
+from .utils import fake_rpc_node
+
+HASHES = ["0x" + f"{i:02x}" * 32 for i in range(1, 4)]
+
+
+def receipt(tx_hash, block):
+    return {"transactionHash": tx_hash, "status": "0x1", "blockNumber": hex(block), "gasUsed": hex(21000), "logs": []}
+
+
+def test_receipts_are_fetched_once_per_block(fake_rpc_node):
+    chain = {"block": 10, "mined": {}}
+    node = fake_rpc_node({
+        "eth_blockNumber": lambda params: hex(chain["block"]),
+        "eth_getTransactionReceipt": lambda params: chain["mined"].get(params[0]),
+    })
+    tracker = ReceiptTracker(Web3(Web3.HTTPProvider(node.url)), poll_interval=0.01)
+    done = []
+    futures = [tracker.track(tx_hash, callback=done.append) for tx_hash in HASHES]
+    assert tracker.track(HASHES[0]) is futures[0]
+
+    assert tracker.poll() == 0
+    assert tracker.poll() == 0  # same block, no receipt requests
+    assert node.posts == [["eth_blockNumber"], ["eth_getTransactionReceipt"] * 3, ["eth_blockNumber"]]
+
+    chain["block"] = 11
+    chain["mined"][HASHES[1]] = receipt(HASHES[1], 11)
+    assert tracker.poll() == 1
+    assert futures[1].result().status == 1 and futures[1].result().blockNumber == 11
+    assert done == [futures[1]]
+    assert tracker.pending == [HASHES[0], HASHES[2]]
+
+    chain["block"] = 12
+    chain["mined"].update({HASHES[0]: receipt(HASHES[0], 12), HASHES[2]: receipt(HASHES[2], 12)})
+    receipts = tracker.wait(timeout=1)
+    assert set(receipts) == {HASHES[0], HASHES[2]}
+    assert len(done) == 3
+    assert node.posts[-1] == ["eth_getTransactionReceipt"] * 2
+
+
+def test_background_tracking(fake_rpc_node):
+    node = fake_rpc_node({
+        "eth_blockNumber": hex(5),
+        "eth_getTransactionReceipt": lambda params: receipt(params[0], 5),
+    })
+    tracker = ReceiptTracker(Web3(Web3.HTTPProvider(node.url)), poll_interval=0.01)
+    tracker.start()
+    try:
+        future = tracker.track(HASHES[0])
+        # the block was seen before the tx was tracked, it is fetched on the next block
+        tracker.new_block(6)
+        assert future.result(timeout=1).transactionHash.hex() == HASHES[0]
+    finally:
+        tracker.stop()
+
+
+def test_receipt_resolved_by_a_concurrent_poll(fake_rpc_node):
+    nested = []
+
+    def get_receipt(params):
+        if tracker.last_block == 6:
+            # another thread polls the next block while this batch is being answered
+            tracker.last_block = None
+            nested.append(tracker.new_block(7))
+        return receipt(params[0], 6)
+
+    node = fake_rpc_node({"eth_getTransactionReceipt": get_receipt})
+    tracker = ReceiptTracker(Web3(Web3.HTTPProvider(node.url)))
+    futures = [tracker.track(tx_hash) for tx_hash in HASHES]
+    assert tracker.new_block(6) + nested[0] == len(HASHES)
+    assert all(future.result(timeout=0).blockNumber == 6 for future in futures)
+    assert tracker.pending == []
+
+
+def test_new_blocks_are_reported_to_the_fee_oracle(fake_rpc_node):
+    w3 = Web3(Web3.HTTPProvider(fake_rpc_node({}).url))
+    oracle = FeeOracle(w3)
+    ReceiptTracker(w3, fee_oracle=oracle).new_block(8)
+    assert oracle._head == 8
+    # without an oracle the tracker leaves the fee oracles alone
+    ReceiptTracker(w3).new_block(9)
+    assert FeeOracle.for_web3(w3)._head is None
@@ -1,7 +1,9 @@
 import pytest
 from unittest.mock import patch
-from roles_royce.roles_modifier import RolesMod
-from .utils import web3_gnosis
+from web3 import Web3
+from roles_royce.permissions import RolesPermissions
+from roles_royce.roles_modifier import RolesMod, TransactionWouldBeReverted
+from .utils import web3_gnosis, fake_rpc_node
 
 ROLE = 2
 ROLES_MOD_ADDRESS = "0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503"
@@ -41,3 +43,70 @@ def test_gas_limit_estimation(web3_gnosis):
     usdt_approve = "0x095ea7b30000000000000000000000007f90122bf0700f9e7e1f688fe926940e8839f35300000000000000000000000000000000000000000000000000000000000003e8"
     roles = RolesModTester(role=ROLE, contract_address="0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503", web3=web3_gnosis, account=ACCOUNT)
     assert roles.estimate_gas(contract_address=USDT, data=usdt_approve, block=TEST_BLOCK) == 101887
+
+
+def test_exec_transaction_data_as_bytes():
+    usdt_approve = "0x095ea7b30000000000000000000000007f90122bf0700f9e7e1f688fe926940e8839f35300000000000000000000000000000000000000000000000000000000000003e8"
+    roles = RolesMod(role=ROLE, contract_address=ROLES_MOD_ADDRESS, web3=Web3(), account=ACCOUNT)
+    expected = roles._build_exec_transaction(USDT, usdt_approve)._encode_transaction_data()
+    data = bytes.fromhex(usdt_approve[2:])
+    assert roles._build_exec_transaction(USDT, data)._encode_transaction_data() == expected
+    assert roles._build_exec_transaction(USDT, memoryview(data))._encode_transaction_data() == expected
+    for calldata in (usdt_approve, data, memoryview(data)):
+        assert "0x" + roles._exec_transaction_data(USDT, calldata).hex() == expected
+
+
+def test_execute_with_batch_preflight(fake_rpc_node):
+    usdt_approve = "0x095ea7b30000000000000000000000007f90122bf0700f9e7e1f688fe926940e8839f35300000000000000000000000000000000000000000000000000000000000003e8"
+    node = fake_rpc_node({
+        "eth_call": "0x" + "00" * 31 + "01",
+        "eth_feeHistory": {"oldestBlock": hex(TEST_BLOCK - 1), "baseFeePerGas": [hex(90), hex(100), hex(105)],
+                           "gasUsedRatio": [0.4, 0.7], "reward": [[hex(8)], [hex(12)]]},
+        "eth_estimateGas": hex(100_000),
+        "eth_chainId": hex(0x64),
+        "eth_getTransactionCount": hex(42),
+        "eth_sendRawTransaction": "0x" + "ab" * 32,
+    })
+    roles = RolesModTester(role=ROLE, contract_address=ROLES_MOD_ADDRESS, web3=Web3(Web3.HTTPProvider(node.url)),
+                           private_key='0xa60429f7d6b751ca19d52302826b4a611893fbb138f0059f354b79846f2ab125',
+                           batch_preflight=True)
+    roles.execute(contract_address=USDT, data=usdt_approve)
+    assert node.posts == [["eth_call", "eth_feeHistory", "eth_estimateGas", "eth_chainId", "eth_getTransactionCount"]]
+    assert roles._tx['chainId'] == 0x64
+    assert roles._tx['gas'] == 140_000
+    assert roles._tx['nonce'] == 42
+    assert roles._tx['maxPriorityFeePerGas'] == 10
+    assert roles._tx['maxFeePerGas'] == 10 + 126
+
+    node.results["eth_call"] = {"error": {"code": 3, "message": "execution reverted"}}
+    with pytest.raises(TransactionWouldBeReverted):
+        roles.execute(contract_address=USDT, data=usdt_approve)
+
+
+def test_batch_preflight_checks_the_permissions_locally(fake_rpc_node):
+    usdt_approve = "0x095ea7b30000000000000000000000007f90122bf0700f9e7e1f688fe926940e8839f35300000000000000000000000000000000000000000000000000000000000003e8"
+    node = fake_rpc_node({
+        "eth_feeHistory": {"oldestBlock": hex(TEST_BLOCK - 1), "baseFeePerGas": [hex(90), hex(100), hex(105)],
+                           "gasUsedRatio": [0.4, 0.7], "reward": [[hex(8)], [hex(12)]]},
+        "eth_estimateGas": hex(100_000),
+        "eth_chainId": hex(0x64),
+        "eth_getTransactionCount": hex(42),
+    })
+    permissions = RolesPermissions()
+    permissions.apply_call("allowTarget", ROLE, USDT, 0)
+    roles = RolesModTester(role=ROLE, contract_address=ROLES_MOD_ADDRESS, web3=Web3(Web3.HTTPProvider(node.url)),
+                           private_key='0xa60429f7d6b751ca19d52302826b4a611893fbb138f0059f354b79846f2ab125',
+                           batch_preflight=True, permissions=permissions)
+    roles.execute(contract_address=USDT, data=usdt_approve)
+    assert node.posts == [["eth_feeHistory", "eth_estimateGas", "eth_chainId", "eth_getTransactionCount"]]
+
+    node.posts.clear()
+    with pytest.raises(TransactionWouldBeReverted):
+        roles.execute(contract_address=ROLES_MOD_ADDRESS, data=usdt_approve)
+    assert node.posts == []
+
+    # With confirm_check the allowed transactions are still confirmed with the eth_call
+    node.results["eth_call"] = "0x" + "00" * 31 + "01"
+    roles.confirm_check = True
+    roles.execute(contract_address=USDT, data=usdt_approve)
+    assert node.posts[-1][0] == "eth_call"
@@ -1,7 +1,7 @@
 import os
 from web3 import Web3
 from gnosis.safe import addresses, Safe, SafeOperation
-from gnosis.eth import EthereumNetwork, EthereumClient
+from gnosis.eth import EthereumNetwork
 from eth_account import Account
 
 from roles_royce.protocols.eth import balancer, aura
@@ -10,14 +10,15 @@ from roles_royce.evm_utils import roles_abi, roles_bytecode, dai_abi, erc20_abi
 from roles_royce.utils import MULTISENDS
 from roles_royce.constants import ETHAddr
 from roles_royce.generic_method import TxData
-from .utils import (local_node, local_node_reset, accounts, ETH_LOCAL_NODE_URL, hardhat_unlock_account, create_simple_safe,
+from .utils import (local_node, local_node_reset, accounts, hardhat_unlock_account, create_simple_safe,
                     get_balance, steal_token, SimpleSafe)
 from .roles import setup_common_roles, deploy_roles, apply_presets
+from .safe import ProviderEthereumClient
 
 
 def test_safe_and_roles(local_node):
     w3 = local_node
-    ethereum_client = EthereumClient(ETH_LOCAL_NODE_URL)
+    ethereum_client = ProviderEthereumClient(w3)
 
     # test accounts are generated using the Mnemonic: "test test test test test test test test test test test junk"
     test_account0_addr = "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266"
@@ -0,0 +1,82 @@
+from eth_abi import encode
+from web3 import Web3
+
+from roles_royce.constants import Chain, ETHAddr, Operation
+from roles_royce.generic_method import TxData
+from roles_royce.protocols.eth import aave_v2 as aave
+from roles_royce.scanner import EXEC_WITH_ROLE_SELECTOR, RolesScanner
+from roles_royce.utils import MULTISENDS, pack_multisend
+from .utils import fake_rpc_node
+
+ROLES_MOD = "0x1cFB0CD7B1111bf2054615C7C491a15C4A3303cc"
+AVATAR = "0x0EFcCBb9E2C09Ea29551879bd9Da32362b32fc89"
+SENDER = "0x7e19DE37A31E40eec58977CEA36ef7fB70e2c5CD"
+
+
+def exec_with_role(to, data, operation=Operation.CALL, role=1):
+    return "0x" + (EXEC_WITH_ROLE_SELECTOR + encode(["address", "uint256", "bytes", "uint8", "uint16", "bool"],
+                                                    [to, 0, data, operation, role, True])).hex()
+
+
+def tx(block, index, to, data):
+    return {"hash": "0x" + f"{block:02x}{index:02x}" * 16, "blockNumber": hex(block), "transactionIndex": hex(index),
+            "from": SENDER.lower(), "to": to.lower(), "input": data, "value": "0x0"}
+
+
+deposit = aave.DepositToken(asset=ETHAddr.DAI, amount=1, avatar=AVATAR)
+approve = aave.ApproveForAaveLendingPoolV2(token=ETHAddr.DAI, amount=1)
+multisend = pack_multisend([TxData(contract_address=approve.target_address, data=approve.data_bytes),
+                            TxData(contract_address=deposit.target_address, data=deposit.data_bytes)])
+
+BLOCKS = {
+    3: [tx(3, 0, ETHAddr.DAI, approve.data),
+        tx(3, 1, ROLES_MOD, exec_with_role(deposit.target_address, deposit.data_bytes))],
+    7: [tx(7, 0, ROLES_MOD, "0x12345678"),
+        tx(7, 1, ROLES_MOD, exec_with_role(MULTISENDS[Chain.ETHEREUM], multisend, Operation.DELEGATE_CALL, role=2))],
+}
+
+
+def start_node(fake_rpc_node):
+    return fake_rpc_node({
+        "eth_blockNumber": hex(10),
+        "eth_getBlockByNumber": lambda params: {"number": params[0],
+                                                "transactions": BLOCKS.get(int(params[0], 16), [])},
+        "eth_getTransactionReceipt": lambda params: {"transactionHash": params[0], "status": "0x1"},
+    })
+
+
+def test_scan(fake_rpc_node):
+    node = start_node(fake_rpc_node)
+    scanner = RolesScanner(Web3(Web3.HTTPProvider(node.url)), [ROLES_MOD], from_block=1,
+                           blocks_per_batch=4, max_workers=2)
+    executions = list(scanner.scan())
+
+    assert [(e.block_number, e.transaction_index, e.role) for e in executions] == [(3, 1, 1), (7, 1, 2)]
+    first, second = executions
+    assert first.sender == SENDER and first.roles_mod_address == ROLES_MOD and first.success
+    assert first.to == deposit.target_address and first.operation == Operation.CALL
+    assert [type(c) for c in first.calls] == [aave.DepositToken]
+    assert second.operation == Operation.DELEGATE_CALL
+    assert [type(c) for c in second.calls] == [aave.ApproveForAaveLendingPoolV2, aave.DepositToken]
+    assert second.calls[1].avatar == AVATAR
+
+    # 3 batches of blocks (1-4, 5-8, 9-10) and a batch of receipts per batch with executions
+    assert sorted(len(post) for post in node.posts if post[0] == "eth_getBlockByNumber") == [2, 4, 4]
+    assert sorted(post for post in node.posts if post[0] == "eth_getTransactionReceipt") == \
+           [["eth_getTransactionReceipt"]] * 2
+    assert scanner.checkpoint()["next_block"] == 11
+
+
+def test_resume_from_checkpoint(fake_rpc_node):
+    node = start_node(fake_rpc_node)
+    w3 = Web3(Web3.HTTPProvider(node.url))
+    scanner = RolesScanner(w3, [ROLES_MOD], from_block=1, to_block=10, blocks_per_batch=2, max_workers=3)
+    executions = scanner.scan()
+    assert next(executions).block_number == 3
+    checkpoint = scanner.checkpoint()
+    executions.close()
+    assert checkpoint["next_block"] == 3
+
+    resumed = RolesScanner.from_checkpoint(w3, checkpoint, to_block=10)
+    assert [e.block_number for e in resumed.scan()] == [3, 7]
+    assert resumed.checkpoint()["next_block"] == 11
@@ -9,12 +9,15 @@ import pytest
 import socket
 import subprocess
 import shlex
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 
 from web3 import Web3, HTTPProvider
+from roles_royce.cassette import CassetteProvider
 from roles_royce.evm_utils import erc20_abi
 from .safe import SimpleSafe
 
@@ -28,6 +31,8 @@ LOCAL_NODE_DEFAULT_BLOCK = 17565000
 HARDHAT_STANDALONE = os.environ.get("RR_HARDHAT_STANDALONE", False)
 ETH_LOCAL_NODE_URL = f"http://127.0.0.1:{LOCAL_NODE_PORT}"
 DIR_OF_THIS_FILE = os.path.dirname(os.path.abspath(__file__))
+CASSETTE_MODE = os.environ.get("RR_CASSETTE_MODE", "auto")
+CASSETTES_DIR = os.path.join(DIR_OF_THIS_FILE, "cassettes")
 
 logger = logging.getLogger(__name__)
 
@@ -53,14 +58,97 @@ TEST_ACCOUNTS = gen_test_accounts()
 SCRAPE_ACCOUNT = Account.from_key("0xf214f2b2cd398c806f84e317254e0f0b801d0643303237d97a22a48e01628897")
 
 
+def cassette_path(name: str) -> str:
+    return os.path.join(CASSETTES_DIR, f"{name}.json.gz")
+
+
+def cassette_provider(request, name: str, make_provider):
+    """Wrap the provider in a CassetteProvider, in the RR_CASSETTE_MODE mode (auto by default).
+
+    The cassettes are stored in tests/cassettes. With auto, the requests in the cassette are
+    replayed and the rest are sent to the provider and added to the cassette. With replay,
+    make_provider is not called, so no node is needed. Record and replay the same selection of
+    tests, as the responses of the requests repeated at the latest block are replayed in order.
+    RR_CASSETTE_MODE=off uses the provider directly.
+    """
+    if CASSETTE_MODE == "off":
+        return make_provider()
+    provider = CassetteProvider(cassette_path(name), make_provider() if CASSETTE_MODE != "replay" else None,
+                                mode=CASSETTE_MODE)
+    if CASSETTE_MODE != "replay":
+        request.addfinalizer(lambda: provider.save() if provider.recorded else None)
+    return provider
+
+
 @pytest.fixture(scope="module")
-def web3_gnosis() -> Web3:
-    return Web3(HTTPProvider("https://rpc.ankr.com/gnosis"))
+def web3_gnosis(request) -> Web3:
+    return Web3(cassette_provider(request, f"{request.module.__name__.split('.')[-1]}_gnosis",
+                                  lambda: HTTPProvider("https://rpc.ankr.com/gnosis")))
 
 
 @pytest.fixture(scope="module")
-def web3_eth() -> Web3:
-    return Web3(HTTPProvider(REMOTE_NODE_URL))
+def web3_eth(request) -> Web3:
+    return Web3(cassette_provider(request, f"{request.module.__name__.split('.')[-1]}_eth",
+                                  lambda: HTTPProvider(REMOTE_NODE_URL)))
+
+
+class FakeRPCNode:
+    """A local JSON-RPC server answering from a dict of method -> result (or callable(params) -> result).
+
+    Every HTTP request is recorded in ``posts`` (a list of the JSON-RPC method names it carried),
+    so the tests can count the round-trips. An ``{"error": ...}`` dict as result is sent as an error.
+    """
+
+    def __init__(self, results: dict):
+        self.results = results
+        self.posts = []
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                requests = payload if isinstance(payload, list) else [payload]
+                node.posts.append([request["method"] for request in requests])
+                responses = [node._respond(request) for request in requests]
+                body = json.dumps(responses if isinstance(payload, list) else responses[0]).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def _respond(self, request):
+        result = self.results[request["method"]]
+        if callable(result):
+            result = result(request["params"])
+        if isinstance(result, dict) and set(result) == {"error"}:
+            return {"jsonrpc": "2.0", "id": request["id"], "error": result["error"]}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def fake_rpc_node():
+    nodes = []
+
+    def start(results: dict) -> FakeRPCNode:
+        node = FakeRPCNode(results)
+        nodes.append(node)
+        return node
+
+    yield start
+    for node in nodes:
+        node.stop()
 
 
 def wait_for_port(port, host='localhost', timeout=5.0):
@@ -116,6 +204,17 @@ def hardhat_reset_state(w3, url, block):
 
 @pytest.fixture(scope='session')
 def local_node(request):
+    # With a recorded cassette there is no node, the setup requests below are answered from it
+    if CASSETTE_MODE not in ("replay", "auto") or not os.path.exists(cassette_path("local_node")):
+        start_local_node(request)
+
+    w3 = Web3(cassette_provider(request, "local_node", lambda: HTTPProvider(f"http://localhost:{LOCAL_NODE_PORT}")))
+    hardhat_reset_state(w3, url=ETH_FORK_NODE_URL, block=LOCAL_NODE_DEFAULT_BLOCK)
+    assert w3.eth.block_number == LOCAL_NODE_DEFAULT_BLOCK
+    return w3
+
+
+def start_local_node(request):
     if not HARDHAT_STANDALONE:
         try:
             npm = shutil.which("npm")
@@ -142,11 +241,6 @@ def local_node(request):
 
     wait_for_port(LOCAL_NODE_PORT)
 
-    w3 = Web3(HTTPProvider(f"http://localhost:{LOCAL_NODE_PORT}"))
-    hardhat_reset_state(w3, url=ETH_FORK_NODE_URL, block=LOCAL_NODE_DEFAULT_BLOCK)
-    assert w3.eth.block_number == LOCAL_NODE_DEFAULT_BLOCK
-    return w3
-
 
 @pytest.fixture(autouse=True)
 def local_node_reset(local_node):
@@ -177,7 +271,7 @@ def get_balance(w3, token, address):
 def create_simple_safe(w3: Web3, owner: LocalAccount) -> SimpleSafe:
     """Create a Safe with one owner and 100 ETH in balance"""
 
-    safe = SimpleSafe.build(owner, ETH_LOCAL_NODE_URL)
+    safe = SimpleSafe.build(owner, w3)
     w3.eth.send_transaction({"to": safe.address, "value": Web3.to_wei(100, "ether"), "from": SCRAPE_ACCOUNT.address})
     hardhat_unlock_account(w3, safe.address)
     return safe